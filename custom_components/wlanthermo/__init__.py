@@ -3,16 +3,16 @@ Home Assistant integration for WLANThermo devices.
 Handles setup, teardown, and data coordination for the integration.
 """
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN, PLATFORMS
 from .api import WLANThermoApi
-from .data import BluetoothSettings, PushSettings, WlanthermoData, SettingsData
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from datetime import timedelta
-from typing import Any
+from .coordinator import WlanthermoCoordinator
+from .data import SettingsData
+from .runtime_config import RuntimeConfig
 import logging
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,21 +31,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 		True if setup was successful, False otherwise.
 	"""
 	hass.data.setdefault(DOMAIN, {})
-	# Retrieve connection and configuration options.
-	host = entry.options.get("host", entry.data.get("host"))
-	port = entry.options.get("port", entry.data.get("port", 80))
-	path_prefix = entry.options.get("path_prefix", entry.data.get("path_prefix", "/"))
-	scan_interval = entry.options.get("scan_interval", entry.data.get("scan_interval", 10))
-	api = WLANThermoApi(hass, host, port, path_prefix)
-	auth_required = entry.options.get("auth_required", entry.data.get("auth_required", False))
-	if auth_required:
-		api.set_auth(
-			entry.options.get("username", entry.data.get("username")),
-			entry.options.get("password", entry.data.get("password")),
-		)
-	api._consecutive_failures = 0
-	api._max_failures = 3  # Grace period for failures.
-	device_name = entry.data.get("device_name", "WLANThermo")
+	# Resolve the options once, entities read them from the coordinator.
+	config = RuntimeConfig.from_entry(entry)
+	api = WLANThermoApi(hass, config.host, config.port, config.path_prefix)
+	if config.auth_required:
+		api.set_auth(config.username, config.password)
+	device_name = config.device_name
 	device_info = DeviceInfo(
 		identifiers={(DOMAIN, entry.entry_id)},
 		name=device_name,
@@ -86,76 +77,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 			sw_version="unknown",
 		)
 
-	async def async_update_data() -> Any:
-		"""
-		Fetch both /data and /settings.
-		Raises UpdateFailed when device is offline.
-
-		Returns:
-			WlanthermoData object with latest data and settings.
-		"""
-		try:
-			raw_data = await api.get_data()
-			if not raw_data:
-				api._consecutive_failures += 1
-				_LOGGER.debug(
-					"WLANThermo: No /data (%s/%s)",
-					api._consecutive_failures,
-					api._max_failures,
-				)
-				# if api._consecutive_failures < api._max_failures:
-				# 	return coordinator.data
-				raise UpdateFailed("WLANThermo offline (no /data)")
-			api._consecutive_failures = 0
-			settings = None
-			push = None
-			bluetooth = None
-			try:
-				raw_settings = await api.get_settings()
-				if raw_settings:
-					settings = SettingsData.from_json(raw_settings)
-			except Exception:
-				_LOGGER.debug("WLANThermo: Device offline (no /settings)")
-			try:
-				raw_push = await api.get_push()
-				if raw_push:
-					push = PushSettings(raw_push)
-			except Exception:
-				_LOGGER.debug("WLANThermo: Device offline (no /push)")
-			try:
-				raw_bt = await api.get_bluetooth()
-				if raw_bt:
-					bluetooth = BluetoothSettings.from_json(raw_bt)
-			except Exception:
-				_LOGGER.debug("WLANThermo: Device offline (no /getbluetooth)")
-
-			return WlanthermoData(
-				raw=raw_data,
-				settings=settings,
-				push=push,
-				bluetooth=bluetooth,
-			)
-		except UpdateFailed:
-			raise
-		except Exception as exc:
-			api._consecutive_failures += 1
-			if api._consecutive_failures >= api._max_failures:
-				raise UpdateFailed(f"WLANThermo offline: {exc}")
-			return coordinator.data
 	# Set up the coordinator to periodically fetch data.
-	coordinator = DataUpdateCoordinator(
-		hass,
-		_LOGGER,
-		name="WLANThermoData",
-		update_method=async_update_data,
-		update_interval=timedelta(seconds=scan_interval),
-		always_update=True,
-	)
-	coordinator.api = api
-	await coordinator.async_config_entry_first_refresh()
+	coordinator = WlanthermoCoordinator(hass, api, config)
+	try:
+		await coordinator.async_config_entry_first_refresh()
+	except Exception:
+		await api.async_close()
+		raise
 	# Prepare entry_data early so listener can use it.
 	entry_data = {
-		"scan_interval": scan_interval,
 		"coordinator": coordinator,
 		"platforms_setup": set(),
 		"entities": {},
@@ -179,13 +109,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
 	entry.async_on_unload(
-		entry.add_update_listener(async_reload_entry)
+		entry.add_update_listener(async_update_options)
+	)
+
+	async def _async_close_session(event: Event) -> None:
+		# Entries are not unloaded on shutdown, the own session has to be closed here.
+		await api.async_close()
+
+	entry.async_on_unload(
+		hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_session)
 	)
 	return True
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
 	"""
-	Reload a WLANThermo integration entry.
+	Apply changed options of a WLANThermo integration entry.
+
+	Changes of the connection reload the entry, all other options replace the
+	coordinator's runtime config without reconnecting.
 
 	Args:
 		hass: Home Assistant instance.
@@ -193,13 +134,20 @@ async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 	Returns:
 		None.
 	"""
-	await hass.config_entries.async_reload(entry.entry_id)
+	entry_data = hass.data[DOMAIN].get(entry.entry_id)
+	config = RuntimeConfig.from_entry(entry)
+	if entry_data is None or entry_data["coordinator"].config.requires_reload(config):
+		await hass.config_entries.async_reload(entry.entry_id)
+		return
+	entry_data["coordinator"].async_set_config(config)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	"""
 	Unload a WLANThermo integration entry and all associated platforms.
 
-	Cleans up hass.data and returns True if all platforms unloaded successfully.
+	Sends queued channel changes, then closes the device connections and
+	cleans up hass.data if all platforms unloaded successfully. The cached
+	responses of the device are kept for the following setup of a reload.
 
 	Args:
 		hass: Home Assistant instance.
@@ -210,5 +158,25 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 	unload_ok = await hass.config_entries.async_unload_platforms(
 		entry, PLATFORMS
 	)
-	hass.data[DOMAIN].pop(entry.entry_id, None)
+	if unload_ok:
+		entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+		if entry_data:
+			# Flush queued writes first, they would reopen the closed session.
+			await entry_data["coordinator"].async_shutdown()
+			await entry_data["api"].async_close()
 	return unload_ok
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+	"""
+	Clean up after a WLANThermo integration entry was removed.
+
+	Drops the cached responses of the device, no setup will use them.
+
+	Args:
+		hass: Home Assistant instance.
+		entry: Config entry for the integration.
+	Returns:
+		None.
+	"""
+	config = RuntimeConfig.from_entry(entry)
+	WLANThermoApi(hass, config.host, config.port, config.path_prefix).clear_shared_cache()
@@ -4,13 +4,213 @@ Provides asynchronous methods to interact with the WLANThermo device's REST API.
 Handles data retrieval and configuration updates for channels and pitmasters.
 """
 
+import asyncio
 import async_timeout
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from aiohttp import BasicAuth
+from collections import deque
+from contextlib import asynccontextmanager
+from homeassistant.util.json import json_loads
+from aiohttp import BasicAuth, ClientSession, TCPConnector, TraceConfig
 import logging
+import time
+
+from .const import (
+    BREAKER_BACKOFF_MAX,
+    BREAKER_BACKOFF_MIN,
+    BREAKER_FAILURE_THRESHOLD,
+    CACHE_INVALIDATES,
+    CACHE_TTL,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    DATA_RESPONSE_CACHE,
+    DNS_CACHE_TTL,
+    LATENCY_EWMA_ALPHA,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_WINDOW,
+    MAX_CONCURRENT_REQUESTS,
+    REQUEST_TIMEOUT_FACTOR,
+    REQUEST_TIMEOUT_MAX,
+    REQUEST_TIMEOUT_MIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+
+class LatencyTracker:
+    """
+    Response time statistics of one endpoint.
+    Keeps a moving average and a window of recent samples, and derives the
+    request timeout from their p95.
+    """
+    __slots__ = ("ewma", "samples", "timeouts")
+
+    def __init__(self) -> None:
+        self.ewma: float | None = None
+        self.samples: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.timeouts = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Add a response time sample.
+        """
+        self.samples.append(seconds)
+        if self.ewma is None:
+            self.ewma = seconds
+        else:
+            self.ewma += LATENCY_EWMA_ALPHA * (seconds - self.ewma)
+
+    def record_timeout(self, timeout: float) -> None:
+        """
+        Count a timed out request.
+        The timeout is added as a sample, so a device that became slower raises
+        its timeout instead of timing out forever.
+        """
+        self.timeouts += 1
+        self.record(timeout)
+
+    @property
+    def p95(self) -> float | None:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def timeout(self) -> float:
+        """
+        Return the timeout for the next request in seconds.
+        """
+        if len(self.samples) < LATENCY_MIN_SAMPLES:
+            return REQUEST_TIMEOUT_MAX
+        return min(REQUEST_TIMEOUT_MAX, max(REQUEST_TIMEOUT_MIN, self.p95 * REQUEST_TIMEOUT_FACTOR))
+
+    def as_dict(self) -> dict:
+        p95 = self.p95
+        return {
+            "ewma_ms": round(self.ewma * 1000, 1) if self.ewma is not None else None,
+            "p95_ms": round(p95 * 1000, 1) if p95 is not None else None,
+            "samples": len(self.samples),
+            "timeouts": self.timeouts,
+            "timeout_s": round(self.timeout(), 2),
+        }
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the device is considered offline.
+    """
+
+
+class CircuitBreaker:
+    """
+    Reachability state of a device.
+    closed: requests are sent. BREAKER_FAILURE_THRESHOLD consecutive failures open the circuit.
+    open: requests fail immediately until the backoff has elapsed.
+    half_open: a single probe request is sent. Success closes the circuit,
+    failure opens it again with twice the backoff, up to BREAKER_BACKOFF_MAX.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    __slots__ = ("state", "failures", "backoff", "retry_at", "opened")
+
+    def __init__(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self.backoff = 0.0
+        self.retry_at = 0.0
+        self.opened = 0
+
+    def allow_request(self) -> bool:
+        """
+        Return whether a request may be sent now.
+        The first request after the backoff becomes the probe.
+        """
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() >= self.retry_at:
+            self.state = self.HALF_OPEN
+            return True
+        return False
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            _LOGGER.debug("WLANThermo: Device reachable again, circuit closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.backoff = 0.0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN:
+            self._open(min(self.backoff * 2, BREAKER_BACKOFF_MAX))
+        elif self.state == self.CLOSED and self.failures >= BREAKER_FAILURE_THRESHOLD:
+            self._open(BREAKER_BACKOFF_MIN)
+
+    def _open(self, backoff: float) -> None:
+        self.state = self.OPEN
+        self.backoff = backoff
+        self.retry_at = time.monotonic() + backoff
+        self.opened += 1
+        _LOGGER.debug("WLANThermo: Device unreachable, next probe in %ss", backoff)
+
+    @property
+    def retry_in(self) -> float | None:
+        """
+        Return the seconds until the next probe, or None while the circuit is closed.
+        """
+        if self.state == self.CLOSED:
+            return None
+        return max(0.0, self.retry_at - time.monotonic())
+
+    def as_dict(self) -> dict:
+        retry_in = self.retry_in
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "backoff_s": self.backoff,
+            "retry_in_s": round(retry_in, 1) if retry_in is not None else None,
+            "times_opened": self.opened,
+        }
+
+
+class ResponseCache:
+    """
+    GET responses of one device, shared by all API clients of its URL (the
+    config flow, setup and a reload). Entries are keyed by endpoint and
+    credentials, so no client is served a response fetched with other
+    credentials. Invalidations by writes apply to all of them.
+    """
+    __slots__ = ("entries", "invalidated_at")
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[str, BasicAuth | None], tuple[float, dict]] = {}
+        self.invalidated_at: dict[str, float] = {}
+
+    def get(self, endpoint: str, auth: BasicAuth | None) -> dict | None:
+        """
+        Return the fresh response of an endpoint, or None.
+        """
+        cached = self.entries.get((endpoint, auth))
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        return None
+
+    def store(self, endpoint: str, auth: BasicAuth | None, data: dict, ttl: float, started: float) -> None:
+        """
+        Store a response unless a write invalidated the endpoint after the
+        request started.
+        """
+        if self.invalidated_at.get(endpoint, 0.0) < started:
+            self.entries[(endpoint, auth)] = (time.monotonic() + ttl, data)
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Drop the responses of an endpoint for all credentials.
+        """
+        for key in [key for key in self.entries if key[0] == endpoint]:
+            del self.entries[key]
+        self.invalidated_at[endpoint] = time.monotonic()
+
+
 class WLANThermoApi:
     """
     Asynchronous API client for WLANThermo device.
@@ -30,7 +230,119 @@ class WLANThermoApi:
         self._path_prefix = path_prefix.rstrip("/")
         self._auth = None
         self._base_url = f"http://{host}:{port}{self._path_prefix}"
-        
+        # Caps parallel requests so the small device HTTP server is not flooded.
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # Dedicated keep-alive pool, created on first use inside the event loop.
+        self._session: ClientSession | None = None
+        self._connections_created = 0
+        self._connections_reused = 0
+        # GET requests in flight by endpoint, shared by concurrent callers.
+        self._inflight: dict[str, asyncio.Task] = {}
+        # All running GET tasks, including those detached by a cache invalidation.
+        self._fetch_tasks: set[asyncio.Task] = set()
+        # Kept in hass.data so the API clients of the same device share it.
+        self._cache: ResponseCache = hass.data.setdefault(
+            DATA_RESPONSE_CACHE, {}
+        ).setdefault(self._base_url, ResponseCache())
+        # GET endpoints outdated by writes since the coordinator last refreshed them.
+        self._stale_endpoints: set[str] = set()
+        self._latency: dict[str, LatencyTracker] = {}
+        self.breaker = CircuitBreaker()
+        # Last response per endpoint as (body, ETag, Last-Modified, parsed JSON).
+        self._responses: dict[str, tuple[bytes, str | None, str | None, dict]] = {}
+
+    def _get_session(self) -> ClientSession:
+        """
+        Return the device's own client session, creating it if needed.
+        The connector keeps idle connections open between polls so the device
+        does not need a new TCP handshake for every request.
+        """
+        if self._session is None or self._session.closed:
+            trace_config = TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_created)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+            connector = TCPConnector(
+                limit_per_host=MAX_CONCURRENT_REQUESTS,
+                keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+            self._session = ClientSession(connector=connector, trace_configs=[trace_config])
+        return self._session
+
+    async def _on_connection_created(self, session, trace_config_ctx, params) -> None:
+        self._connections_created += 1
+
+    async def _on_connection_reused(self, session, trace_config_ctx, params) -> None:
+        self._connections_reused += 1
+
+    @property
+    def latency_stats(self) -> dict:
+        """
+        Return response time statistics and current timeout by endpoint.
+        """
+        return {endpoint: tracker.as_dict() for endpoint, tracker in self._latency.items()}
+
+    @asynccontextmanager
+    async def _timed_request(self, endpoint: str):
+        """
+        Hold a request slot and apply the endpoint's adaptive timeout.
+        The time from acquiring the slot to leaving the block is recorded as
+        a latency sample, and the outcome is reported to the circuit breaker.
+        Any HTTP response counts as success, only errors and timeouts as failure.
+        Args:
+            endpoint: API endpoint string.
+        Raises:
+            CircuitOpenError: The device is offline and the next probe is not due yet.
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"{self._host} is offline")
+        tracker = self._latency.get(endpoint)
+        if tracker is None:
+            tracker = self._latency[endpoint] = LatencyTracker()
+        succeeded = False
+        try:
+            async with self._semaphore:
+                timeout = tracker.timeout()
+                started = time.monotonic()
+                try:
+                    async with async_timeout.timeout(timeout):
+                        yield
+                except asyncio.TimeoutError:
+                    tracker.record_timeout(timeout)
+                    raise
+                tracker.record(time.monotonic() - started)
+                succeeded = True
+        finally:
+            # A cancelled probe counts as failed so the circuit does not stay half-open.
+            if succeeded:
+                self.breaker.record_success()
+            else:
+                self.breaker.record_failure()
+
+    @property
+    def connection_stats(self) -> dict:
+        """
+        Return connection pool statistics of this device.
+        """
+        total = self._connections_created + self._connections_reused
+        return {
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_ratio": round(self._connections_reused / total, 3) if total else None,
+        }
+
+    async def async_close(self) -> None:
+        """
+        Cancel running GET requests and close the device's client session and
+        its pooled connections.
+        """
+        for task in self._fetch_tasks:
+            task.cancel()
+        self._fetch_tasks.clear()
+        self._inflight.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     def set_auth(self, username: str, password: str):
         if username and password:
@@ -38,23 +350,132 @@ class WLANThermoApi:
         else:
             self._auth = None
 
+    def invalidate_cache(self, *endpoints: str) -> None:
+        """
+        Drop cached responses so the next GET of the endpoints hits the device
+        and its body is decoded again, even if it did not change.
+        Args:
+            endpoints: GET endpoints to invalidate.
+        """
+        for endpoint in endpoints:
+            self._cache.invalidate(endpoint)
+            self._responses.pop(endpoint, None)
+            # Later callers must not join a request that started before the write.
+            self._inflight.pop(endpoint, None)
+
+    def clear_shared_cache(self) -> None:
+        """
+        Remove the response cache of this device from hass.data, e.g. when
+        its entry is removed.
+        """
+        caches = self._hass.data.get(DATA_RESPONSE_CACHE)
+        if caches is not None and caches.get(self._base_url) is self._cache:
+            del caches[self._base_url]
+
+    def pop_stale_endpoints(self) -> set[str]:
+        """
+        Return and reset the GET endpoints outdated by writes.
+        """
+        stale, self._stale_endpoints = self._stale_endpoints, set()
+        return stale
+
+    def mark_stale(self, endpoints: set[str]) -> None:
+        """
+        Mark GET endpoints as outdated again, e.g. after their refresh failed.
+        """
+        self._stale_endpoints.update(endpoints)
+
     async def _get(self, endpoint: str) -> dict | None:
         """
         Perform a GET request to the specified endpoint.
+        Endpoints listed in CACHE_TTL are served from the response cache while
+        it is fresh. Concurrent calls for the same endpoint share one request.
+        Either way callers receive a shared parsed response they must not modify.
+        Args:
+            endpoint: API endpoint string.
+        Returns:
+            Parsed JSON response or None if request fails.
+        """
+        cached = self._cache.get(endpoint, self._auth)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(endpoint)
+        if task is None:
+            # Tracked by Home Assistant and cancelled by async_close on unload.
+            task = self._hass.async_create_background_task(
+                self._fetch_cached(endpoint),
+                name=f"wlanthermo GET {self._host}{endpoint}",
+            )
+            self._inflight[endpoint] = task
+            self._fetch_tasks.add(task)
+            task.add_done_callback(lambda done: self._release_inflight(endpoint, done))
+        # A cancelled caller must not cancel the request the others are waiting for.
+        return await asyncio.shield(task)
+
+    def _release_inflight(self, endpoint: str, task: asyncio.Task) -> None:
+        """
+        Forget a finished request unless a newer one already replaced it.
+        """
+        self._fetch_tasks.discard(task)
+        if self._inflight.get(endpoint) is task:
+            del self._inflight[endpoint]
+
+    async def _fetch_cached(self, endpoint: str) -> dict | None:
+        """
+        Fetch an endpoint and store the response if the endpoint is cacheable.
+        A response is not stored if a write invalidated the endpoint meanwhile.
+        """
+        started = time.monotonic()
+        data = await self._fetch(endpoint)
+        ttl = CACHE_TTL.get(endpoint)
+        if data is not None and ttl:
+            self._cache.store(endpoint, self._auth, data, ttl, started)
+        return data
+
+    async def _fetch(self, endpoint: str) -> dict | None:
+        """
+        Send a GET request to the specified endpoint.
+        The request is conditional if the device sent an ETag or Last-Modified
+        header before. A 304 response or a body identical to the previous one
+        returns the previously parsed object without decoding.
         Args:
             endpoint: API endpoint string.
         Returns:
             Parsed JSON response or None if request fails.
         """
         url = f"{self._base_url}{endpoint}"
-        session = async_get_clientsession(self._hass)
+        session = self._get_session()
+        previous = self._responses.get(endpoint)
+        headers = {}
+        if previous is not None:
+            if previous[1]:
+                headers["If-None-Match"] = previous[1]
+            if previous[2]:
+                headers["If-Modified-Since"] = previous[2]
         try:
-            async with async_timeout.timeout(10):
-                async with session.get(url, allow_redirects=True, auth=self._auth) as resp:
+            async with self._timed_request(endpoint):
+                async with session.get(
+                    url,
+                    allow_redirects=True,
+                    auth=self._auth,
+                    headers=headers,
+                ) as resp:
+                    if resp.status == 304 and previous is not None:
+                        return previous[3]
                     if resp.status != 200:
                         return None
+                    body = await resp.read()
+                    if previous is not None and previous[0] == body:
+                        return previous[3]
                     try:
-                        data = await resp.json()
+                        # Decoding the raw bytes with orjson skips the str round trip of resp.json().
+                        data = json_loads(body)
+                        self._responses[endpoint] = (
+                            body,
+                            resp.headers.get("ETag"),
+                            resp.headers.get("Last-Modified"),
+                            data,
+                        )
                         return data
                     except Exception as json_err:
                         self._LOGGER.warning("JSON decode error for %s: %s", url, json_err)
@@ -118,10 +539,10 @@ class WLANThermoApi:
         Returns:
             Tuple of (status code, response text) or (None, None) if request fails.
         """
-        session = async_get_clientsession(self._hass)
+        session = self._get_session()
         url = f"{self._base_url}{endpoint}"
         try:
-            async with async_timeout.timeout(10):
+            async with self._timed_request(endpoint):
                 req = getattr(session, method.lower())
                 async with req(
                     url,
@@ -134,6 +555,12 @@ class WLANThermoApi:
         except Exception as err:
             self._LOGGER.debug("%s failed: %s", endpoint, err)
             return None, None
+        finally:
+            # Invalidated after the write, so GETs that overlapped it are not cached.
+            # Even a failed write may have reached the device.
+            outdated = CACHE_INVALIDATES.get(endpoint, ())
+            self.invalidate_cache(*outdated)
+            self._stale_endpoints.update(outdated)
 
     async def async_set_channel(self, channel_data: dict, method: str = "POST") -> bool:
         """
@@ -7,7 +7,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.components.button import ButtonEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.translation import async_get_translations
-from .const import DOMAIN
+from .const import DOMAIN, UPDATE_PUSH, UPDATE_SETTINGS
 import time
 import logging
 _LOGGER = logging.getLogger(__name__)
@@ -85,7 +85,7 @@ class WlanthermoTelegramTestButton(CoordinatorEntity, ButtonEntity):
     _attr_translation_key = "telegram_test"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._last_press: float = 0.0
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_telegram_test"
@@ -127,7 +127,7 @@ class WlanthermoPushoverTestButton(CoordinatorEntity, ButtonEntity):
     _attr_translation_key = "pushover_test"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._last_press: float = 0.0
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pushover_test"
@@ -167,14 +167,15 @@ class WlanthermoReloadIntegrationButton(CoordinatorEntity, ButtonEntity):
     _attr_translation_key = "reload_integration"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_reload_integration"
         )
         self._attr_device_info = entry_data["device_info"]
 
     async def async_press(self) -> None:
-        # Reload the integration
+        # Cached responses survive reloads; refetch those listing new Bluetooth probes.
+        self.coordinator.api.invalidate_cache("/settings", "/getbluetooth")
         await self.hass.config_entries.async_reload(
             self.coordinator.config_entry.entry_id
         )
@@ -190,7 +191,7 @@ class WlanthermoNewTokenButton(CoordinatorEntity, ButtonEntity):
     _attr_translation_key = "cloud_newtoken"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._last_press = 0.0
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_cloud_newtoken"
         self._attr_device_info = entry_data["device_info"]
@@ -204,8 +205,8 @@ class WlanthermoNewTokenButton(CoordinatorEntity, ButtonEntity):
         try:
             status, text = await self.coordinator.api._request("POST", "/newtoken")
             if status == 200 and text:
-                new_token = text.strip()
-                self.coordinator.data.settings.iot.CLtoken = new_token
+                # The parsed settings are shared with the response cache; the
+                # refresh fetches /settings again and delivers the new token.
                 await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.warning("Failed to generate new IoT token: %s - %s", status, text)
@@ -5,13 +5,21 @@ Handles user and options configuration steps for the Home Assistant integration.
 Guides the user through device connection, authentication, and device info retrieval.
 """
 from homeassistant import config_entries
-from .const import DOMAIN
+from .const import (
+    DEFAULT_CONFIG_SCAN_INTERVAL,
+    DEFAULT_TIME_LEFT_ENGINE,
+    DOMAIN,
+    TIME_LEFT_ENGINES,
+)
 from .api import WLANThermoApi
 import voluptuous as vol
 from homeassistant.core import callback
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.helpers.selector  import (
     BooleanSelector,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
 )
 
 CONF_PATH_PREFIX = "path_prefix"
@@ -122,6 +130,16 @@ def _base_schema(*, user_input: dict = None, defaults: dict = None, include_devi
                 description={"translation_key": "scan_interval_description"},
             )
         ] = int
+        schema[
+            vol.Required(
+                "config_scan_interval",
+                default=user_input.get(
+                    "config_scan_interval",
+                    defaults.get("config_scan_interval", DEFAULT_CONFIG_SCAN_INTERVAL),
+                ),
+                description={"translation_key": "config_scan_interval_description"},
+            )
+        ] = int
 
     schema.update({
         vol.Required(
@@ -130,6 +148,18 @@ def _base_schema(*, user_input: dict = None, defaults: dict = None, include_devi
             description={"translation_key": "show_inactive_unavailable_description"},
         ): BooleanSelector({}),
 
+        vol.Required(
+            "time_left_engine",
+            default=user_input.get("time_left_engine", defaults.get("time_left_engine", DEFAULT_TIME_LEFT_ENGINE)),
+            description={"translation_key": "time_left_engine_description"},
+        ): SelectSelector(
+            SelectSelectorConfig(
+                options=TIME_LEFT_ENGINES,
+                mode=SelectSelectorMode.DROPDOWN,
+                translation_key="time_left_engine",
+            )
+        ),
+
         vol.Required(
             "auth_required",
             default=user_input.get("auth_required", defaults.get("auth_required", False)),
@@ -209,6 +239,8 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             settings_json = await api.get_settings()
         except Exception:
             settings_json = None
+        finally:
+            await api.async_close()
         if not settings_json:
             return self.async_show_form(
                 step_id="user",
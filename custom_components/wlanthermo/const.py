@@ -11,6 +11,85 @@ PLATFORMS: list[str] = ["button", "light", "number", "select", "sensor", "switch
 DOMAIN = "wlanthermo"
 # Config entry key for API path prefix
 CONF_PATH_PREFIX = "path_prefix"
+# Default polling interval in seconds for /settings, /getpush and /getbluetooth
+DEFAULT_CONFIG_SCAN_INTERVAL = 300
+# Samples per device kept in the history buffer (one hour at the default polling interval)
+HISTORY_SIZE = 360
+# Engines of the channel time left sensor, see estimator.py
+TIME_LEFT_ENGINES = ["regression", "ewma", "kalman", "window"]
+DEFAULT_TIME_LEFT_ENGINE = "regression"
+# Window in seconds of the time left estimators (time constant for EWMA)
+TIME_LEFT_WINDOW = 300
+# Seconds of history averaged for the smoothed channel temperature
+SMOOTHED_TEMP_WINDOW = 60
+# Earliest plausible device time (2020-01-01), devices without NTP sync report times near 1970
+MIN_VALID_DEVICE_TIME = 1577836800
+# Maximum number of parallel HTTP requests to a single device
+MAX_CONCURRENT_REQUESTS = 2
+# Bounds in seconds of the adaptive request timeout, the upper bound is used until enough latency samples exist
+REQUEST_TIMEOUT_MIN = 2.0
+REQUEST_TIMEOUT_MAX = 10.0
+# Request timeout as a multiple of the endpoint's p95 latency
+REQUEST_TIMEOUT_FACTOR = 4.0
+# Latency samples kept per endpoint, and the minimum before timeouts adapt
+LATENCY_WINDOW = 50
+LATENCY_MIN_SAMPLES = 5
+# Smoothing factor of the latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+# Consecutive failed requests after which the circuit opens and the device is treated as offline
+BREAKER_FAILURE_THRESHOLD = 3
+# Seconds before the first probe of an offline device, doubled after every failed probe up to the maximum
+BREAKER_BACKOFF_MIN = 30
+BREAKER_BACKOFF_MAX = 600
+# Seconds an idle connection to the device is kept open (longer than the default polling interval)
+CONNECTION_KEEPALIVE_TIMEOUT = 30
+# Seconds a resolved device hostname is cached
+DNS_CACHE_TTL = 300
+# hass.data key of the GET response caches by device URL, shared by all API clients
+DATA_RESPONSE_CACHE = f"{DOMAIN}_response_cache"
+# Seconds a GET response is served from the cache; other endpoints are never cached
+CACHE_TTL: dict[str, float] = {
+    "/settings": 30,
+    "/getpush": 30,
+    "/getbluetooth": 30,
+    "/info": 300,
+}
+# GET endpoints that are outdated by a write to the given endpoint
+CACHE_INVALIDATES: dict[str, tuple[str, ...]] = {
+    "/setchannels": ("/data",),
+    "/setpitmaster": ("/data",),
+    "/setpid": ("/settings",),
+    "/setIoT": ("/settings",),
+    "/newtoken": ("/settings",),
+    "/setpush": ("/getpush",),
+    "/setbluetooth": ("/getbluetooth",),
+}
+
+# Configuration endpoints polled on the slower tier
+CONFIG_ENDPOINTS: tuple[str, ...] = ("/settings", "/getpush", "/getbluetooth")
+# Seconds the coordinator waits after a write before refreshing, so bursts of writes share one refresh
+REFRESH_AFTER_WRITE_DELAY = 1.0
+# Seconds channel field changes are collected before they are sent to the device
+CHANNEL_WRITE_DELAY = 0.5
+# Fields of a /setchannels payload
+CHANNEL_WRITE_FIELDS: tuple[str, ...] = ("number", "name", "typ", "temp", "min", "max", "alarm", "color")
+# Fields of a /setpitmaster payload
+PITMASTER_WRITE_FIELDS: tuple[str, ...] = ("id", "channel", "pid", "value", "set", "typ")
+
+# Update keys used by the coordinator to notify only entities whose data changed.
+# Single objects are keyed by (prefix, id), e.g. (UPDATE_CHANNEL, 3).
+UPDATE_CHANNEL = "channel"
+UPDATE_PITMASTER = "pitmaster"
+UPDATE_PID = "pid"
+UPDATE_METRICS = "metrics"                # Derived values of a channel, see metrics.py
+# Aggregate keys
+UPDATE_SYSTEM = "system"
+UPDATE_CHANNELS = "channels"              # Any channel changed
+UPDATE_PITMASTER_TYPES = "pitmaster_types"
+UPDATE_PID_PROFILES = "pid_profiles"      # Any PID profile changed
+UPDATE_SETTINGS = "settings"
+UPDATE_PUSH = "push"
+UPDATE_BLUETOOTH = "bluetooth"
 
 # Model list 
 MODELS: list[tuple[str, str]] = [
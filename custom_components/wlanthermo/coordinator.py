@@ -0,0 +1,599 @@
+"""
+Data update coordinator for WLANThermo.
+Polls /data on every scan interval and the configuration endpoints
+(/settings, /getpush, /getbluetooth) on a slower tier. After writes a single
+debounced refresh fetches only the configuration endpoints they outdated.
+The /data models are patched in place and only entities whose data changed
+since the last update are notified. Every new /data sample is also recorded
+in the device's history buffer, from which the derived channel values (rate,
+smoothed temperature, time left) are computed for all channels at once.
+While the device is offline the polling interval follows the API's
+circuit breaker backoff.
+"""
+
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import CircuitBreaker, WLANThermoApi
+from .const import (
+    BREAKER_FAILURE_THRESHOLD,
+    CHANNEL_WRITE_DELAY,
+    CHANNEL_WRITE_FIELDS,
+    CONFIG_ENDPOINTS,
+    HISTORY_SIZE,
+    PITMASTER_WRITE_FIELDS,
+    REFRESH_AFTER_WRITE_DELAY,
+    SMOOTHED_TEMP_WINDOW,
+    TIME_LEFT_WINDOW,
+    UPDATE_CHANNEL,
+    UPDATE_CHANNELS,
+    UPDATE_METRICS,
+    UPDATE_PID,
+    UPDATE_PID_PROFILES,
+    UPDATE_PITMASTER,
+)
+from .data import BluetoothSettings, PushSettings, SettingsData, WlanthermoData
+from .estimator import NOT_CONNECTED
+from .history import PITMASTER_SET, PITMASTER_VALUE, RSSI, TEMP, HistoryBuffer
+from .metrics import ChannelMetricsPipeline
+from .runtime_config import RuntimeConfig
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+import asyncio
+import logging
+import math
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _PendingWrite:
+    """
+    Field values written locally to one model object.
+    in_flight counts the writes not completed yet, completed is the write
+    generation at which the last of them completed.
+    """
+    __slots__ = ("fields", "in_flight", "completed")
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {}
+        self.in_flight = 0
+        self.completed = 0
+
+
+class WlanthermoCoordinator(DataUpdateCoordinator):
+    """
+    Coordinator with tiered polling and change-based dispatch.
+    /data is fetched on every tick, the configuration endpoints only when their
+    interval has elapsed or after a write requested a refresh.
+    Entities register with an update key (or a frozenset of keys) as coordinator
+    context and are only called back if one of their keys changed.
+    """
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: WLANThermoApi,
+        config: RuntimeConfig,
+    ) -> None:
+        """
+        Initialize the coordinator.
+        Args:
+            hass: Home Assistant instance.
+            api: API client of the device.
+            config: Runtime config of the entry.
+        Returns:
+            None.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="WLANThermoData",
+            update_interval=timedelta(seconds=config.scan_interval),
+            always_update=True,
+            # Writes request a refresh; one refresh runs after the burst instead of one per write.
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REFRESH_AFTER_WRITE_DELAY,
+                immediate=False,
+            ),
+        )
+        self.api = api
+        self.settings: SettingsData | None = getattr(api, "settings", None)
+        self.push: PushSettings | None = None
+        self.bluetooth: BluetoothSettings | None = None
+        # Resolved options, read by the entities and replaced as a whole on options updates.
+        self.config = config
+        self._config_refreshed_at: float | None = None
+        # Update keys changed by the last refresh, None notifies all listeners.
+        self._changes: set | None = None
+        # Values of every /data sample, shared by the entities of the device.
+        self.history = HistoryBuffer(HISTORY_SIZE)
+        # Derived channel values, computed from the history after each new sample.
+        self.metrics = ChannelMetricsPipeline(
+            config.time_left_engine, TIME_LEFT_WINDOW, SMOOTHED_TEMP_WINDOW
+        )
+        # Last raw /data and configuration responses with their parsed models.
+        self._raw_data: dict | None = None
+        self._parsed: dict[str, tuple[dict, Any]] = {}
+        # Local writes by the update key of the changed model object. A response
+        # requested before a write completed still holds the old values, so the
+        # local ones are applied over it. The device may accept a write without
+        # applying it, so the first response requested after the writes
+        # completed is applied and updates the entities even if it did not change.
+        self._pending_writes: dict[tuple, _PendingWrite] = {}
+        # Number of completed writes, compared with its value when a request started.
+        self._write_generation = 0
+        # Update keys of the PID profiles reconciled by the last /settings refresh.
+        self._reconciled_pids: set = set()
+        # Channel field changes by channel number, waiting to be sent.
+        self._pending_channel_writes: dict[int, dict[str, Any]] = {}
+        # Values before the first queued change per channel, restored if the write fails.
+        self._channel_rollback: dict[int, dict[str, Any]] = {}
+        self._channel_writer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=CHANNEL_WRITE_DELAY,
+            immediate=False,
+            function=self._async_write_channels,
+        )
+
+    def _config_endpoints_due(self, stale: set[str]) -> set[str]:
+        """
+        Return the configuration endpoints to fetch on this tick.
+        All of them when their interval has elapsed, otherwise only those
+        outdated by a write since the last refresh.
+        Args:
+            stale: GET endpoints outdated by writes.
+        """
+        if (
+            self._config_refreshed_at is None
+            or time.monotonic() - self._config_refreshed_at >= self.config.config_scan_interval
+        ):
+            return set(CONFIG_ENDPOINTS)
+        return stale.intersection(CONFIG_ENDPOINTS)
+
+    def _record_history(self, data: WlanthermoData) -> set:
+        """
+        Append the values of a /data sample to the history buffer and update
+        the derived channel values from it.
+        Samples are keyed by the device time; a repeated time is skipped and
+        a device clock that went back (e.g. after a restart) starts over.
+        Returns:
+            Update keys of the channels whose derived values changed.
+        """
+        history = self.history
+        timestamp = data.system.time
+        last_time = history.last_time
+        if last_time is not None and timestamp <= last_time:
+            if timestamp == last_time:
+                return set()
+            history.clear()
+        values = {
+            (TEMP, channel.number): math.nan if channel.temp == NOT_CONNECTED else channel.temp
+            for channel in data.channels
+        }
+        for pitmaster in data.pitmasters:
+            values[(PITMASTER_VALUE, pitmaster.id)] = pitmaster.value
+            values[(PITMASTER_SET, pitmaster.id)] = pitmaster.set
+        values[RSSI] = data.system.rssi
+        history.append(timestamp, values)
+        # The derived values change with every sample, also while the channel
+        # data itself stays the same (e.g. the rate during a stall).
+        return {(UPDATE_METRICS, number) for number in self.metrics.update(history, data)}
+
+    def _apply_backoff(self) -> None:
+        """
+        Poll at the scan interval while the circuit is closed, otherwise when
+        the next probe is due.
+        """
+        scan_interval = timedelta(seconds=self.config.scan_interval)
+        retry_in = self.api.breaker.retry_in
+        if retry_in is None:
+            self.update_interval = scan_interval
+        else:
+            # The scheduler may fire up to a second early, the probe must not be refused.
+            self.update_interval = max(scan_interval, timedelta(seconds=retry_in + 1))
+
+    @callback
+    def async_set_config(self, config: RuntimeConfig) -> None:
+        """
+        Replace the runtime config after an options update.
+        The intervals apply from the next poll, a new time left engine is fed
+        the recorded history so the estimates continue without a gap.
+        Args:
+            config: New runtime config of the entry.
+        Returns:
+            None.
+        """
+        previous = self.config
+        self.config = config
+        self._apply_backoff()
+        if config.time_left_engine != previous.time_left_engine:
+            self.metrics.set_engine(config.time_left_engine, self.history)
+        # Availability may depend on the options.
+        self._async_dispatch(None)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """
+        Notify the listeners affected by the last refresh.
+        """
+        changes, self._changes = self._changes, None
+        self._async_dispatch(changes)
+
+    @callback
+    def _async_dispatch(self, changes: set | None) -> None:
+        """
+        Call the listeners whose context intersects changes.
+        Listeners without context (e.g. entity discovery) are called on any change.
+        Args:
+            changes: Changed update keys, None calls all listeners.
+        """
+        if changes is None:
+            super().async_update_listeners()
+            return
+        if not changes:
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callback()
+            elif isinstance(context, frozenset):
+                if not changes.isdisjoint(context):
+                    update_callback()
+            elif context in changes:
+                update_callback()
+
+    @callback
+    def _async_apply(self, model: Any, fields: dict[str, Any], keys: tuple) -> None:
+        """
+        Write field values to a model object and update the entities of keys.
+        """
+        for name, value in fields.items():
+            setattr(model, name, value)
+        self._async_dispatch(set(keys))
+
+    def _begin_write(self, key: tuple, fields: dict[str, Any]) -> None:
+        """
+        Record field values applied locally before they are written.
+        """
+        pending = self._pending_writes.get(key)
+        if pending is None:
+            pending = self._pending_writes[key] = _PendingWrite()
+        pending.fields.update(fields)
+        pending.in_flight += 1
+
+    def _end_write(self, key: tuple, fields: dict[str, Any], success: bool) -> None:
+        """
+        Record a completed write. The fields of a failed write were restored
+        and are no longer applied over responses.
+        """
+        self._write_generation += 1
+        pending = self._pending_writes.get(key)
+        if pending is None:
+            return
+        pending.in_flight -= 1
+        pending.completed = self._write_generation
+        if not success:
+            for name in fields:
+                pending.fields.pop(name, None)
+            if not pending.fields and not pending.in_flight:
+                del self._pending_writes[key]
+
+    def _has_pending(self, *prefixes: str) -> bool:
+        return any(key[0] in prefixes for key in self._pending_writes)
+
+    def _reapply_pending(
+        self, lookups: dict[str, Callable[[int], Any]], generation: int
+    ) -> set:
+        """
+        Apply pending local values over the models read from a response.
+        Writes in flight or completed after the response was requested are
+        applied again. Entries whose writes completed before are dropped, the
+        response already reconciled them with the device.
+        Args:
+            lookups: Model lookup by id per update key prefix in the response.
+            generation: Write generation when the response was requested.
+        Returns:
+            Update keys of the dropped entries.
+        """
+        settled = set()
+        for key, pending in list(self._pending_writes.items()):
+            lookup = lookups.get(key[0])
+            if lookup is None:
+                continue
+            if pending.in_flight or pending.completed > generation:
+                model = lookup(key[1])
+                if model is not None:
+                    for name, value in pending.fields.items():
+                        setattr(model, name, value)
+            else:
+                del self._pending_writes[key]
+                settled.add(key)
+        return settled
+
+    async def _async_write_optimistic(
+        self,
+        model: Any,
+        fields: dict[str, Any],
+        keys: tuple,
+        write: Callable[[], Awaitable[bool]],
+    ) -> bool:
+        """
+        Apply field values locally, then write them to the device.
+        The entities show the new values right away. If the device rejects
+        the write the previous values are restored; either way the first
+        refresh requested after the write reconciles the model with the device.
+        Args:
+            model: Model object to change.
+            fields: Attribute values to apply.
+            keys: Update keys of the entities showing the model.
+            write: Coroutine function sending the change, True on success.
+        Returns:
+            True if the device accepted the write.
+        """
+        previous = {name: getattr(model, name) for name in fields}
+        self._async_apply(model, fields, keys)
+        self._begin_write(keys[0], fields)
+        success = await write()
+        self._end_write(keys[0], fields, success)
+        if not success:
+            _LOGGER.warning("WLANThermo: Write rejected, restoring %s", keys[0])
+            self._async_apply(model, previous, keys)
+        await self.async_request_refresh()
+        return success
+
+    async def async_set_pitmaster_fields(self, pitmaster_id: int, **fields: Any) -> bool:
+        """
+        Write field changes of a pitmaster, applying them locally first.
+        Args:
+            pitmaster_id: Pitmaster id.
+            **fields: Pitmaster fields to change, e.g. set=110.0.
+        Returns:
+            True if the device accepted the write.
+        """
+        pitmaster = self.data.get_pitmaster(pitmaster_id) if self.data else None
+        if pitmaster is None:
+            return False
+        payload = {key: getattr(pitmaster, key) for key in PITMASTER_WRITE_FIELDS}
+        payload.update(fields)
+        return await self._async_write_optimistic(
+            pitmaster,
+            fields,
+            ((UPDATE_PITMASTER, pitmaster_id),),
+            lambda: self.api.async_set_pitmaster(payload),
+        )
+
+    async def async_set_pid_fields(self, profile_id: int, **fields: Any) -> bool:
+        """
+        Write field changes of a PID profile, applying them locally first.
+        Args:
+            profile_id: PID profile id.
+            **fields: PIDConfig attributes to change, e.g. Kp=3.8.
+        Returns:
+            True if the device accepted the write.
+        """
+        settings = self.api.settings
+        profile = settings.get_pid(profile_id) if settings else None
+        if profile is None:
+            return False
+        return await self._async_write_optimistic(
+            profile,
+            fields,
+            ((UPDATE_PID, profile_id), UPDATE_PID_PROFILES),
+            # Built after the local change, /setpid expects the full profile.
+            lambda: self.api.async_set_pid_profile([profile.to_full_payload()]),
+        )
+
+    async def async_set_channel_fields(self, number: int, **fields: Any) -> None:
+        """
+        Queue field changes of a channel for writing, applying them locally first.
+        Changes arriving within CHANNEL_WRITE_DELAY are merged into one
+        /setchannels request per channel, followed by a single refresh.
+        Args:
+            number: Channel number.
+            **fields: Channel fields to change, e.g. min=80.0.
+        """
+        channel = self.data.get_channel(number) if self.data else None
+        if channel is not None:
+            rollback = self._channel_rollback.setdefault(number, {})
+            for name in fields:
+                rollback.setdefault(name, getattr(channel, name))
+            self._async_apply(channel, fields, ((UPDATE_CHANNEL, number), UPDATE_CHANNELS))
+        queued = self._pending_channel_writes.get(number)
+        if queued is None:
+            queued = self._pending_channel_writes[number] = {}
+            # One write per queued channel, changes merged into it are part of it.
+            self._begin_write((UPDATE_CHANNEL, number), fields)
+        else:
+            self._pending_writes[(UPDATE_CHANNEL, number)].fields.update(fields)
+        queued.update(fields)
+        await self._channel_writer.async_call()
+
+    async def _async_write_channels(self, refresh: bool = True) -> None:
+        """
+        Send the queued channel changes and refresh once afterwards.
+        Changes queued while sending are sent in the same run.
+        Args:
+            refresh: Whether to request a refresh after sending.
+        """
+        if not self._pending_channel_writes:
+            return
+        while self._pending_channel_writes:
+            pending, self._pending_channel_writes = self._pending_channel_writes, {}
+            for number, fields in pending.items():
+                rollback = self._channel_rollback.pop(number, {})
+                channel = self.data.get_channel(number) if self.data else None
+                if channel is None:
+                    _LOGGER.warning("WLANThermo: Channel %s not found, dropping update", number)
+                    self._end_write((UPDATE_CHANNEL, number), fields, False)
+                    continue
+                # /setchannels expects the full channel object.
+                payload = {key: getattr(channel, key) for key in CHANNEL_WRITE_FIELDS}
+                payload.update(fields)
+                success = await self.api.async_set_channel(payload)
+                self._end_write((UPDATE_CHANNEL, number), fields, success)
+                if not success:
+                    _LOGGER.warning("WLANThermo: Failed to update channel %s", number)
+                    self._async_apply(
+                        channel, rollback, ((UPDATE_CHANNEL, number), UPDATE_CHANNELS)
+                    )
+        if refresh:
+            await self.async_request_refresh()
+
+    async def async_shutdown(self) -> None:
+        """
+        Send queued channel changes before the coordinator shuts down.
+        """
+        self._channel_writer.async_shutdown()
+        if self._pending_channel_writes:
+            await self._async_write_channels(refresh=False)
+        await super().async_shutdown()
+
+    async def _async_fetch(
+        self,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[dict | None]],
+        parse: Callable[[dict], Any],
+    ) -> Any:
+        """
+        Fetch and parse a single configuration endpoint.
+        Failures are logged and isolated so they do not affect the other endpoints.
+        An unchanged response (the same object from the API) returns the
+        previously parsed model without parsing it again.
+        Args:
+            endpoint: Endpoint name used for logging.
+            fetch: API coroutine function returning the raw JSON.
+            parse: Callable turning the raw JSON into a model object.
+        Returns:
+            Parsed model object, or None if the endpoint failed.
+        """
+        try:
+            raw = await fetch()
+            if raw:
+                previous = self._parsed.get(endpoint)
+                if previous is not None and previous[0] is raw:
+                    return previous[1]
+                model = parse(raw)
+                self._parsed[endpoint] = (raw, model)
+                return model
+        except Exception:
+            _LOGGER.debug("WLANThermo: Device offline (no %s)", endpoint)
+        return None
+
+    async def _async_refresh_config(self, endpoints: set[str]) -> set[str]:
+        """
+        Fetch the given configuration endpoints concurrently.
+        An endpoint that fails or is not requested keeps its last known value.
+        Args:
+            endpoints: Subset of CONFIG_ENDPOINTS to fetch.
+        Returns:
+            Endpoints that failed.
+        """
+        api = self.api
+        if endpoints.issuperset(CONFIG_ENDPOINTS):
+            self._config_refreshed_at = time.monotonic()
+        sources = [
+            source
+            for source in (
+                ("/settings", api.get_settings, SettingsData.from_json),
+                ("/getpush", api.get_push, PushSettings.from_json),
+                ("/getbluetooth", api.get_bluetooth, BluetoothSettings.from_json),
+            )
+            if source[0] in endpoints
+        ]
+        pending_pids = "/settings" in endpoints and self._has_pending(UPDATE_PID)
+        if pending_pids:
+            # The cached model holds the local changes, build a new one from the response.
+            self._parsed.pop("/settings", None)
+        generation = self._write_generation
+        results = await asyncio.gather(*(self._async_fetch(*source) for source in sources))
+        models = {source[0]: model for source, model in zip(sources, results)}
+        settings = models.get("/settings")
+        push = models.get("/getpush")
+        bluetooth = models.get("/getbluetooth")
+        if settings is not None:
+            self.settings = settings
+            self.api.settings = settings
+            if pending_pids:
+                reconciled = self._reapply_pending({UPDATE_PID: settings.get_pid}, generation)
+                if reconciled:
+                    self._reconciled_pids = reconciled | {UPDATE_PID_PROFILES}
+        if push is not None:
+            self.push = push
+        if bluetooth is not None:
+            self.bluetooth = bluetooth
+        return {endpoint for endpoint, model in models.items() if model is None}
+
+    async def _async_update_data(self) -> WlanthermoData:
+        """
+        Fetch /data and, when due, the configuration endpoints.
+        Raises UpdateFailed when device is offline.
+
+        Returns:
+            WlanthermoData object with latest data and settings.
+        """
+        api = self.api
+        self._changes = None
+        # A write completing later invalidates this request, so it is never
+        # joined by a request starting after the write.
+        generation = self._write_generation
+        try:
+            raw_data = await api.get_data()
+            self._apply_backoff()
+            if not raw_data:
+                breaker = api.breaker
+                if self.data is not None and breaker.state == CircuitBreaker.CLOSED and breaker.failures:
+                    # Single failed requests keep the last data until the circuit opens.
+                    _LOGGER.debug(
+                        "WLANThermo: No /data (%s/%s)",
+                        breaker.failures,
+                        BREAKER_FAILURE_THRESHOLD,
+                    )
+                    self._changes = set()
+                    return self.data
+                raise UpdateFailed(f"WLANThermo offline (circuit {breaker.state})")
+            stale = api.pop_stale_endpoints()
+            endpoints = self._config_endpoints_due(stale)
+            if endpoints:
+                failed = await self._async_refresh_config(endpoints)
+                # Retried on the next tick instead of keeping the outdated values
+                # until the configuration interval.
+                api.mark_stale(failed & stale)
+            data = self.data
+            previous_raw, self._raw_data = self._raw_data, raw_data
+            if data is None:
+                data = WlanthermoData(
+                    raw=raw_data,
+                    settings=self.settings,
+                    push=self.push,
+                    bluetooth=self.bluetooth,
+                )
+                self._record_history(data)
+                return data
+            changes = data.update_config(self.settings, self.push, self.bluetooth)
+            if self._reconciled_pids:
+                changes |= self._reconciled_pids
+                self._reconciled_pids = set()
+            # The API returns the previous object for an unchanged body, which
+            # still has to be applied over local changes the device did not take.
+            if raw_data is not previous_raw or self._has_pending(UPDATE_CHANNEL, UPDATE_PITMASTER):
+                # The model objects are patched in place and stay the same instances.
+                changes |= data.update_from_json(raw_data)
+                self._reapply_pending(
+                    {UPDATE_CHANNEL: data.get_channel, UPDATE_PITMASTER: data.get_pitmaster},
+                    generation,
+                )
+                changes |= self._record_history(data)
+            else:
+                data.changed_fields = {}
+            if self.last_update_success:
+                self._changes = changes
+            return data
+        except UpdateFailed:
+            raise
+        except Exception as exc:
+            raise UpdateFailed(f"WLANThermo update failed: {exc}") from exc
@@ -4,8 +4,137 @@ Data models for WLANThermo integration.
 Defines Python classes for parsing and representing /data and /settings API responses.
 """
 from __future__ import annotations
-from typing import Any, Dict, List, Optional
-from .const import AKTOR_SSR, AKTOR_FAN, AKTOR_SERVO, AKTOR_DAMPER
+from functools import cached_property
+from itertools import compress
+from operator import attrgetter, itemgetter, ne
+from typing import AbstractSet, Any, Dict, List, Optional
+from .const import (
+    AKTOR_SSR,
+    AKTOR_FAN,
+    AKTOR_SERVO,
+    AKTOR_DAMPER,
+    UPDATE_BLUETOOTH,
+    UPDATE_CHANNEL,
+    UPDATE_CHANNELS,
+    UPDATE_PID,
+    UPDATE_PID_PROFILES,
+    UPDATE_PITMASTER,
+    UPDATE_PITMASTER_TYPES,
+    UPDATE_PUSH,
+    UPDATE_SETTINGS,
+    UPDATE_SYSTEM,
+)
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return value.lower() in ("1", "true", "yes", "on")
+    return False
+
+def parse_true(value: Any) -> bool:
+    return str(value).lower() == "true"
+
+
+def schema_slots(schema: tuple) -> tuple[str, ...]:
+    """
+    Return the attribute names of a model schema, for use as __slots__.
+    """
+    return tuple(field[0] for field in schema)
+
+
+# Returned by update_from_json when no field changed, so unchanged items do
+# not allocate a set on every poll.
+_UNCHANGED: frozenset = frozenset()
+
+
+class SlottedModel:
+    """
+    Base class for compact model objects decoded from the API.
+    Subclasses declare their fields in _schema as (attribute, JSON key,
+    coercer, default) tuples and take __slots__ from it. A missing key gives
+    the default as is, any other value is passed through the coercer. The
+    base class decodes and patches the objects from the schema and compares
+    them by value. The schema is compiled once per class into item and
+    attribute getters, so a patch reads all raw and current values in two
+    calls.
+    """
+    __slots__ = ()
+    __hash__ = None
+    _schema: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        names, keys, coercers, defaults = zip(*cls._schema)
+        cls._names = names
+        cls._keys = keys
+        cls._coercers = coercers
+        cls._defaults = defaults
+        cls._indexes = range(len(names))
+        cls._items = itemgetter(*keys)
+        cls._values = attrgetter(*names)
+        cls._changed_names = {}
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Initialize the model from its dictionary of the API response.
+        Args:
+            data: Dictionary for this object from the API response.
+        """
+        get = data.get
+        for name, key, coerce, default in self._schema:
+            value = get(key, default)
+            setattr(self, name, value if value is default else coerce(value))
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values(self) == other._values(other)
+
+    def update_from_json(self, data: Dict[str, Any]) -> AbstractSet[str]:
+        """
+        Write the fields whose value differs in data.
+        The raw values are compared with the current ones first, so only the
+        fields that differ are coerced and no temporary model is built. A raw
+        value equal to the current one counts as unchanged.
+        Args:
+            data: Dictionary for this object from the API response.
+        Returns:
+            Set of the changed attribute names, shared and not to be modified.
+        """
+        try:
+            raw = self._items(data)
+        except KeyError:
+            raw = tuple(map(data.get, self._keys, self._defaults))
+        current = self._values(self)
+        if raw == current:
+            return _UNCHANGED
+        mask = 0
+        defaults = self._defaults
+        for index in compress(self._indexes, map(ne, raw, current)):
+            value = raw[index]
+            if value is not defaults[index]:
+                value = self._coercers[index](value)
+            if value != current[index]:
+                setattr(self, self._names[index], value)
+                mask |= 1 << index
+        if not mask:
+            return _UNCHANGED
+        # The same few fields change on every poll, so their name sets are
+        # built once per class and shared.
+        changed = self._changed_names.get(mask)
+        if changed is None:
+            changed = self._changed_names[mask] = frozenset(
+                name for index, name in enumerate(self._names) if mask >> index & 1
+            )
+        return changed
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
 
 class WlanthermoData:
     """
@@ -29,88 +158,251 @@ class WlanthermoData:
             bluetooth: Optional BluetoothSettings object.
             **kwargs: Additional keyword arguments.
         """
-        import copy
         self.settings: SettingsData | None = settings
         self.push: PushSettings | None = push
         self.bluetooth: BluetoothSettings | None = bluetooth
         if raw:
-            self.channels: list[Channel] = [
-                Channel(copy.deepcopy(c)) for c in raw.get("channel", [])
-            ]
-            self.pitmasters: list[Pitmaster] = [
-                Pitmaster(copy.deepcopy(p))
-                for p in raw.get("pitmaster", {}).get("pm", [])
-            ]
-            self.pitmaster_types: PitmasterTypes = PitmasterTypes(
-                raw.get("pitmaster", {}).get("type", [])
-            )
-            self.system: SystemInfo = SystemInfo(copy.deepcopy(raw.get("system", {})))
+            # The models copy every field into typed attributes, so the decoded
+            # JSON is read directly without copying it first.
+            pitmaster = raw.get("pitmaster", {})
+            self.channels: list[Channel] = [Channel(c) for c in raw.get("channel", [])]
+            self.pitmasters: list[Pitmaster] = [Pitmaster(p) for p in pitmaster.get("pm", [])]
+            self.pitmaster_types: PitmasterTypes = PitmasterTypes(pitmaster.get("type", []))
+            self.system: SystemInfo = SystemInfo(raw.get("system", {}))
         else:
             self.channels: list[Channel] = []
             self.pitmasters: list[Pitmaster] = []
             self.pitmaster_types: PitmasterTypes = PitmasterTypes([])
             self.system: SystemInfo = SystemInfo({})
+        # Indexes for O(1) lookups by the entities.
+        self.channels_by_number: dict[int, Channel] = {c.number: c for c in self.channels}
+        self.pitmasters_by_id: dict[int, Pitmaster] = {p.id: p for p in self.pitmasters}
+        # Changed field names of the last update_from_json() by update key.
+        self.changed_fields: dict = {}
 
+    def get_channel(self, number: int) -> "Channel" | None:
+        """
+        Return the channel with the given number, or None if not present.
+        """
+        return self.channels_by_number.get(number)
 
-class SystemInfo:
+    def get_pitmaster(self, pitmaster_id: int) -> "Pitmaster" | None:
+        """
+        Return the pitmaster with the given id, or None if not present.
+        """
+        return self.pitmasters_by_id.get(pitmaster_id)
+
+    def update_from_json(self, raw: Dict[str, Any]) -> set:
+        """
+        Patch this snapshot in place with a new /data response.
+        Existing Channel, Pitmaster and SystemInfo objects are kept and only
+        their changed fields are written. The changed field names are stored
+        in changed_fields by update key.
+        Args:
+            raw: Raw dictionary from /data endpoint.
+        Returns:
+            Set of update keys (see const.UPDATE_*) whose data changed.
+        """
+        changes: set = set()
+        changed_fields: dict = {}
+        pitmaster = raw.get("pitmaster", {})
+        self.channels = _update_items(
+            self.channels_by_number,
+            raw.get("channel", []),
+            Channel,
+            "number",
+            UPDATE_CHANNEL,
+            UPDATE_CHANNELS,
+            changes,
+            changed_fields,
+        )
+        self.pitmasters = _update_items(
+            self.pitmasters_by_id,
+            pitmaster.get("pm", []),
+            Pitmaster,
+            "id",
+            UPDATE_PITMASTER,
+            None,
+            changes,
+            changed_fields,
+        )
+        fields = self.system.update_from_json(raw.get("system", {}))
+        if fields:
+            changes.add(UPDATE_SYSTEM)
+            changed_fields[UPDATE_SYSTEM] = fields
+        types = pitmaster.get("type", [])
+        if self.pitmaster_types.options != types:
+            self.pitmaster_types = PitmasterTypes(types)
+            changes.add(UPDATE_PITMASTER_TYPES)
+        self.changed_fields = changed_fields
+        return changes
+
+    def update_config(
+        self,
+        settings: "SettingsData" | None,
+        push: "PushSettings" | None,
+        bluetooth: "BluetoothSettings" | None,
+    ) -> set:
+        """
+        Attach the current configuration objects to this snapshot.
+        Args:
+            settings: Current SettingsData object.
+            push: Current PushSettings object.
+            bluetooth: Current BluetoothSettings object.
+        Returns:
+            Set of update keys (see const.UPDATE_*) whose data changed.
+        """
+        changes: set = set()
+        # Configuration objects are only replaced when their endpoint was refetched.
+        if self.settings is not settings:
+            previous, self.settings = self.settings, settings
+            # Compare the raw responses so unchanged sections are never parsed.
+            old_raw = previous.raw if previous is not None else {}
+            new_raw = settings.raw if settings is not None else {}
+            if previous is None or settings is None or old_raw != new_raw:
+                changes.add(UPDATE_SETTINGS)
+            if old_raw.get("pid") != new_raw.get("pid"):
+                _diff_items(
+                    getattr(previous, "pid_by_id", {}),
+                    getattr(settings, "pid_by_id", {}),
+                    UPDATE_PID,
+                    UPDATE_PID_PROFILES,
+                    changes,
+                )
+        if self.push is not push:
+            changes.add(UPDATE_PUSH)
+            self.push = push
+        if self.bluetooth is not bluetooth:
+            changes.add(UPDATE_BLUETOOTH)
+            self.bluetooth = bluetooth
+        return changes
+
+
+def _update_items(
+    index: dict,
+    items: list,
+    model: type,
+    id_key: str,
+    prefix: str,
+    aggregate: str | None,
+    changes: set,
+    changed_fields: dict,
+) -> list:
+    """
+    Patch the indexed model objects with a list from the /data response.
+    Unknown ids create new objects, ids missing from the response are dropped.
+    Args:
+        index: Existing model objects by id, updated in place.
+        items: List of raw item dictionaries.
+        model: SlottedModel subclass of the items.
+        id_key: Key of the item id in the raw dictionaries.
+        prefix: Update key prefix for single items.
+        aggregate: Optional update key added if any item changed.
+        changes: Set collecting the update keys.
+        changed_fields: Dictionary collecting the changed field names by update key.
+    Returns:
+        List of the model objects in response order.
+    """
+    result = []
+    changed = False
+    for data in items:
+        item_id = int(data.get(id_key, 0))
+        item = index.get(item_id)
+        if item is None:
+            item = index[item_id] = model(data)
+            fields = set(model.__slots__)
+        else:
+            fields = item.update_from_json(data)
+        if fields:
+            key = (prefix, item_id)
+            changes.add(key)
+            changed_fields[key] = fields
+            changed = True
+        result.append(item)
+    if len(index) != len(result):
+        seen = {getattr(item, id_key) for item in result}
+        for item_id in index.keys() - seen:
+            del index[item_id]
+            changes.add((prefix, item_id))
+            changed = True
+    if changed and aggregate:
+        changes.add(aggregate)
+    return result
+
+
+def _diff_items(old: dict, new: dict, prefix: str, aggregate: str | None, changes: set) -> None:
+    """
+    Add (prefix, id) to changes for every item that was added, removed or modified.
+    Args:
+        old: Items of the previous snapshot by id.
+        new: Items of the current snapshot by id.
+        prefix: Update key prefix for single items.
+        aggregate: Optional update key added if any item changed.
+        changes: Set collecting the update keys.
+    """
+    changed = False
+    for item_id, item in new.items():
+        prev = old.get(item_id)
+        if prev is None or prev != item:
+            changes.add((prefix, item_id))
+            changed = True
+    for item_id in old.keys() - new.keys():
+        changes.add((prefix, item_id))
+        changed = True
+    if changed and aggregate:
+        changes.add(aggregate)
+
+
+class SystemInfo(SlottedModel):
     """
     System status info from /data endpoint.
     Includes time, unit, battery, and connection status.
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize SystemInfo from /data endpoint.
-        Args:
-            data: Dictionary from /data endpoint's 'system' key.
-        """
-        self.time: int = int(data.get("time", 0))
-        self.unit: str = str(data.get("unit", "C"))
-        self.soc: Optional[int] = int(data["soc"]) if "soc" in data else None  # State of charge.
-        self.charge: Optional[bool] = bool(data["charge"]) if "charge" in data else None  # Charging status.
-        self.rssi: int = int(data.get("rssi", 0))  # WiFi signal.
-        self.online: Optional[int] = int(data["online"]) if "online" in data else None
-
-class Channel:
+    _schema = (
+        ("time", "time", int, 0),
+        ("unit", "unit", str, "C"),
+        ("soc", "soc", int, None),  # State of charge.
+        ("charge", "charge", bool, None),  # Charging status.
+        ("rssi", "rssi", int, 0),  # WiFi signal.
+        ("online", "online", int, None),
+    )
+    __slots__ = schema_slots(_schema)
+
+class Channel(SlottedModel):
     """
     Represents a single measurement channel (sensor input).
     Includes temperature, alarm, and connection info.
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize Channel with sensor input data.
-        Args:
-            data: Dictionary for a single channel from /data endpoint.
-        """
-        self.number: int = int(data.get("number", 0))
-        self.name: str = str(data.get("name", ""))
-        self.typ: int = int(data.get("typ", 0))
-        self.temp: float = float(data.get("temp", 0.0))
-        self.min: float = float(data.get("min", 0.0))
-        self.max: float = float(data.get("max", 0.0))
-        self.alarm: int = int(data.get("alarm", 0))
-        self.color: str = str(data.get("color", "#000000"))
-        self.fixed: bool = bool(data.get("fixed", False))
-        self.connected: bool = bool(data.get("connected", False))
-
-class Pitmaster:
+    _schema = (
+        ("number", "number", int, 0),
+        ("name", "name", str, ""),
+        ("typ", "typ", int, 0),
+        ("temp", "temp", float, 0.0),
+        ("min", "min", float, 0.0),
+        ("max", "max", float, 0.0),
+        ("alarm", "alarm", int, 0),
+        ("color", "color", str, "#000000"),
+        ("fixed", "fixed", bool, False),
+        ("connected", "connected", bool, False),
+    )
+    __slots__ = schema_slots(_schema)
+
+class Pitmaster(SlottedModel):
     """
     Represents a pitmaster (fan/servo controller) configuration and status.
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize Pitmaster configuration and status.
-        Args:
-            data: Dictionary for a single pitmaster from /data endpoint.
-        """
-        self.id: int = int(data.get("id", 0))
-        self.channel: int = int(data.get("channel", 0))
-        self.temp: float = float(data.get("temp", 0.0))
-        self.pid: int = int(data.get("pid", 0))
-        self.value: int = int(data.get("value", 0))
-        self.set: float = float(data.get("set", 0.0))
-        self.typ: str = str(data.get("typ", "off"))
-        self.set_color: str = str(data.get("set_color", "#000000"))
-        self.value_color: str = str(data.get("value_color", "#000000"))
+    _schema = (
+        ("id", "id", int, 0),
+        ("channel", "channel", int, 0),
+        ("temp", "temp", float, 0.0),
+        ("pid", "pid", int, 0),
+        ("value", "value", int, 0),
+        ("set", "set", float, 0.0),
+        ("typ", "typ", str, "off"),
+        ("set_color", "set_color", str, "#000000"),
+        ("value_color", "value_color", str, "#000000"),
+    )
+    __slots__ = schema_slots(_schema)
 
 class PitmasterTypes:
     """
@@ -134,45 +426,39 @@ class PitmasterTypes:
     def __bool__(self):
         return bool(self._types)
 
-class DeviceInfo:
+class DeviceInfo(SlottedModel):
     """
     Device information from /settings endpoint.
     Includes hardware, firmware, and identification info.
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize DeviceInfo from /settings endpoint.
-        Args:
-            data: Dictionary from /settings endpoint's 'device' key.
-        """
-        self.device: str = str(data.get("device", ""))
-        self.serial: str = str(data.get("serial", ""))
-        self.cpu: str = str(data.get("cpu", ""))
-        self.flash_size: int = int(data.get("flash_size", 0))
-        self.hw_version: str = str(data.get("hw_version", ""))
-        self.sw_version: str = str(data.get("sw_version", ""))
-        self.api_version: str = str(data.get("api_version", ""))
-        self.language: str = str(data.get("language", ""))
-
-class SystemSettings:
+    _schema = (
+        ("device", "device", str, ""),
+        ("serial", "serial", str, ""),
+        ("cpu", "cpu", str, ""),
+        ("flash_size", "flash_size", int, 0),
+        ("hw_version", "hw_version", str, ""),
+        ("sw_version", "sw_version", str, ""),
+        ("api_version", "api_version", str, ""),
+        ("language", "language", str, ""),
+    )
+    __slots__ = schema_slots(_schema)
+
+class SystemSettings(SlottedModel):
     """
     System settings from /settings endpoint.
     Includes network, language, and version info.
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize SystemSettings from /settings endpoint.
-        Args:
-            data: Dictionary from /settings endpoint's 'system' key.
-        """
-        self.time: int = int(data.get("time", 0))
-        self.unit: str = str(data.get("unit", "C"))
-        self.ap: str = str(data.get("ap", ""))
-        self.host: str = str(data.get("host", ""))
-        self.language: str = str(data.get("language", ""))
-        self.version: str = str(data.get("version", ""))
-        self.getupdate: bool = str(data.get("getupdate", "false")).lower() == "true"
-        self.hwversion: str = str(data.get("hwversion", ""))
+    _schema = (
+        ("time", "time", int, 0),
+        ("unit", "unit", str, "C"),
+        ("ap", "ap", str, ""),
+        ("host", "host", str, ""),
+        ("language", "language", str, ""),
+        ("version", "version", str, ""),
+        ("getupdate", "getupdate", parse_true, False),
+        ("hwversion", "hwversion", str, ""),
+    )
+    __slots__ = schema_slots(_schema)
 
 class SensorType:
     """
@@ -198,24 +484,39 @@ class SensorType:
             self.fixed = False
 
 
-class FeatureSet:
+class FeatureSet(SlottedModel):
     """
     Features supported by the device (e.g., Bluetooth, pitmaster).
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize FeatureSet with supported features.
-        Args:
-            data: Dictionary from /settings endpoint's 'features' key.
-        """
-        self.bluetooth: bool = bool(data.get("bluetooth", False))
-        self.pitmaster: bool = bool(data.get("pitmaster", False))
+    _schema = (
+        ("bluetooth", "bluetooth", bool, False),
+        ("pitmaster", "pitmaster", bool, False),
+    )
+    __slots__ = schema_slots(_schema)
 
-class PIDConfig:
+class PIDConfig(SlottedModel):
     """
     PID controller configuration from /settings.
     Includes tuning parameters and actuator info.
     """
+    _schema = (
+        ("name", "name", str, ""),
+        ("id", "id", int, 0),
+        ("aktor", "aktor", int, 0),
+        ("Kp", "Kp", float, 0.0),
+        ("Ki", "Ki", float, 0.0),
+        ("Kd", "Kd", float, 0.0),
+        ("DCmmin", "DCmmin", int, 0),
+        ("DCmmax", "DCmmax", int, 0),
+        ("opl", "opl", parse_bool, False),
+        ("SPmin", "SPmin", int, 0),
+        ("SPmax", "SPmax", int, 0),
+        ("link", "link", int, 0),
+        ("tune", "tune", parse_bool, False),
+        ("jp", "jp", int, 0),
+    )
+    __slots__ = schema_slots(_schema)
+
     @property
     def is_servo(self) -> bool:
         return self.aktor in (AKTOR_SERVO, AKTOR_DAMPER)
@@ -232,27 +533,6 @@ class PIDConfig:
     def supports_link(self):
         return self.aktor == AKTOR_DAMPER
 
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize PIDConfig with PID controller configuration.
-        Args:
-            data: Dictionary for a single PID config from /settings endpoint.
-        """
-        self.name: str = str(data.get("name", ""))
-        self.id: int = int(data.get("id", 0))
-        self.aktor: int = int(data.get("aktor", 0))
-        self.Kp: float = float(data.get("Kp", 0.0))
-        self.Ki: float = float(data.get("Ki", 0.0))
-        self.Kd: float = float(data.get("Kd", 0.0))
-        self.DCmmin: int = int(data.get("DCmmin", 0))
-        self.DCmmax: int = int(data.get("DCmmax", 0))
-        self.opl: bool = parse_bool(data.get("opl", False))
-        self.SPmin: int = int(data.get("SPmin", 0))
-        self.SPmax: int = int(data.get("SPmax", 0))
-        self.link: int = int(data.get("link", 0))
-        self.tune: bool = parse_bool(data.get("tune", False))
-        self.jp: int = int(data.get("jp", 0))
-
     def aktor_name(self, aktor_map: list[str]) -> str:
         try:
             return aktor_map[self.aktor]
@@ -287,18 +567,15 @@ class PIDConfig:
         return True
 
 
-class DisplayInfo:
+class DisplayInfo(SlottedModel):
     """
     Display settings from /settings endpoint.
     """
-    def __init__(self, data: Dict[str, Any]):
-        """
-        Initialize DisplayInfo from /settings endpoint.
-        Args:
-            data: Dictionary from /settings endpoint's 'display' key.
-        """
-        self.updname: str = str(data.get("updname", ""))
-        self.orientation: int = int(data.get("orientation", 0))
+    _schema = (
+        ("updname", "updname", str, ""),
+        ("orientation", "orientation", int, 0),
+    )
+    __slots__ = schema_slots(_schema)
 
 class IotSettings:
     """
@@ -357,6 +634,7 @@ class SettingsData:
     """
     Container for parsed /settings endpoint response.
     Holds device info, system settings, features, sensors, PID configs, etc.
+    Each section is parsed on first access and cached for this snapshot.
     """
     def __init__(self, raw: Dict[str, Any]):
         """
@@ -364,17 +642,62 @@ class SettingsData:
         Args:
             raw: Raw dictionary from /settings endpoint.
         """
-        self.device: DeviceInfo = DeviceInfo(raw.get("device", {}))
-        self.system: SystemSettings = SystemSettings(raw.get("system", {}))
-        self.hardware: list = raw.get("hardware", [])
-        self.api: dict = raw.get("api", {})
-        self.sensors: list[SensorType] = [SensorType(s) for s in raw.get("sensors", [])]
-        self.features: FeatureSet = FeatureSet(raw.get("features", {}))
-        self.pid: list[PIDConfig] = [PIDConfig(p) for p in raw.get("pid", [])]
-        self.aktor: list = raw.get("aktor", [])
-        self.display: DisplayInfo = DisplayInfo(raw.get("display", {}))
-        self.iot: IotSettings = IotSettings(raw.get("iot", {}))
-        self.notes: Notes = Notes(raw.get("notes", {}))
+        self.raw: Dict[str, Any] = raw
+
+    @cached_property
+    def device(self) -> DeviceInfo:
+        return DeviceInfo(self.raw.get("device", {}))
+
+    @cached_property
+    def system(self) -> SystemSettings:
+        return SystemSettings(self.raw.get("system", {}))
+
+    @cached_property
+    def hardware(self) -> list:
+        return self.raw.get("hardware", [])
+
+    @cached_property
+    def api(self) -> dict:
+        return self.raw.get("api", {})
+
+    @cached_property
+    def sensors(self) -> list[SensorType]:
+        return [SensorType(s) for s in self.raw.get("sensors", [])]
+
+    @cached_property
+    def features(self) -> FeatureSet:
+        return FeatureSet(self.raw.get("features", {}))
+
+    @cached_property
+    def pid(self) -> list[PIDConfig]:
+        return [PIDConfig(p) for p in self.raw.get("pid", [])]
+
+    @cached_property
+    def aktor(self) -> list:
+        return self.raw.get("aktor", [])
+
+    @cached_property
+    def display(self) -> DisplayInfo:
+        return DisplayInfo(self.raw.get("display", {}))
+
+    @cached_property
+    def iot(self) -> IotSettings:
+        return IotSettings(self.raw.get("iot", {}))
+
+    @cached_property
+    def notes(self) -> Notes:
+        return Notes(self.raw.get("notes", {}))
+
+    @cached_property
+    def pid_by_id(self) -> dict[int, PIDConfig]:
+        # Index for O(1) PID profile lookups by the entities.
+        return {p.id: p for p in self.pid}
+
+    def get_pid(self, profile_id: int) -> PIDConfig | None:
+        """
+        Return the PID profile with the given id, or None if not present.
+        """
+        return self.pid_by_id.get(profile_id)
 
     @classmethod
     def from_json(cls, data: Dict[str, Any]) -> "SettingsData":
@@ -462,14 +785,3 @@ class BluetoothSettings:
             "enabled": int(self.enabled),
             "devices": self.devices,
         }
-
-@staticmethod
-def parse_bool(value: Any) -> bool:
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return value != 0
-    if isinstance(value, str):
-        return value.lower() in ("1", "true", "yes", "on")
-    return False
-
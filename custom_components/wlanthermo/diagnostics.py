@@ -0,0 +1,48 @@
+"""
+Diagnostics support for WLANThermo.
+Exposes connection, polling and reachability state of a config entry.
+"""
+from typing import Any
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from .const import DOMAIN
+
+TO_REDACT = {"username", "password"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+) -> dict[str, Any]:
+    """
+    Return diagnostics for a WLANThermo config entry.
+    Args:
+        hass: Home Assistant instance.
+        entry: Config entry for the integration.
+    Returns:
+        Dictionary with the redacted entry configuration and runtime statistics.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    api = entry_data["api"]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "config_scan_interval": coordinator.config.config_scan_interval,
+            "time_left_engine": coordinator.config.time_left_engine,
+        },
+        "connection": api.connection_stats,
+        "latency": api.latency_stats,
+        "circuit_breaker": api.breaker.as_dict(),
+        "history": {
+            "samples": len(coordinator.history),
+            "capacity": coordinator.history.capacity,
+            "columns": len(coordinator.history.keys),
+        },
+    }
@@ -0,0 +1,395 @@
+"""
+Time left estimation for WLANThermo channels.
+Estimators are fed once per device update and answer reads from the
+state computed when the sample was added, so reading a sensor value is
+constant time and side-effect free.
+
+Several engines estimate the rate of temperature change, each in constant
+time per sample:
+- window: difference between the oldest and newest sample of the window.
+- regression: least squares slope over the window from running sums.
+- ewma: exponentially weighted average of the slopes between samples.
+- kalman: filter with temperature and rate as state.
+The shared base class detects the stall (plateau) of long cooks.
+
+The samples are not copied into the estimators. Each update passes views of
+the device history (see history.py) ending with the new sample, and the
+window engines read their window from them.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+import math
+from typing import Sequence
+
+# Temperature reported by the device for a channel without a probe.
+NOT_CONNECTED = 999.0
+# A rate below this fraction of the peak rate of the cook is a stall, above
+# the exit fraction the stall is over.
+STALL_ENTER_RATIO = 0.15
+STALL_EXIT_RATIO = 0.3
+# Rates above this fraction of the peak are the cruise rate used during a stall.
+STALL_CRUISE_RATIO = 0.5
+# Seconds from the last cruise rate within which the rate must drop for a stall.
+# The slow approach to the pit temperature takes hours and is not a stall.
+STALL_ONSET = 1800.0
+# Peak rate in degrees per second a channel must have reached before a stall
+# can be detected, so probes at ambient temperature are never stalled.
+STALL_MIN_PEAK_RATE = 0.1 / 60
+# Samples before the rate is trusted for the peak and the stall.
+STALL_MIN_SAMPLES = 6
+# Standard deviations subtracted from the rate before it counts for the peak,
+# so noise spikes of the early samples do not raise it.
+STALL_PEAK_STDDEVS = 2
+# Seconds after which the regression rebases its time origin and recomputes its sums.
+REGRESSION_REBASE = 3600.0
+# Kalman filter noise: variance of a reading and of the rate change per second.
+KALMAN_MEASUREMENT_VAR = 0.04
+KALMAN_RATE_VAR = 1e-9
+
+
+class TimeLeftEstimator:
+    """
+    Base class of the time left engines.
+    Filters repeated and invalid samples, tracks the stall and turns the
+    rate of the engine into minutes left. Engines implement _update and
+    _reset and set rate (degrees per second) and rate_std.
+    """
+    __slots__ = (
+        "window",
+        "rate",
+        "rate_std",
+        "stalled_since",
+        "_count",
+        "_start_time",
+        "_last_time",
+        "_peak_rate",
+        "_cruise_rate",
+        "_cruise_time",
+    )
+
+    def __init__(self, window: float = 300.0) -> None:
+        """
+        Args:
+            window: Window or time constant of the engine in seconds.
+        """
+        self.window = window
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget all samples, e.g. when the probe was removed.
+        """
+        self.rate: float | None = None
+        self.rate_std: float | None = None
+        # Device time at which the current stall began, None outside a stall.
+        self.stalled_since: float | None = None
+        self._count = 0
+        # Device time of the first sample since the reset.
+        self._start_time: float | None = None
+        self._last_time: float | None = None
+        self._peak_rate = 0.0
+        # Last rate of the cook before a stall, used for the estimate during it.
+        self._cruise_rate: float | None = None
+        self._cruise_time = 0.0
+        self._reset()
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    def _update(self, times: Sequence[float], temps: Sequence[float]) -> None:
+        raise NotImplementedError
+
+    def add(self, times: Sequence[float], temps: Sequence[float]) -> None:
+        """
+        Add the newest sample of a channel and update the rate.
+        Every sample of the views must have been added in order before.
+        Args:
+            times: Device times of the samples in seconds, oldest first and
+                ending with the new sample, e.g. HistoryBuffer.times().
+            temps: Channel temperatures of the same samples, NaN or 999.0
+                without a probe, which resets the estimator.
+        """
+        timestamp = times[-1]
+        temp = temps[-1]
+        if temp != temp or temp == NOT_CONNECTED:
+            self.reset()
+            return
+        last = self._last_time
+        if last is not None and timestamp <= last:
+            if timestamp == last:
+                # Same device update seen again.
+                return
+            # The device clock went back, e.g. after a restart.
+            self.reset()
+        if self._start_time is None:
+            self._start_time = timestamp
+        self._last_time = timestamp
+        self._count += 1
+        self._update(times, temps)
+        self._track_stall(timestamp)
+
+    def _window_start(self, times: Sequence[float]) -> int:
+        """
+        Return the index of the oldest sample within the window, not before
+        the first sample since the reset.
+        """
+        return bisect_left(times, max(times[-1] - self.window, self._start_time))
+
+    def _track_stall(self, timestamp: float) -> None:
+        rate = self.rate
+        if rate is None or self._count < STALL_MIN_SAMPLES:
+            return
+        floor = rate - STALL_PEAK_STDDEVS * (self.rate_std or 0.0)
+        if floor > self._peak_rate:
+            self._peak_rate = floor
+        peak = self._peak_rate
+        if peak < STALL_MIN_PEAK_RATE:
+            return
+        if self.stalled_since is None:
+            if rate >= STALL_CRUISE_RATIO * peak:
+                self._cruise_rate = rate
+                self._cruise_time = timestamp
+            elif rate < STALL_ENTER_RATIO * peak and timestamp - self._cruise_time <= STALL_ONSET:
+                self.stalled_since = timestamp
+        elif rate > STALL_EXIT_RATIO * peak:
+            self.stalled_since = None
+
+    def time_left(self, temp: float | None, target: float | None) -> float | None:
+        """
+        Return the estimated minutes until temp reaches target.
+        During a stall the rate before the stall is used, so the estimate is
+        the time left once the stall is over.
+        Args:
+            temp: Current temperature.
+            target: Target temperature.
+        Returns:
+            Minutes rounded to two decimals, 0 if the target is reached, or
+            None without a rising temperature.
+        """
+        if self.rate is None or temp is None or target is None:
+            return None
+        if temp >= target:
+            return 0
+        rate = self._cruise_rate if self.stalled_since is not None else self.rate
+        if rate is None or rate <= 0:
+            return None
+        return round((target - temp) / (rate * 60), 2)
+
+    def attributes(self) -> dict:
+        """
+        Return the rate, its confidence and the stall state for state attributes.
+        """
+        rate = self.rate
+        std = self.rate_std
+        stalled = self.stalled_since is not None
+        if rate is None or std is None or rate <= 0:
+            confidence = None
+        elif stalled:
+            confidence = 0.0
+        else:
+            # 1 - relative error of the rate, which is also the relative error of the time left.
+            confidence = round(max(0.0, 1.0 - std / rate), 2)
+        return {
+            "rate_per_minute": round(rate * 60, 3) if rate is not None else None,
+            "rate_stddev_per_minute": round(std * 60, 3) if std is not None else None,
+            "confidence": confidence,
+            "stalled": stalled,
+            "stall_minutes": (
+                round((self._last_time - self.stalled_since) / 60, 1) if stalled else None
+            ),
+        }
+
+
+class WindowEstimator(TimeLeftEstimator):
+    """
+    Rate between the oldest and newest sample within the window.
+    """
+    __slots__ = ()
+
+    def _reset(self) -> None:
+        pass
+
+    def _update(self, times: Sequence[float], temps: Sequence[float]) -> None:
+        first = self._window_start(times)
+        last = len(times) - 1
+        if first >= last:
+            self.rate = None
+            return
+        self.rate = (temps[last] - temps[first]) / (times[last] - times[first])
+
+
+class RegressionEstimator(TimeLeftEstimator):
+    """
+    Least squares slope over the window.
+    Keeps running sums that samples are added to and removed from as they
+    enter and leave the window. Times are relative to an origin that is
+    moved forward regularly to keep the sums small and exact.
+    """
+    __slots__ = ("_origin", "_first_time", "_st", "_sy", "_stt", "_sty", "_syy")
+
+    def _reset(self) -> None:
+        self._origin: float | None = None
+        # Device time of the oldest sample in the sums.
+        self._first_time = 0.0
+        self._st = self._sy = self._stt = self._sty = self._syy = 0.0
+
+    def _rebase(self, times: Sequence[float], temps: Sequence[float], first: int) -> None:
+        """
+        Move the origin to the oldest sample of the window and recompute the sums.
+        """
+        origin = self._origin = self._first_time = times[first]
+        self._st = self._sy = self._stt = self._sty = self._syy = 0.0
+        for index in range(first, len(times)):
+            t = times[index] - origin
+            y = temps[index]
+            self._st += t
+            self._sy += y
+            self._stt += t * t
+            self._sty += t * y
+            self._syy += y * y
+
+    def _update(self, times: Sequence[float], temps: Sequence[float]) -> None:
+        first = self._window_start(times)
+        last = len(times) - 1
+        origin = self._origin
+        if (
+            origin is None
+            # Samples of the sums are no longer in the views.
+            or times[0] > self._first_time
+            or times[last] - origin >= REGRESSION_REBASE
+        ):
+            self._rebase(times, temps, first)
+        else:
+            for index in range(bisect_left(times, self._first_time), first):
+                old_t = times[index] - origin
+                old_y = temps[index]
+                self._st -= old_t
+                self._sy -= old_y
+                self._stt -= old_t * old_t
+                self._sty -= old_t * old_y
+                self._syy -= old_y * old_y
+            self._first_time = times[first]
+            t = times[last] - origin
+            y = temps[last]
+            self._st += t
+            self._sy += y
+            self._stt += t * t
+            self._sty += t * y
+            self._syy += y * y
+        n = last - first + 1
+        if n < 2:
+            self.rate = None
+            self.rate_std = None
+            return
+        sxx = self._stt - self._st * self._st / n
+        if sxx <= 0:
+            self.rate = None
+            self.rate_std = None
+            return
+        sxy = self._sty - self._st * self._sy / n
+        syy = self._syy - self._sy * self._sy / n
+        slope = sxy / sxx
+        self.rate = slope
+        if n > 2:
+            residual_var = max(syy - slope * sxy, 0.0) / (n - 2)
+            self.rate_std = math.sqrt(residual_var / sxx)
+        else:
+            self.rate_std = None
+
+
+class EwmaEstimator(TimeLeftEstimator):
+    """
+    Exponentially weighted average of the slopes between consecutive samples.
+    The window is the time constant, so irregular sample intervals are weighted
+    by their length. The rate is published once the average has run for one
+    time constant, before that it is dominated by the noise of single slopes.
+    """
+    __slots__ = ("_mean", "_var")
+
+    def _reset(self) -> None:
+        self._mean: float | None = None
+        self._var = 0.0
+
+    def _update(self, times: Sequence[float], temps: Sequence[float]) -> None:
+        if self._count < 2:
+            return
+        timestamp = times[-1]
+        dt = timestamp - times[-2]
+        slope = (temps[-1] - temps[-2]) / dt
+        if self._mean is None:
+            self._mean = slope
+            return
+        alpha = 1.0 - math.exp(-dt / self.window)
+        diff = slope - self._mean
+        self._mean += alpha * diff
+        self._var = (1.0 - alpha) * (self._var + alpha * diff * diff)
+        if timestamp - self._start_time >= self.window:
+            self.rate = self._mean
+            # Standard deviation of the average, not of the single slopes.
+            self.rate_std = math.sqrt(self._var * alpha / (2.0 - alpha))
+
+
+class KalmanEstimator(TimeLeftEstimator):
+    """
+    Kalman filter with a constant rate model.
+    The state is the temperature and its rate; the rate may drift with
+    KALMAN_RATE_VAR per second and readings have KALMAN_MEASUREMENT_VAR noise.
+    The window is not used.
+    """
+    __slots__ = ("_temp", "_rate", "_p00", "_p01", "_p11")
+
+    def _reset(self) -> None:
+        self._temp = 0.0
+        self._rate = 0.0
+        # Covariance of (temperature, rate); the initial rate is unknown.
+        self._p00 = KALMAN_MEASUREMENT_VAR
+        self._p01 = 0.0
+        self._p11 = 1e-2
+
+    def _update(self, times: Sequence[float], temps: Sequence[float]) -> None:
+        temp = temps[-1]
+        if self._count < 2:
+            self._temp = temp
+            return
+        dt = times[-1] - times[-2]
+        # Predict.
+        q = KALMAN_RATE_VAR
+        p00, p01, p11 = self._p00, self._p01, self._p11
+        self._temp += dt * self._rate
+        p00 += dt * (2.0 * p01 + dt * p11) + q * dt * dt * dt / 3.0
+        p01 += dt * p11 + q * dt * dt / 2.0
+        p11 += q * dt
+        # Correct with the reading.
+        s = p00 + KALMAN_MEASUREMENT_VAR
+        k0 = p00 / s
+        k1 = p01 / s
+        residual = temp - self._temp
+        self._temp += k0 * residual
+        self._rate += k1 * residual
+        self._p00 = (1.0 - k0) * p00
+        self._p01 = (1.0 - k0) * p01
+        self._p11 = p11 - k1 * p01
+        self.rate = self._rate
+        self.rate_std = math.sqrt(max(self._p11, 0.0))
+
+
+ENGINES: dict[str, type[TimeLeftEstimator]] = {
+    "regression": RegressionEstimator,
+    "ewma": EwmaEstimator,
+    "kalman": KalmanEstimator,
+    "window": WindowEstimator,
+}
+
+
+def create_estimator(engine: str, window: float = 300.0) -> TimeLeftEstimator:
+    """
+    Create the estimator of an engine, unknown engines fall back to regression.
+    Args:
+        engine: Engine name, a key of ENGINES.
+        window: Window or time constant in seconds.
+    Returns:
+        New estimator.
+    """
+    return ENGINES.get(engine, RegressionEstimator)(window)
@@ -0,0 +1,128 @@
+"""
+Per-device history of the /data values.
+A columnar ring buffer written once per poll by the coordinator. Each column
+is an array('d') holding every value twice, at slot i and i + capacity, so
+the most recent samples of a column are always one contiguous block that is
+returned as a memoryview without copying.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+import math
+
+# Column names, a column key is (name, channel number or pitmaster id).
+TEMP = "temp"
+PITMASTER_VALUE = "pitmaster_value"
+PITMASTER_SET = "pitmaster_set"
+RSSI = ("rssi", 0)
+
+_NAN = math.nan
+
+
+class HistoryBuffer:
+    """
+    Fixed size columnar ring buffer of timestamped samples.
+    Missing values (e.g. a channel without probe) are NaN. Columns for new
+    keys are created on first use and are NaN for the earlier samples.
+    """
+    __slots__ = ("capacity", "_times", "_columns", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Args:
+            capacity: Number of samples kept per column.
+        """
+        self.capacity = capacity
+        self._times = self._new_column()
+        self._columns: dict[tuple[str, int], array] = {}
+        # Slot of the next sample and the number of samples stored.
+        self._next = 0
+        self._size = 0
+
+    def _new_column(self) -> array:
+        return array("d", [_NAN]) * (2 * self.capacity)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def keys(self):
+        return self._columns.keys()
+
+    @property
+    def last_time(self) -> float | None:
+        """
+        Return the timestamp of the newest sample, or None if empty.
+        """
+        if not self._size:
+            return None
+        return self._times[self._next - 1 + self.capacity]
+
+    def clear(self) -> None:
+        """
+        Drop all samples and columns.
+        """
+        self._times = self._new_column()
+        self._columns.clear()
+        self._next = 0
+        self._size = 0
+
+    def append(self, timestamp: float, values: dict[tuple[str, int], float]) -> None:
+        """
+        Add a sample to all columns.
+        Args:
+            timestamp: Time of the sample in seconds, increasing.
+            values: Values by column key, columns not included get NaN.
+        """
+        i = self._next
+        j = i + self.capacity
+        self._times[i] = self._times[j] = timestamp
+        columns = self._columns
+        for key, column in columns.items():
+            column[i] = column[j] = values.get(key, _NAN)
+        if not columns.keys() >= values.keys():
+            for key, value in values.items():
+                if key not in columns:
+                    column = columns[key] = self._new_column()
+                    column[i] = column[j] = value
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _slice(self, column: array, count: int | None) -> memoryview:
+        size = self._size
+        count = size if count is None else min(count, size)
+        end = self._next + self.capacity
+        return memoryview(column)[end - count:end]
+
+    def times(self, count: int | None = None) -> memoryview:
+        """
+        Return the timestamps of the newest count samples, oldest first.
+        """
+        return self._slice(self._times, count)
+
+    def column(self, key: tuple[str, int], count: int | None = None) -> memoryview | None:
+        """
+        Return the newest count values of a column, oldest first.
+        The view shares the buffer and is only valid until the next append.
+        Args:
+            key: Column key.
+            count: Number of samples, all by default.
+        Returns:
+            View of the values, or None for an unknown column.
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return None
+        return self._slice(column, count)
+
+    def count_since(self, seconds: float) -> int:
+        """
+        Return the number of samples within the last seconds before the newest one.
+        """
+        if not self._size:
+            return 0
+        times = self.times()
+        return len(times) - bisect_left(times, times[-1] - seconds)
@@ -8,7 +8,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from typing import Any
-from .const import DOMAIN
+from .const import DOMAIN, UPDATE_CHANNEL
 
 
 
@@ -68,7 +68,7 @@ class WlanthermoChannelColorLight(CoordinatorEntity, LightEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_CHANNEL, channel.number))
         self._channel_number = channel.number
         self._attr_translation_key = "channel_color"
         self._attr_translation_placeholders = {
@@ -85,10 +85,8 @@ class WlanthermoChannelColorLight(CoordinatorEntity, LightEntity):
         Returns:
             Channel object or None if not found.
         """
-        for ch in getattr(self.coordinator.data, "channels", []):
-            if ch.number == self._channel_number:
-                return ch
-        return None
+        data = self.coordinator.data
+        return data.get_channel(self._channel_number) if data else None
 
     @property
     def available(self) -> bool:
@@ -149,18 +147,7 @@ class WlanthermoChannelColorLight(CoordinatorEntity, LightEntity):
             color = f"#{r:02X}{g:02X}{b:02X}"
         else:
             color = channel.color
-        payload = {
-            "number": channel.number,
-            "name": channel.name,
-            "typ": channel.typ,
-            "temp": channel.temp,
-            "min": channel.min,
-            "max": channel.max,
-            "alarm": channel.alarm,
-            "color": color,
-        }
-        result = await self.coordinator.api.async_set_channel(payload)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_channel_fields(channel.number, color=color)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """
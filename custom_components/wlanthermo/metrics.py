@@ -0,0 +1,157 @@
+"""
+Derived per-channel values for WLANThermo.
+Computed by the coordinator once per new /data sample for all channels
+together from the history buffer, so the entities only read the results.
+"""
+
+from __future__ import annotations
+
+from operator import attrgetter
+
+from .data import Channel, WlanthermoData
+from .estimator import NOT_CONNECTED, TimeLeftEstimator, create_estimator
+from .history import TEMP, HistoryBuffer
+
+
+class ChannelMetrics:
+    """
+    Derived values of one channel.
+    Temperatures and deltas are None while the channel has no probe.
+    """
+    __slots__ = (
+        "estimator",
+        "rate_per_minute",
+        "smoothed_temp",
+        "delta_to_max",
+        "delta_to_min",
+        "threshold_crossed_at",
+    )
+
+    def __init__(self, estimator: TimeLeftEstimator) -> None:
+        self.estimator = estimator
+        self.rate_per_minute: float | None = None
+        self.smoothed_temp: float | None = None
+        self.delta_to_max: float | None = None
+        self.delta_to_min: float | None = None
+        # Device time at which the temperature last crossed the min or max limit.
+        self.threshold_crossed_at: float | None = None
+
+
+# Values read by the metric sensors, compared to find the channels that changed.
+_SENSOR_VALUES = attrgetter(
+    "rate_per_minute", "smoothed_temp", "delta_to_max", "delta_to_min", "threshold_crossed_at"
+)
+
+
+class ChannelMetricsPipeline:
+    """
+    Computes the derived values of all channels of a device.
+    The rate of rise comes from the channel's time left estimator, so both
+    use the engine chosen in the options.
+    """
+
+    def __init__(self, engine: str, window: float, smoothing: float) -> None:
+        """
+        Args:
+            engine: Time left engine name.
+            window: Window or time constant of the estimators in seconds.
+            smoothing: Seconds of history averaged for the smoothed temperature.
+        """
+        self.engine = engine
+        self.window = window
+        self.smoothing = smoothing
+        self.channels: dict[int, ChannelMetrics] = {}
+
+    def get(self, number: int) -> ChannelMetrics | None:
+        return self.channels.get(number)
+
+    def set_engine(self, engine: str, history: HistoryBuffer) -> None:
+        """
+        Switch all channels to another time left engine.
+        The new estimators are fed the recorded temperatures, so they answer
+        right away instead of after a new window.
+        Args:
+            engine: Time left engine name.
+            history: History buffer of the device.
+        """
+        self.engine = engine
+        times = history.times()
+        for number, metrics in self.channels.items():
+            estimator = create_estimator(engine, self.window)
+            temps = history.column((TEMP, number))
+            if temps is not None:
+                for end in range(1, len(times) + 1):
+                    estimator.add(times[:end], temps[:end])
+            metrics.estimator = estimator
+            rate = estimator.rate
+            metrics.rate_per_minute = round(rate * 60, 2) if rate is not None else None
+
+    def update(self, history: HistoryBuffer, data: WlanthermoData) -> set[int]:
+        """
+        Update all channels with the newest sample of the history buffer.
+        Args:
+            history: History buffer the sample was just appended to.
+            data: Data the sample was taken from.
+        Returns:
+            Numbers of the channels whose sensor values changed.
+        """
+        times = history.times()
+        # One window length for all channels, the views do not copy. At least
+        # two samples, the previous one is needed for the threshold crossing.
+        count = max(history.count_since(self.smoothing), 2)
+        channels = self.channels
+        changed = set()
+        for channel in data.channels:
+            number = channel.number
+            metrics = channels.get(number)
+            if metrics is None:
+                metrics = channels[number] = ChannelMetrics(
+                    create_estimator(self.engine, self.window)
+                )
+            previous = _SENSOR_VALUES(metrics)
+            self._update_channel(metrics, channel, history, times, count)
+            if _SENSOR_VALUES(metrics) != previous:
+                changed.add(number)
+        return changed
+
+    @staticmethod
+    def _update_channel(
+        metrics: ChannelMetrics,
+        channel: Channel,
+        history: HistoryBuffer,
+        times: memoryview,
+        count: int,
+    ) -> None:
+        """
+        Update the derived values of one channel with the newest sample.
+        """
+        number = channel.number
+        temp = channel.temp
+        temps = history.column((TEMP, number))
+        estimator = metrics.estimator
+        estimator.add(times, temps)
+        if temp == NOT_CONNECTED:
+            metrics.rate_per_minute = None
+            metrics.smoothed_temp = None
+            metrics.delta_to_max = None
+            metrics.delta_to_min = None
+            return
+        rate = estimator.rate
+        metrics.rate_per_minute = round(rate * 60, 2) if rate is not None else None
+        metrics.delta_to_max = round(channel.max - temp, 1)
+        metrics.delta_to_min = round(temp - channel.min, 1)
+        temps = temps[-count:]
+        total = sum(temps)
+        if total == total:
+            metrics.smoothed_temp = round(total / len(temps), 1)
+        else:
+            # The probe was connected within the window.
+            valid = [value for value in temps if value == value]
+            metrics.smoothed_temp = round(sum(valid) / len(valid), 1)
+        if len(temps) >= 2:
+            previous = temps[-2]
+            if previous == previous and (
+                (previous < channel.max) != (temp < channel.max)
+                or (previous > channel.min) != (temp > channel.min)
+            ):
+                metrics.threshold_crossed_at = times[-1]
@@ -8,7 +8,13 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import EntityCategory
 
 from typing import Any
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    UPDATE_CHANNEL,
+    UPDATE_PID,
+    UPDATE_PITMASTER,
+    UPDATE_SETTINGS,
+)
 
 CHANNEL_NUMBER_FIELDS = [
     # Defines which channel fields are exposed as number entities
@@ -53,6 +59,14 @@ PITMASTER_NUMBER_FIELDS = [
         "unit": "°C",
     },
 ]
+# PIDConfig attribute for each PID profile number field
+PID_FIELD_ATTRS = {
+    "jp": "jp",
+    "dcmmin": "DCmmin",
+    "dcmmax": "DCmmax",
+    "spmin": "SPmin",
+    "spmax": "SPmax",
+}
 ICON_MAP = {
     "jp": "mdi:rocket-launch",
     "dcmmin": "mdi:cosine-wave",
@@ -175,7 +189,7 @@ class WlanthermoChannelNumber(CoordinatorEntity, NumberEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_CHANNEL, channel.number))
         self._channel_number = channel.number
         self._field = field
         self._attr_has_entity_name = True
@@ -201,11 +215,8 @@ class WlanthermoChannelNumber(CoordinatorEntity, NumberEntity):
         Returns:
             Channel object or None if not found.
         """
-        channels = getattr(self.coordinator.data, 'channels', [])
-        for ch in channels:
-            if ch.number == self._channel_number:
-                return ch
-        return None
+        data = self.coordinator.data
+        return data.get_channel(self._channel_number) if data else None
 
     async def async_set_native_value(self, value: float) -> None:
         """
@@ -218,18 +229,9 @@ class WlanthermoChannelNumber(CoordinatorEntity, NumberEntity):
         channel = self._get_channel()
         if not channel:
             return
-        channel_data = {
-            "number": channel.number,
-            "name": channel.name,
-            "typ": channel.typ,
-            "temp": channel.temp,
-            "min": value if self._field["key"] == "min" else channel.min,
-            "max": value if self._field["key"] == "max" else channel.max,
-            "alarm": channel.alarm,
-            "color": channel.color,
-        }
-        result = await self.coordinator.api.async_set_channel(channel_data)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_channel_fields(
+            channel.number, **{self._field["key"]: value}
+        )
 
     @property
     def native_value(self) -> float | None:
@@ -266,7 +268,7 @@ class WlanthermoPitmasterNumber(CoordinatorEntity, NumberEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PITMASTER, pitmaster.id))
         self._pitmaster_id = pitmaster.id
         self._field = field
         self._attr_has_entity_name = True
@@ -292,11 +294,8 @@ class WlanthermoPitmasterNumber(CoordinatorEntity, NumberEntity):
         Returns:
             Pitmaster object or None if not found.
         """
-        pitmasters = getattr(self.coordinator.data, 'pitmasters', [])
-        for pm in pitmasters:
-            if pm.id == self._pitmaster_id:
-                return pm
-        return None
+        data = self.coordinator.data
+        return data.get_pitmaster(self._pitmaster_id) if data else None
 
     async def async_set_native_value(self, value: float) -> None:
         """
@@ -309,16 +308,9 @@ class WlanthermoPitmasterNumber(CoordinatorEntity, NumberEntity):
         pitmaster = self._get_pitmaster()
         if not pitmaster:
             return
-        pitmaster_data = {
-            "id": pitmaster.id,
-            "channel": pitmaster.channel,
-            "pid": pitmaster.pid,
-            "value": value if self._field["key"] == "value" else pitmaster.value,
-            "set": value if self._field["key"] == "set" else pitmaster.set,
-            "typ": pitmaster.typ,
-        }
-        result = await self.coordinator.api.async_set_pitmaster(pitmaster_data)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_pitmaster_fields(
+            pitmaster.id, **{self._field["key"]: value}
+        )
 
     @property
     def native_value(self) -> float | None:
@@ -370,9 +362,10 @@ class WlanthermoPidProfileNumber(CoordinatorEntity, NumberEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PID, profile_id))
         self._profile_id = profile_id
         self._field = field
+        self._profile_attr = PID_FIELD_ATTRS.get(field, field)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pid_{profile_id}_{field}"
         )
@@ -388,6 +381,15 @@ class WlanthermoPidProfileNumber(CoordinatorEntity, NumberEntity):
         self._attr_native_step = 1
 
 
+    def _get_profile(self) -> Any:
+        """
+        Helper to get the current PID profile object from the API settings.
+        Returns:
+            PIDConfig object or None if not found.
+        """
+        settings = self.coordinator.api.settings
+        return settings.get_pid(self._profile_id) if settings else None
+
     @property
     def native_value(self) -> float | None:
         """
@@ -395,10 +397,8 @@ class WlanthermoPidProfileNumber(CoordinatorEntity, NumberEntity):
         Returns:
             The value of the field, or None if unavailable.
         """
-        for profile in getattr(self.coordinator.api.settings, "pid", []):
-            if profile.id == self._profile_id:
-                return getattr(profile, self._field, None)
-        return None
+        profile = self._get_profile()
+        return getattr(profile, self._profile_attr, None) if profile else None
 
     async def async_set_native_value(self, value: float) -> None:
         """
@@ -408,16 +408,12 @@ class WlanthermoPidProfileNumber(CoordinatorEntity, NumberEntity):
         Returns:
             None.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                setattr(p, self._field, value)
-                payload = p.to_full_payload()
-                success = await self.coordinator.api.async_set_pid_profile(
-                    [payload],
-                )
-                if success:
-                    await self.coordinator.async_request_refresh()
-                return
+        p = self._get_profile()
+        if not p:
+            return
+        await self.coordinator.async_set_pid_fields(
+            p.id, **{self._profile_attr: int(value)}
+        )
 
     @property
     def available(self) -> bool:
@@ -426,10 +422,8 @@ class WlanthermoPidProfileNumber(CoordinatorEntity, NumberEntity):
         Returns:
             True if available, False otherwise.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                return p.supports_field(self._field)
-        return False
+        p = self._get_profile()
+        return p.supports_field(self._profile_attr) if p else False
     
 
 class WlanthermoIotNumber(CoordinatorEntity, NumberEntity):
@@ -441,7 +435,7 @@ class WlanthermoIotNumber(CoordinatorEntity, NumberEntity):
     _attr_mode = NumberMode.BOX
 
     def __init__(self, coordinator, entry_data: dict, field: str, min_value: int, max_value: int) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._field = field
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_iot_{field.lower()}"
         self._attr_device_info = entry_data["device_info"]
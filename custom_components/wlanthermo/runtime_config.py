@@ -0,0 +1,81 @@
+"""
+Runtime configuration of a WLANThermo config entry.
+The entry data and options are resolved once into an immutable object.
+Entities read it from the coordinator, and an options update replaces it
+as a whole.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    CONF_PATH_PREFIX,
+    DEFAULT_CONFIG_SCAN_INTERVAL,
+    DEFAULT_TIME_LEFT_ENGINE,
+    TIME_LEFT_ENGINES,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """
+    Options of a config entry, with the options taking precedence over the data.
+    """
+    host: str
+    port: int
+    path_prefix: str
+    auth_required: bool
+    username: str | None
+    password: str | None
+    device_name: str
+    scan_interval: int
+    config_scan_interval: int
+    show_inactive_unavailable: bool
+    time_left_engine: str
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> RuntimeConfig:
+        """
+        Resolve the configuration of a config entry.
+        Args:
+            entry: Config entry for the integration.
+        Returns:
+            RuntimeConfig instance.
+        """
+        values = {**entry.data, **entry.options}
+        auth_required = bool(values.get("auth_required", False))
+        time_left_engine = values.get("time_left_engine", DEFAULT_TIME_LEFT_ENGINE)
+        if time_left_engine not in TIME_LEFT_ENGINES:
+            time_left_engine = DEFAULT_TIME_LEFT_ENGINE
+        return cls(
+            host=values.get("host"),
+            port=values.get("port", 80),
+            path_prefix=values.get(CONF_PATH_PREFIX, "/"),
+            auth_required=auth_required,
+            username=values.get("username") if auth_required else None,
+            password=values.get("password") if auth_required else None,
+            # Only set up in the user step, not an option.
+            device_name=entry.data.get("device_name", "WLANThermo"),
+            scan_interval=values.get("scan_interval", 10),
+            config_scan_interval=values.get("config_scan_interval", DEFAULT_CONFIG_SCAN_INTERVAL),
+            show_inactive_unavailable=bool(values.get("show_inactive_unavailable", True)),
+            time_left_engine=time_left_engine,
+        )
+
+    def requires_reload(self, other: RuntimeConfig) -> bool:
+        """
+        Return True if changing to other needs a reload of the entry, i.e. the
+        connection or the device changed. The other options are applied in place.
+        """
+        return (
+            self.host != other.host
+            or self.port != other.port
+            or self.path_prefix != other.path_prefix
+            or self.auth_required != other.auth_required
+            or self.username != other.username
+            or self.password != other.password
+            or self.device_name != other.device_name
+        )
@@ -7,7 +7,16 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.components.select import SelectEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    UPDATE_CHANNEL,
+    UPDATE_CHANNELS,
+    UPDATE_PID,
+    UPDATE_PID_PROFILES,
+    UPDATE_PITMASTER,
+    UPDATE_PITMASTER_TYPES,
+    UPDATE_PUSH,
+)
 from typing import Any
 import logging
 _LOGGER = logging.getLogger(__name__)
@@ -219,7 +228,7 @@ class WlanthermoChannelSelect(CoordinatorEntity, SelectEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_CHANNEL, channel.number))
         self._channel_number = channel.number
         self._field = field
         self._attr_has_entity_name = True
@@ -244,11 +253,8 @@ class WlanthermoChannelSelect(CoordinatorEntity, SelectEntity):
         Returns:
             Channel object or None if not found.
         """
-        channels = getattr(self.coordinator.data, 'channels', [])
-        for ch in channels:
-            if ch.number == self._channel_number:
-                return ch
-        return None
+        data = self.coordinator.data
+        return data.get_channel(self._channel_number) if data else None
 
     async def async_select_option(self, option: str) -> None:
         """
@@ -268,18 +274,9 @@ class WlanthermoChannelSelect(CoordinatorEntity, SelectEntity):
             value = self._attr_options.index(option)
         elif self._field["key"] == "typ":
             value = self._field["sensor_type_map"][option]
-        channel_data = {
-            "number": channel.number,
-            "name": channel.name,
-            "typ": value if self._field["key"] == "typ" else channel.typ,
-            "temp": channel.temp,
-            "min": channel.min,
-            "max": channel.max,
-            "alarm": value if self._field["key"] == "alarm" else channel.alarm,
-            "color": channel.color,
-        }
-        await self.coordinator.api.async_set_channel(channel_data)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_channel_fields(
+            channel.number, **{self._field["key"]: value}
+        )
 
     @property
     def current_option(self) -> str | None:
@@ -335,7 +332,15 @@ class WlanthermoPitmasterSelect(CoordinatorEntity, SelectEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset({
+                (UPDATE_PITMASTER, pitmaster.id),
+                UPDATE_CHANNELS,
+                UPDATE_PID_PROFILES,
+                UPDATE_PITMASTER_TYPES,
+            }),
+        )
         self._pitmaster_id = pitmaster.id
         self._field = field
         self._channel_options = channel_options or []
@@ -358,10 +363,8 @@ class WlanthermoPitmasterSelect(CoordinatorEntity, SelectEntity):
         Returns:
             Pitmaster object or None if not found.
         """
-        for pm in getattr(self.coordinator.data, "pitmasters", []):
-            if pm.id == self._pitmaster_id:
-                return pm
-        return None
+        data = self.coordinator.data
+        return data.get_pitmaster(self._pitmaster_id) if data else None
     
     @property
     def options(self) -> list[str]:
@@ -396,13 +399,12 @@ class WlanthermoPitmasterSelect(CoordinatorEntity, SelectEntity):
         if self._field["key"] == "typ":
             return pitmaster.typ
         if self._field["key"] == "pid":
-            for p in getattr(self.coordinator.api.settings, "pid", []):
-                if p.id == pitmaster.pid:
-                    return p.name
+            settings = self.coordinator.api.settings
+            profile = settings.get_pid(pitmaster.pid) if settings else None
+            return profile.name if profile else None
         if self._field["key"] == "channel":
-            for ch in getattr(self.coordinator.data, "channels", []):
-                if ch.number == pitmaster.channel:
-                    return ch.name
+            channel = self.coordinator.data.get_channel(pitmaster.channel)
+            return channel.name if channel else None
         return None
 
     async def async_select_option(self, option: str) -> None:
@@ -417,28 +419,20 @@ class WlanthermoPitmasterSelect(CoordinatorEntity, SelectEntity):
         pitmaster = self._get_pitmaster()
         if not pitmaster:
             return
-        data = {
-            "id": pitmaster.id,
-            "channel": pitmaster.channel,
-            "pid": pitmaster.pid,
-            "value": pitmaster.value,
-            "set": pitmaster.set,
-            "typ": pitmaster.typ,
-        }
+        fields = {}
         if self._field["key"] == "typ":
-            data["typ"] = option
+            fields["typ"] = option
         elif self._field["key"] == "pid":
             for p in getattr(self.coordinator.api.settings, "pid", []):
                 if p.name == option:
-                    data["pid"] = p.id
+                    fields["pid"] = p.id
                     break
         elif self._field["key"] == "channel":
             for ch in getattr(self.coordinator.data, "channels", []):
                 if ch.name == option:
-                    data["channel"] = ch.number
+                    fields["channel"] = ch.number
                     break
-        await self.coordinator.api.async_set_pitmaster(data)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_pitmaster_fields(pitmaster.id, **fields)
 
 class WlanthermoPidProfileSelect(CoordinatorEntity, SelectEntity):
     _attr_has_entity_name = True
@@ -471,7 +465,7 @@ class WlanthermoPidProfileSelect(CoordinatorEntity, SelectEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PID, pid_profile.id))
         self._profile_id = pid_profile.id
         self._key = key
         self._value_map = value_map
@@ -487,6 +481,15 @@ class WlanthermoPidProfileSelect(CoordinatorEntity, SelectEntity):
             "profile_id": str(pid_profile.id),
         }
 
+    def _get_profile(self) -> Any:
+        """
+        Helper to get the current PID profile object from the API settings.
+        Returns:
+            PIDConfig object or None if not found.
+        """
+        settings = self.coordinator.api.settings
+        return settings.get_pid(self._profile_id) if settings else None
+
     @property
     def current_option(self) -> str | None:
         """
@@ -494,10 +497,8 @@ class WlanthermoPidProfileSelect(CoordinatorEntity, SelectEntity):
         Returns:
             The selected option string, or None if unavailable.
         """
-        for p in getattr(self.coordinator.api.settings, "pid", []):
-            if p.id == self._profile_id:
-                return self._reverse_map.get(getattr(p, self._key), None)
-        return None
+        p = self._get_profile()
+        return self._reverse_map.get(getattr(p, self._key), None) if p else None
 
     @property
     def available(self) -> bool:
@@ -506,10 +507,7 @@ class WlanthermoPidProfileSelect(CoordinatorEntity, SelectEntity):
         Returns:
             True if available, False otherwise.
         """
-        return any(
-            p.id == self._profile_id
-            for p in getattr(self.coordinator.api.settings, "pid", [])
-        )
+        return self._get_profile() is not None
 
     async def async_select_option(self, option: str) -> None:
         """
@@ -521,16 +519,10 @@ class WlanthermoPidProfileSelect(CoordinatorEntity, SelectEntity):
             None.
         """
         value = self._value_map[option]
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                setattr(p, self._key, value)
-                payload = p.to_full_payload()
-                success = await self.coordinator.api.async_set_pid_profile(
-                    [payload]
-                )
-                if success:
-                    await self.coordinator.async_request_refresh()
-                return
+        p = self._get_profile()
+        if not p:
+            return
+        await self.coordinator.async_set_pid_fields(p.id, **{self._key: value})
 
 
 class WlanthermoPushoverPrioritySelect(CoordinatorEntity, SelectEntity):
@@ -541,7 +533,7 @@ class WlanthermoPushoverPrioritySelect(CoordinatorEntity, SelectEntity):
     _attr_options = ["normal", "high", "emergency"]
 
     def __init__(self, coordinator, entry_data):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pushover_priority"
         )
@@ -566,10 +558,9 @@ class WlanthermoPushoverPrioritySelect(CoordinatorEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         pushover = self.coordinator.data.push.pushover
-        pushover.priority = PUSHOVER_PRIORITY_MAP[option]
-
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         success = await self.coordinator.api.async_set_push({
-            "pushover": pushover.to_payload(),
+            "pushover": {**pushover.to_payload(), "priority": PUSHOVER_PRIORITY_MAP[option]},
         })
 
         if success:
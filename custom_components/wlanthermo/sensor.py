@@ -25,15 +25,69 @@ from homeassistant.const import (
 )
 
 from homeassistant.core import callback
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    MIN_VALID_DEVICE_TIME,
+    UPDATE_CHANNEL,
+    UPDATE_CHANNELS,
+    UPDATE_METRICS,
+    UPDATE_PITMASTER,
+    UPDATE_SETTINGS,
+    UPDATE_SYSTEM,
+)
 from .data import WlanthermoData
 from typing import Any
-from datetime import timedelta, datetime
+from datetime import timedelta, datetime, timezone
 import logging
-import collections
 
 _LOGGER = logging.getLogger(__name__)
 
+CHANNEL_METRIC_SENSORS = [
+    # Derived channel values, computed by the coordinator for all channels once per update.
+    # Most are disabled by default, there is one of each per channel.
+    {
+        "key": "rate_per_minute",
+        "translation_key": "channel_rate",
+        "icon": "mdi:trending-up",
+        "unit": "°C/min",
+        "device_class": None,
+        "enabled_default": False,
+    },
+    {
+        "key": "smoothed_temp",
+        "translation_key": "channel_smoothed_temperature",
+        "icon": "mdi:thermometer-lines",
+        "unit": UnitOfTemperature.CELSIUS,
+        "device_class": SensorDeviceClass.TEMPERATURE,
+        "enabled_default": False,
+    },
+    {
+        # Differences have no device class, it would convert them like absolute temperatures.
+        "key": "delta_to_max",
+        "translation_key": "channel_delta_to_max",
+        "icon": "mdi:thermometer-chevron-up",
+        "unit": UnitOfTemperature.CELSIUS,
+        "device_class": None,
+        "enabled_default": False,
+    },
+    {
+        "key": "delta_to_min",
+        "translation_key": "channel_delta_to_min",
+        "icon": "mdi:thermometer-chevron-down",
+        "unit": UnitOfTemperature.CELSIUS,
+        "device_class": None,
+        "enabled_default": False,
+    },
+    {
+        "key": "threshold_crossed_at",
+        "translation_key": "channel_threshold_crossed",
+        "icon": "mdi:bell-alert-outline",
+        "unit": None,
+        "device_class": SensorDeviceClass.TIMESTAMP,
+        "enabled_default": True,
+    },
+]
+
 async def async_setup_entry(hass: Any, config_entry: Any, async_add_entities: Any) -> None:
     """
     Set up all sensor entities for the WLANThermo integration.
@@ -71,6 +125,10 @@ async def async_setup_entry(hass: Any, config_entry: Any, async_add_entities: An
                     WlanthermoChannelTemperatureSensor(coordinator, ch_id, entry_data),
                     WlanthermoChannelTimeLeftSensor(coordinator, ch_id, entry_data),
                 ])
+                new_entities.extend(
+                    WlanthermoChannelMetricSensor(coordinator, ch_id, entry_data, description)
+                    for description in CHANNEL_METRIC_SENSORS
+                )
                 entity_store["channels"].add(ch_id)
         # Pitmasters.
         for pitmaster in getattr(coordinator.data, "pitmasters", []):
@@ -131,7 +189,7 @@ class WlanthermoChannelTemperatureSensor(CoordinatorEntity, SensorEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_CHANNEL, channel_number))
         self._channel_number = channel_number
         self._attr_has_entity_name = True
         self._attr_translation_key = "channel_temperature"
@@ -154,10 +212,7 @@ class WlanthermoChannelTemperatureSensor(CoordinatorEntity, SensorEntity):
         """
         if not self.coordinator.data:
             return None
-        for ch in self.coordinator.data.channels:
-            if ch.number == self._channel_number:
-                return ch
-        return None
+        return self.coordinator.data.get_channel(self._channel_number)
 
     @property
     def native_value(self) -> float | None:
@@ -172,12 +227,7 @@ class WlanthermoChannelTemperatureSensor(CoordinatorEntity, SensorEntity):
         temp = getattr(channel, "temp", None)
         if temp is None:
             return None  # No temperature data available.
-        show_inactive = self.coordinator.config_entry.options.get(
-            "show_inactive_unavailable",
-            self.coordinator.config_entry.data.get(
-                "show_inactive_unavailable", True
-            )
-        )
+        show_inactive = self.coordinator.config.show_inactive_unavailable
         if temp == 999.0 and show_inactive:
             return None
         return temp
@@ -198,12 +248,7 @@ class WlanthermoChannelTemperatureSensor(CoordinatorEntity, SensorEntity):
         channel = self._get_channel()
         if not channel:
             return False
-        show_inactive = (
-            self.coordinator.config_entry.options.get(
-                "show_inactive_unavailable",
-                self.coordinator.config_entry.data.get("show_inactive_unavailable", True)
-            )
-        )
+        show_inactive = self.coordinator.config.show_inactive_unavailable
         temp = getattr(channel, "temp", None)
         if temp == 999.0 and show_inactive:
             return False
@@ -213,23 +258,30 @@ class WlanthermoChannelTemperatureSensor(CoordinatorEntity, SensorEntity):
 class WlanthermoChannelTimeLeftSensor(CoordinatorEntity, SensorEntity):
     """
     Sensor entity estimating time left until the channel reaches its max temperature.
-    Uses a moving window to estimate rate of temperature change.
+    The estimator is fed by the coordinator once per device update with the
+    engine chosen in the options, reading the value has no side effects. The
+    rate, confidence and stall state are exposed as attributes.
     """
-    def __init__(self, coordinator: Any, channel_number: int, entry_data: dict, window_seconds: int = 300) -> None:
+    # Change with every update and would bloat the recorder database.
+    _unrecorded_attributes = frozenset(
+        {"rate_per_minute", "rate_stddev_per_minute", "confidence", "stall_minutes"}
+    )
+
+    def __init__(self, coordinator: Any, channel_number: int, entry_data: dict) -> None:
         """
         Initialize a WlanthermoChannelTimeLeftSensor entity.
         Args:
             coordinator: Data update coordinator.
             channel_number: Channel number for this sensor.
             entry_data: Dictionary with entry data.
-            window_seconds: Window in seconds for moving average.
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset({(UPDATE_CHANNEL, channel_number), UPDATE_SYSTEM}),
+        )
         self._channel_number = channel_number
-        self._window_seconds = window_seconds
-        self._history = collections.deque(maxlen=60)
         self._attr_device_info = entry_data["device_info"]
         self._attr_has_entity_name = True
         self._attr_translation_key = "channel_time_left"
@@ -248,47 +300,31 @@ class WlanthermoChannelTimeLeftSensor(CoordinatorEntity, SensorEntity):
         """
         if not self.coordinator.data:
             return None
-        for ch in self.coordinator.data.channels:
-            if ch.number == self._channel_number:
-                return ch
-        return None
-    
+        return self.coordinator.data.get_channel(self._channel_number)
+
     @property
     def native_value(self) -> float | None:
         """
         Estimate the time left (in minutes) until the channel reaches its max temperature.
-        Uses a moving window of recent temperature readings to calculate the rate of change.
         Returns:
             Estimated time left in minutes, or None if not enough data.
         """
-        import time
         channel = self._get_channel()
-        if not self.available or not channel:
-            return None
-        now = time.time()
-        temp = getattr(channel, "temp", None)
-        if temp is None:
+        metrics = self.coordinator.metrics.get(self._channel_number)
+        if not self.available or not channel or metrics is None:
             return None
-        # Add current reading to history.
-        self._history.append((now, temp))
-        window_start = now - self._window_seconds
-        # Only consider readings within the time window.
-        recent = [x for x in self._history if x[0] >= window_start]
-        if len(recent) < 2:
-            return None
-        dt = recent[-1][0] - recent[0][0]
-        dtemp = recent[-1][1] - recent[0][1]
-        if dt <= 0 or dtemp <= 0:
-            return 0
-        rate_per_sec = dtemp / dt
-        target = getattr(channel, "max", None)
-        if target is None:
-            return None
-        # Time left in minutes.
-        time_left_min = (target - temp) / (rate_per_sec * 60)
-        return round(max(time_left_min, 0), 2)
+        return metrics.estimator.time_left(channel.temp, channel.max)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """
+        Return the engine, rate, confidence and stall state of the estimate.
+        """
+        metrics = self.coordinator.metrics.get(self._channel_number)
+        if metrics is None:
+            return {"engine": self.coordinator.metrics.engine}
+        return {"engine": self.coordinator.metrics.engine, **metrics.estimator.attributes()}
 
-    
     @property
     def available(self) -> bool:
         """
@@ -304,18 +340,85 @@ class WlanthermoChannelTimeLeftSensor(CoordinatorEntity, SensorEntity):
         channel = self._get_channel()
         if not channel:
             return False
-        show_inactive = (
-            self.coordinator.config_entry.options.get(
-                "show_inactive_unavailable",
-                self.coordinator.config_entry.data.get("show_inactive_unavailable", True)
-            )
-        )
+        show_inactive = self.coordinator.config.show_inactive_unavailable
         temp = getattr(channel, "temp", None)
         if temp == 999.0 and show_inactive:
             return False
         return True
 
 
+class WlanthermoChannelMetricSensor(CoordinatorEntity, SensorEntity):
+    """
+    Sensor entity for a derived channel value (rate, smoothed temperature,
+    distance to the limits, last limit crossing).
+    The values are computed by the coordinator, see metrics.py.
+    """
+    def __init__(self, coordinator: Any, channel_number: int, entry_data: dict, description: dict) -> None:
+        """
+        Initialize a WlanthermoChannelMetricSensor entity.
+        Args:
+            coordinator: Data update coordinator.
+            channel_number: Channel number for this sensor.
+            entry_data: Dictionary with entry data.
+            description: Entry of CHANNEL_METRIC_SENSORS.
+        Returns:
+            None.
+        """
+        # The values change with every new sample, the availability with the channel.
+        super().__init__(
+            coordinator,
+            context=frozenset({(UPDATE_CHANNEL, channel_number), (UPDATE_METRICS, channel_number)}),
+        )
+        self._channel_number = channel_number
+        self._key = description["key"]
+        self._attr_device_info = entry_data["device_info"]
+        self._attr_has_entity_name = True
+        self._attr_translation_key = description["translation_key"]
+        self._attr_translation_placeholders = {"channel_number": str(channel_number)}
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_channel_{channel_number}_{self._key}"
+        )
+        self._attr_icon = description["icon"]
+        self._attr_device_class = description["device_class"]
+        self._attr_native_unit_of_measurement = description["unit"]
+        self._attr_entity_registry_enabled_default = description["enabled_default"]
+        if description["device_class"] != SensorDeviceClass.TIMESTAMP:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | datetime | None:
+        """
+        Return the derived value, or None without probe or enough samples.
+        """
+        metrics = self.coordinator.metrics.get(self._channel_number)
+        if metrics is None:
+            return None
+        value = getattr(metrics, self._key)
+        if value is not None and self._attr_device_class == SensorDeviceClass.TIMESTAMP:
+            # Device time, meaningless until the device clock is synchronized.
+            if value < MIN_VALID_DEVICE_TIME:
+                return None
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+        return value
+
+    @property
+    def available(self) -> bool:
+        """
+        Return True if the device is online and the channel is available and not marked as inactive.
+        Returns:
+            True if available, False otherwise.
+        """
+        if not self.coordinator.last_update_success or not self.coordinator.data:
+            return False
+        channel = self.coordinator.data.get_channel(self._channel_number)
+        if not channel:
+            return False
+        show_inactive = self.coordinator.config.show_inactive_unavailable
+        if channel.temp == 999.0 and show_inactive:
+            return False
+        return True
+
+
 class WlanthermoSystemSensor(CoordinatorEntity, SensorEntity):
     """Overall system online/offline state."""
 
@@ -326,7 +429,7 @@ class WlanthermoSystemSensor(CoordinatorEntity, SensorEntity):
     _attr_options = ["offline", "online"]
 
     def __init__(self, coordinator, entry_data):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SYSTEM)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_status"
         self._attr_device_info = entry_data["device_info"]
 
@@ -382,7 +485,7 @@ class WlanthermoSystemGetUpdateSensor(CoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:cellphone-arrow-down"
 
     def __init__(self, coordinator, entry_data):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_getupdate"
         self._attr_device_info = entry_data["device_info"]
 
@@ -439,7 +542,7 @@ class WlanthermoCloudLinkSensor(CoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:link"
 
     def __init__(self, coordinator, entry_data):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({UPDATE_SYSTEM, UPDATE_SETTINGS}))
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_cloud_link"
         self._attr_device_info = entry_data["device_info"]
 
@@ -493,7 +596,7 @@ class WlanthermoSystemTimeSensor(CoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:clock"
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SYSTEM)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_time"
         self._attr_device_info = entry_data["device_info"]
 
@@ -536,7 +639,7 @@ class WlanthermoSystemUnitSensor(CoordinatorEntity, SensorEntity):
     _attr_options = ["C", "F"]
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SYSTEM)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_unit"
         self._attr_device_info = entry_data["device_info"]
 
@@ -569,7 +672,7 @@ class WlanthermoSystemSocSensor(CoordinatorEntity, SensorEntity):
     _attr_native_unit_of_measurement = PERCENTAGE
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SYSTEM)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_soc"
         self._attr_device_info = entry_data["device_info"]
 
@@ -598,7 +701,7 @@ class WlanthermoSystemChargeSensor(CoordinatorEntity, BinarySensorEntity):
     _attr_device_class = BinarySensorDeviceClass.BATTERY_CHARGING
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SYSTEM)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_charge"
         self._attr_device_info = entry_data["device_info"]
 
@@ -646,7 +749,7 @@ class WlanthermoSystemRssiSensor(CoordinatorEntity, SensorEntity):
     _attr_native_unit_of_measurement = "dBm"
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SYSTEM)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_rssi"
         self._attr_device_info = entry_data["device_info"]
 
@@ -683,7 +786,7 @@ class WlanthermoCloudOnlineSensor(CoordinatorEntity, SensorEntity):
     _attr_options = ["not_connected", "standby", "connected"]
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=frozenset({UPDATE_SYSTEM, UPDATE_SETTINGS}))
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_cloud_status"
         self._attr_device_info = entry_data["device_info"]
 
@@ -759,7 +862,7 @@ class WlanthermoDeviceInfoSensor(CoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:information"
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_device_info"
         self._attr_device_info = entry_data["device_info"]
 
@@ -818,7 +921,7 @@ class WlanthermoSystemInfoSensor(CoordinatorEntity, SensorEntity):
     _attr_icon = "mdi:cog-outline"
 
     def __init__(self, coordinator: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_system_info"
         self._attr_device_info = entry_data["device_info"]
 
@@ -876,17 +979,14 @@ class WlanthermoChannelSensor(CoordinatorEntity, SensorEntity):
     _attr_translation_key = "channel"
 
     def __init__(self, coordinator: Any, channel: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_CHANNEL, channel.number))
         self._channel_number = channel.number
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_channel_{channel.number}"
         self._attr_device_info = entry_data["device_info"]
 
     def _get_channel(self) -> Any:
-        channels = getattr(self.coordinator.data, "channels", [])
-        for ch in channels:
-            if ch.number == self._channel_number:
-                return ch
-        return None
+        data = self.coordinator.data
+        return data.get_channel(self._channel_number) if data else None
 
     @property
     def native_value(self) -> float | None:
@@ -931,17 +1031,14 @@ class WlanthermoPitmasterSensor(CoordinatorEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, coordinator: Any, pitmaster: Any, idx: int, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PITMASTER, pitmaster.id))
         self._pitmaster_id = pitmaster.id
         self._attr_name = f"Pitmaster {idx}"
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_pitmaster_{idx}"
         self._attr_device_info = entry_data["device_info"]
     def _get_pitmaster(self) -> Any:
-        pitmasters = getattr(self.coordinator.data, "pitmasters", [])
-        for pm in pitmasters:
-            if pm.id == self._pitmaster_id:
-                return pm
-        return None
+        data = self.coordinator.data
+        return data.get_pitmaster(self._pitmaster_id) if data else None
 
     @property
     def native_value(self) -> float | None:
@@ -986,7 +1083,7 @@ class WlanthermoPitmasterValueSensor(CoordinatorEntity, SensorEntity):
     _attr_native_unit_of_measurement = PERCENTAGE
 
     def __init__(self, coordinator: Any, pitmaster: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PITMASTER, pitmaster.id))
         self._pitmaster_id = pitmaster.id
         self._attr_translation_placeholders = {
             "pitmaster_number": str(pitmaster.id + 1)
@@ -997,10 +1094,8 @@ class WlanthermoPitmasterValueSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_info = entry_data["device_info"]
 
     def _get_pitmaster(self) -> Any:
-        for pm in getattr(self.coordinator.data, "pitmasters", []):
-            if pm.id == self._pitmaster_id:
-                return pm
-        return None
+        data = self.coordinator.data
+        return data.get_pitmaster(self._pitmaster_id) if data else None
 
     @property
     def native_value(self) -> float | None:
@@ -1026,7 +1121,14 @@ class WlanthermoPitmasterTemperatureSensor(CoordinatorEntity, SensorEntity):
     _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(self, coordinator: Any, pitmaster: Any, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator,
+            context=frozenset({
+                (UPDATE_PITMASTER, pitmaster.id),
+                UPDATE_CHANNELS,
+                UPDATE_SYSTEM,
+            }),
+        )
         self._pitmaster_id = pitmaster.id
         self._attr_translation_placeholders = {
             "pitmaster_number": str(pitmaster.id +1)
@@ -1037,16 +1139,13 @@ class WlanthermoPitmasterTemperatureSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_info = entry_data["device_info"]
 
     def _get_channel(self) -> Any:
-        pitmasters = getattr(self.coordinator.data, "pitmasters", [])
-        pm = next((p for p in pitmasters if p.id == self._pitmaster_id), None)
+        data = self.coordinator.data
+        if not data:
+            return None
+        pm = data.get_pitmaster(self._pitmaster_id)
         if not pm:
             return None
-
-        channels = getattr(self.coordinator.data, "channels", [])
-        return next(
-            (ch for ch in channels if ch.number == pm.channel),
-            None,
-        )
+        return data.get_channel(pm.channel)
 
     @property
     def native_value(self) -> float | None:
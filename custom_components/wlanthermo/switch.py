@@ -5,7 +5,7 @@ from typing import Any, Callable
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN
+from .const import DOMAIN, UPDATE_BLUETOOTH, UPDATE_PID, UPDATE_PUSH, UPDATE_SETTINGS
 
 async def async_setup_entry(hass: Any, config_entry: Any, async_add_entities: Callable) -> None:
     """
@@ -121,7 +121,7 @@ class WlanthermoPidProfileOplSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PID, profile_id))
         self._profile_id = profile_id
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pid_{profile_id}_opl"
@@ -132,6 +132,15 @@ class WlanthermoPidProfileOplSwitch(CoordinatorEntity, SwitchEntity):
             "profile_id": str(profile_id)
         }
 
+    def _get_profile(self) -> Any:
+        """
+        Helper to get the current PID profile object from the API settings.
+        Returns:
+            PIDConfig object or None if not found.
+        """
+        settings = self.coordinator.api.settings
+        return settings.get_pid(self._profile_id) if settings else None
+
     @property
     def is_on(self) -> bool:
         """
@@ -139,10 +148,8 @@ class WlanthermoPidProfileOplSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             True if enabled, False otherwise.
         """
-        for profile in getattr(self.coordinator.api.settings, "pid", []):
-            if profile.id == self._profile_id:
-                return bool(profile.opl)
-        return False
+        profile = self._get_profile()
+        return bool(profile.opl) if profile else False
 
     async def async_turn_on(self, **kwargs) -> None:
         """
@@ -172,16 +179,10 @@ class WlanthermoPidProfileOplSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             None.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                p.opl = value
-                payload = p.to_full_payload()
-                success = await self.coordinator.api.async_set_pid_profile(
-                    [payload],
-                )
-                if success:
-                    await self.coordinator.async_request_refresh()
-                return
+        p = self._get_profile()
+        if not p:
+            return
+        await self.coordinator.async_set_pid_fields(p.id, opl=value)
             
 
 class WlanthermoPidProfileLinkSwitch(CoordinatorEntity, SwitchEntity):
@@ -202,7 +203,7 @@ class WlanthermoPidProfileLinkSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PID, profile_id))
         self._profile_id = profile_id
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pid_{profile_id}_link"
@@ -213,6 +214,15 @@ class WlanthermoPidProfileLinkSwitch(CoordinatorEntity, SwitchEntity):
             "profile_id": str(profile_id)
         }
 
+    def _get_profile(self) -> Any:
+        """
+        Helper to get the current PID profile object from the API settings.
+        Returns:
+            PIDConfig object or None if not found.
+        """
+        settings = self.coordinator.api.settings
+        return settings.get_pid(self._profile_id) if settings else None
+
     @property
     def is_on(self) -> bool:
         """
@@ -220,10 +230,8 @@ class WlanthermoPidProfileLinkSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             True if enabled, False otherwise.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                return bool(p.link)
-        return False
+        p = self._get_profile()
+        return bool(p.link) if p else False
 
     @property
     def available(self) -> bool:
@@ -232,10 +240,8 @@ class WlanthermoPidProfileLinkSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             True if supported, False otherwise.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                return p.supports_link
-        return False
+        p = self._get_profile()
+        return p.supports_link if p else False
 
     async def async_turn_on(self, **kwargs) -> None:
         """
@@ -265,16 +271,10 @@ class WlanthermoPidProfileLinkSwitch(CoordinatorEntity, SwitchEntity):
         Returns:
             None.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                p.link = int(value)
-                payload = p.to_full_payload()
-                success = await self.coordinator.api.async_set_pid_profile(
-                    [payload],
-                )
-                if success:
-                    await self.coordinator.async_request_refresh()
-                return
+        p = self._get_profile()
+        if not p:
+            return
+        await self.coordinator.async_set_pid_fields(p.id, link=int(value))
             
 class WlanthermoTelegramEnabledSwitch(CoordinatorEntity, SwitchEntity):
     """Switch to enable or disable Telegram push notifications."""
@@ -285,7 +285,7 @@ class WlanthermoTelegramEnabledSwitch(CoordinatorEntity, SwitchEntity):
     _attr_translation_key = "telegram_enabled"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_telegram_enabled"
         )
@@ -307,10 +307,9 @@ class WlanthermoTelegramEnabledSwitch(CoordinatorEntity, SwitchEntity):
 
     async def _async_write(self, enabled: bool) -> None:
         telegram = self.coordinator.data.push.telegram
-        telegram.enabled = enabled
-
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         payload = {
-            "telegram": telegram.to_payload(),
+            "telegram": {**telegram.to_payload(), "enabled": int(enabled)},
         }
 
         success = await self.coordinator.api.async_set_push(payload)
@@ -327,7 +326,7 @@ class WlanthermoPushoverEnabledSwitch(CoordinatorEntity, SwitchEntity):
     _attr_translation_key = "pushover_enabled"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pushover_enabled"
         )
@@ -349,10 +348,9 @@ class WlanthermoPushoverEnabledSwitch(CoordinatorEntity, SwitchEntity):
 
     async def _async_write(self, enabled: bool) -> None:
         pushover = self.coordinator.data.push.pushover
-        pushover.enabled = enabled
-
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         payload = {
-            "pushover": pushover.to_payload()
+            "pushover": {**pushover.to_payload(), "enabled": int(enabled)}
         }
         success = await self.coordinator.api.async_set_push(payload)
         if success:
@@ -365,7 +363,7 @@ class WlanthermoBluetoothEnabledSwitch(CoordinatorEntity, SwitchEntity):
     _attr_icon = "mdi:bluetooth"
 
     def __init__(self, coordinator, entry_data):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_BLUETOOTH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_bluetooth_enabled"
         )
@@ -378,23 +376,19 @@ class WlanthermoBluetoothEnabledSwitch(CoordinatorEntity, SwitchEntity):
         return bool(data and data.bluetooth and data.bluetooth.enabled)
 
     async def async_turn_on(self, **kwargs) -> None:
-        bt = self.coordinator.data.bluetooth
-        if not bt:
-            return
-        bt.enabled = True
-        await self._push()
+        await self._push(True)
 
     async def async_turn_off(self, **kwargs) -> None:
+        await self._push(False)
+
+    async def _push(self, enabled: bool) -> None:
         bt = self.coordinator.data.bluetooth
         if not bt:
             return
-        bt.enabled = False
-        await self._push()
-
-    async def _push(self) -> None:
-        success = await self.coordinator.api.async_set_bluetooth(
-            self.coordinator.data.bluetooth.to_payload()
-        )
+        # The settings object is shared with the response cache, only the payload changes.
+        payload = bt.to_payload()
+        payload["enabled"] = int(enabled)
+        success = await self.coordinator.api.async_set_bluetooth(payload)
         if success:
             await self.coordinator.async_request_refresh()
 
@@ -406,7 +400,7 @@ class WlanthermoBluetoothProbeSwitch(CoordinatorEntity, SwitchEntity):
     _attr_icon = "mdi:thermometer-bluetooth"
 
     def __init__(self, coordinator, entry_data, address: str, probe_index: int):
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_BLUETOOTH)
         self._address = address
         self._probe = probe_index
         self._attr_unique_id = (
@@ -445,23 +439,25 @@ class WlanthermoBluetoothProbeSwitch(CoordinatorEntity, SwitchEntity):
         dev = self._get_device()
         if not dev:
             return
-        dev["selected"] = set_bit(dev.get("selected", 0), self._probe)
-        await self._push()
+        await self._push(dev, set_bit(dev.get("selected", 0), self._probe))
 
     async def async_turn_off(self, **kwargs) -> None:
         dev = self._get_device()
         if not dev:
             return
-        dev["selected"] = clear_bit(dev.get("selected", 0), self._probe)
-        await self._push()
+        await self._push(dev, clear_bit(dev.get("selected", 0), self._probe))
 
-    async def _push(self) -> None:
+    async def _push(self, dev: dict, selected: int) -> None:
         bluetooth = self.coordinator.data.bluetooth
         if not bluetooth:
             return
-        success = await self.coordinator.api.async_set_bluetooth(
-            bluetooth.to_payload()
-        )
+        # The device dicts are shared with the response cache, the payload gets copies.
+        payload = bluetooth.to_payload()
+        payload["devices"] = [
+            {**device, "selected": selected} if device is dev else device
+            for device in bluetooth.devices
+        ]
+        success = await self.coordinator.api.async_set_bluetooth(payload)
         if success:
             await self.coordinator.async_request_refresh()
 
@@ -476,7 +472,7 @@ class WlanthermoCloudEnabledSwitch(CoordinatorEntity, SwitchEntity):
     _attr_translation_key = "cloud_enabled"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_cloud_enabled"
         self._attr_device_info = entry_data["device_info"]
 
@@ -512,7 +508,7 @@ class WlanthermoMqttEnabledSwitch(CoordinatorEntity, SwitchEntity):
     _attr_translation_key = "mqtt_enabled"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_mqtt_enabled"
         self._attr_device_info = entry_data["device_info"]
 
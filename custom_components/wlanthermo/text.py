@@ -10,7 +10,7 @@ from typing import Any, Callable
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from .const import DOMAIN
+from .const import DOMAIN, UPDATE_CHANNEL, UPDATE_PID, UPDATE_PUSH, UPDATE_SETTINGS
 
 HEX_PATTERN = r"^#[0-9A-Fa-f]{6}$"
 
@@ -120,7 +120,7 @@ class WlanthermoChannelNameText(CoordinatorEntity, TextEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_CHANNEL, channel.number))
         self._channel_number = channel.number
         self._attr_has_entity_name = True
         self._attr_translation_key = "channel_name"
@@ -142,10 +142,8 @@ class WlanthermoChannelNameText(CoordinatorEntity, TextEntity):
         Returns:
             Channel object or None if not found.
         """
-        for ch in getattr(self.coordinator.data, "channels", []):
-            if ch.number == self._channel_number:
-                return ch
-        return None
+        data = self.coordinator.data
+        return data.get_channel(self._channel_number) if data else None
 
     @property
     def native_value(self) -> str | None:
@@ -168,17 +166,7 @@ class WlanthermoChannelNameText(CoordinatorEntity, TextEntity):
         channel = self._get_channel()
         if not channel:
             return
-        channel_data = {
-            "number": channel.number,
-            "name": value,
-            "typ": channel.typ,
-            "min": channel.min,
-            "max": channel.max,
-            "alarm": channel.alarm,
-            "color": channel.color,
-        }
-        await self.coordinator.api.async_set_channel(channel_data)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_set_channel_fields(channel.number, name=value)
 
 
 class WlanthermoPidProfileNameText(CoordinatorEntity, TextEntity):
@@ -201,7 +189,7 @@ class WlanthermoPidProfileNameText(CoordinatorEntity, TextEntity):
         Returns:
             None.
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=(UPDATE_PID, profile_id))
         self._profile_id = profile_id
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pid_{profile_id}_name"
@@ -213,6 +201,15 @@ class WlanthermoPidProfileNameText(CoordinatorEntity, TextEntity):
             "profile_id": str(profile_id)
         }
 
+    def _get_profile(self) -> Any:
+        """
+        Helper to get the current PID profile object from the API settings.
+        Returns:
+            PIDConfig object or None if not found.
+        """
+        settings = self.coordinator.api.settings
+        return settings.get_pid(self._profile_id) if settings else None
+
     @property
     def native_value(self) -> str | None:
         """
@@ -220,10 +217,8 @@ class WlanthermoPidProfileNameText(CoordinatorEntity, TextEntity):
         Returns:
             The profile name, or None if unavailable.
         """
-        for profile in getattr(self.coordinator.api.settings, "pid", []):
-            if profile.id == self._profile_id:
-                return profile.name
-        return None
+        profile = self._get_profile()
+        return profile.name if profile else None
 
     async def async_set_value(self, value: str) -> None:
         """
@@ -233,16 +228,10 @@ class WlanthermoPidProfileNameText(CoordinatorEntity, TextEntity):
         Returns:
             None.
         """
-        for p in self.coordinator.api.settings.pid:
-            if p.id == self._profile_id:
-                p.name = value
-                payload = p.to_full_payload()
-                success = await self.coordinator.api.async_set_pid_profile(
-                    [payload],
-                )
-                if success:
-                    await self.coordinator.async_request_refresh()
-                return
+        p = self._get_profile()
+        if not p:
+            return
+        await self.coordinator.async_set_pid_fields(p.id, name=value)
 
 
 class WlanthermoTelegramTokenText(CoordinatorEntity, TextEntity):
@@ -256,7 +245,7 @@ class WlanthermoTelegramTokenText(CoordinatorEntity, TextEntity):
     _attr_translation_key = "telegram_token"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_telegram_token"
         )
@@ -268,10 +257,9 @@ class WlanthermoTelegramTokenText(CoordinatorEntity, TextEntity):
 
     async def async_set_value(self, value: str) -> None:
         telegram = self.coordinator.data.push.telegram
-        telegram.token = value
-
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         success = await self.coordinator.api.async_set_push({
-            "telegram": telegram.to_payload(),
+            "telegram": {**telegram.to_payload(), "token": value},
         })
 
         if success:
@@ -289,7 +277,7 @@ class WlanthermoTelegramChatIdText(CoordinatorEntity, TextEntity):
     _attr_translation_key = "telegram_chat_id"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_telegram_chat_id"
         )
@@ -301,9 +289,9 @@ class WlanthermoTelegramChatIdText(CoordinatorEntity, TextEntity):
 
     async def async_set_value(self, value: str) -> None:
         telegram = self.coordinator.data.push.telegram
-        telegram.chat_id = value
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         success = await self.coordinator.api.async_set_push({
-            "telegram": telegram.to_payload(),
+            "telegram": {**telegram.to_payload(), "chat_id": value},
         })
         if success:
             await self.coordinator.async_request_refresh()
@@ -321,7 +309,7 @@ class WlanthermoPushoverTokenText(CoordinatorEntity, TextEntity):
     _attr_translation_key = "pushover_token"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pushover_token"
         )
@@ -333,9 +321,9 @@ class WlanthermoPushoverTokenText(CoordinatorEntity, TextEntity):
 
     async def async_set_value(self, value: str) -> None:
         pushover = self.coordinator.data.push.pushover
-        pushover.token = value
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         success = await self.coordinator.api.async_set_push({
-            "pushover": pushover.to_payload(),
+            "pushover": {**pushover.to_payload(), "token": value},
         })
         if success:
             await self.coordinator.async_request_refresh()
@@ -353,7 +341,7 @@ class WlanthermoPushoverUserKeyText(CoordinatorEntity, TextEntity):
     _attr_translation_key = "pushover_user_key"
 
     def __init__(self, coordinator, entry_data: dict) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_PUSH)
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_pushover_user_key"
         )
@@ -365,9 +353,9 @@ class WlanthermoPushoverUserKeyText(CoordinatorEntity, TextEntity):
 
     async def async_set_value(self, value: str) -> None:
         pushover = self.coordinator.data.push.pushover
-        pushover.user_key = value
+        # The parsed settings are reused while /getpush is unchanged, only the payload changes.
         success = await self.coordinator.api.async_set_push({
-            "pushover": pushover.to_payload(),
+            "pushover": {**pushover.to_payload(), "user_key": value},
         })
         if success:
             await self.coordinator.async_request_refresh()
@@ -381,7 +369,7 @@ class WlanthermoIotText(CoordinatorEntity, TextEntity):
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(self, coordinator, entry_data: dict, field: str) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=UPDATE_SETTINGS)
         self._field = field
         self._attr_unique_id = f"{coordinator.config_entry.entry_id}_iot_{field.lower()}"
         self._attr_device_info = entry_data["device_info"]
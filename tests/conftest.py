@@ -0,0 +1,17 @@
+"""
+Test setup for the WLANThermo integration.
+The models and estimators do not depend on Home Assistant, so the
+integration directory is registered as the package "wlanthermo" without
+running its __init__, which sets up the Home Assistant entry points.
+"""
+
+import pathlib
+import sys
+import types
+
+PACKAGE = pathlib.Path(__file__).resolve().parent.parent / "custom_components" / "wlanthermo"
+
+if "wlanthermo" not in sys.modules:
+    package = types.ModuleType("wlanthermo")
+    package.__path__ = [str(PACKAGE)]
+    sys.modules["wlanthermo"] = package
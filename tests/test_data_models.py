@@ -0,0 +1,209 @@
+"""
+Parity tests of the API models.
+The expected values are those of the original hand-written constructors,
+for complete payloads, empty payloads and the string-typed numbers some
+firmware versions return.
+"""
+
+import pytest
+
+from wlanthermo.data import (
+    BluetoothSettings,
+    Channel,
+    DeviceInfo,
+    FeatureSet,
+    IotSettings,
+    NotesExt,
+    PIDConfig,
+    Pitmaster,
+    PushSettings,
+    SettingsData,
+    SystemInfo,
+    SystemSettings,
+    WlanthermoData,
+)
+
+CHANNEL = {
+    "number": 1, "name": "Kanal 1", "typ": 0, "temp": 21.5, "min": 10.0, "max": 95.0,
+    "alarm": 0, "color": "#0C4C88", "fixed": False, "connected": True,
+}
+PITMASTER = {
+    "id": 0, "channel": 1, "pid": 0, "value": 0, "set": 110.0, "typ": "off",
+    "set_color": "#ff0000", "value_color": "#000000",
+}
+SYSTEM = {"time": 1700000000, "unit": "C", "soc": 80, "charge": False, "rssi": -60, "online": 0}
+PID = {
+    "name": "SSR SousVide", "id": 0, "aktor": 0, "Kp": 104, "Ki": 0.2, "Kd": 0,
+    "DCmmin": 0, "DCmmax": 100, "opl": 0, "SPmin": 0, "SPmax": 100, "link": 0,
+    "tune": 0, "jp": 100,
+}
+IOT = {
+    "PMQhost": "192.168.2.1", "PMQport": 1883, "PMQuser": "", "PMQpass": "", "PMQqos": 0,
+    "PMQon": False, "PMQint": 30, "CLon": False, "CLtoken": "xyz", "CLint": 30,
+    "CLurl": "cloud.wlanthermo.de/index.html",
+}
+
+
+def attributes(model) -> dict:
+    names = getattr(type(model), "__slots__", None) or vars(model)
+    return {name: getattr(model, name) for name in names}
+
+
+@pytest.mark.parametrize(
+    ("model", "payload", "expected"),
+    [
+        (SystemInfo, SYSTEM, SYSTEM),
+        (
+            SystemInfo,
+            {},
+            {"time": 0, "unit": "C", "soc": None, "charge": None, "rssi": 0, "online": None},
+        ),
+        (
+            SystemInfo,
+            {"time": "1700000000", "soc": "80", "rssi": "-60", "online": "1"},
+            {"time": 1700000000, "unit": "C", "soc": 80, "charge": None, "rssi": -60, "online": 1},
+        ),
+        (Channel, CHANNEL, CHANNEL),
+        (
+            Channel,
+            {},
+            {
+                "number": 0, "name": "", "typ": 0, "temp": 0.0, "min": 0.0, "max": 0.0,
+                "alarm": 0, "color": "#000000", "fixed": False, "connected": False,
+            },
+        ),
+        (
+            Channel,
+            {"number": "3", "temp": "999", "min": "80", "max": "95.5", "alarm": "2", "connected": 1},
+            {
+                "number": 3, "name": "", "typ": 0, "temp": 999.0, "min": 80.0, "max": 95.5,
+                "alarm": 2, "color": "#000000", "fixed": False, "connected": True,
+            },
+        ),
+        (Pitmaster, PITMASTER, {**PITMASTER, "temp": 0.0}),
+        (
+            Pitmaster,
+            {},
+            {
+                "id": 0, "channel": 0, "temp": 0.0, "pid": 0, "value": 0, "set": 0.0,
+                "typ": "off", "set_color": "#000000", "value_color": "#000000",
+            },
+        ),
+        (
+            PIDConfig,
+            PID,
+            {**PID, "Kp": 104.0, "Kd": 0.0, "opl": False, "tune": False},
+        ),
+        (
+            PIDConfig,
+            {"id": "2", "Kp": "3.8", "opl": "1", "tune": "true"},
+            {
+                "name": "", "id": 2, "aktor": 0, "Kp": 3.8, "Ki": 0.0, "Kd": 0.0,
+                "DCmmin": 0, "DCmmax": 0, "opl": True, "SPmin": 0, "SPmax": 0, "link": 0,
+                "tune": True, "jp": 0,
+            },
+        ),
+        (
+            DeviceInfo,
+            {"device": "nano", "flash_size": "16777216", "hw_version": "v3"},
+            {
+                "device": "nano", "serial": "", "cpu": "", "flash_size": 16777216,
+                "hw_version": "v3", "sw_version": "", "api_version": "", "language": "",
+            },
+        ),
+        (
+            SystemSettings,
+            {"time": "1700000000", "unit": "F", "getupdate": "True"},
+            {
+                "time": 1700000000, "unit": "F", "ap": "", "host": "", "language": "",
+                "version": "", "getupdate": True, "hwversion": "",
+            },
+        ),
+        (
+            SystemSettings,
+            {"getupdate": "false"},
+            {
+                "time": 0, "unit": "C", "ap": "", "host": "", "language": "",
+                "version": "", "getupdate": False, "hwversion": "",
+            },
+        ),
+        (FeatureSet, {"bluetooth": 1}, {"bluetooth": True, "pitmaster": False}),
+        (
+            IotSettings,
+            IOT,
+            {**IOT, "CLlink": "cloud.wlanthermo.de/index.html?api_token=xyz"},
+        ),
+        (
+            NotesExt,
+            {},
+            {"on": 0, "token": "", "id": "", "repeat": 1, "service": 0, "services": []},
+        ),
+        (
+            BluetoothSettings,
+            {"enabled": "true", "devices": [{"name": "a", "selected": 3}]},
+            {"enabled": True, "devices": [{"name": "a", "selected": 3}]},
+        ),
+    ],
+)
+def test_model_decoding(model, payload, expected):
+    assert attributes(model(payload)) == expected
+
+
+def test_push_settings_payload_round_trip():
+    payload = {
+        "telegram": {"enabled": 1, "token": "t", "chat_id": "c", "test": 0},
+        "pushover": {"enabled": "false", "token": "p", "user_key": "u", "priority": "1"},
+        "app": {"enabled": True, "max_devices": 2, "devices": []},
+    }
+    assert PushSettings.from_json(payload).to_payload() == {
+        "telegram": {"enabled": 1, "token": "t", "chat_id": "c", "test": 0},
+        "pushover": {"enabled": 0, "token": "p", "user_key": "u", "priority": 1},
+        "app": {"enabled": 1, "max_devices": 2, "devices": []},
+    }
+
+
+def test_settings_sections():
+    settings = SettingsData.from_json(
+        {"pid": [PID, {**PID, "id": 1, "aktor": 2}], "iot": IOT, "sensors": ["1000K", {"type": 2}]}
+    )
+    assert [pid.id for pid in settings.pid] == [0, 1]
+    assert settings.get_pid(1).aktor == 2
+    assert settings.get_pid(5) is None
+    assert settings.iot.CLlink == "cloud.wlanthermo.de/index.html?api_token=xyz"
+    assert [(sensor.type, sensor.name) for sensor in settings.sensors] == [(None, "1000K"), (2, "")]
+    assert attributes(settings.device) == attributes(DeviceInfo({}))
+
+
+@pytest.mark.parametrize(
+    ("model", "payload", "field", "value"),
+    [
+        (Channel, CHANNEL, "temp", 80.5),
+        (Pitmaster, PITMASTER, "set", 120.0),
+        (SystemInfo, SYSTEM, "rssi", -70),
+    ],
+)
+def test_update_from_json_matches_constructor(model, payload, field, value):
+    item = model(payload)
+    assert item.update_from_json(payload) == set()
+    changed = {**payload, field: value}
+    assert item.update_from_json(changed) == {field}
+    assert item == model(changed)
+
+
+def test_data_update_reports_changed_keys():
+    raw = {
+        "system": SYSTEM,
+        "channel": [CHANNEL, {**CHANNEL, "number": 2}],
+        "pitmaster": {"type": ["off", "manual", "auto"], "pm": [PITMASTER]},
+    }
+    data = WlanthermoData(raw=raw)
+    channel = data.get_channel(2)
+    assert data.update_from_json(raw) == set()
+    changes = data.update_from_json(
+        {**raw, "channel": [CHANNEL, {**CHANNEL, "number": 2, "temp": 60.0}]}
+    )
+    assert ("channel", 2) in changes
+    assert ("channel", 1) not in changes
+    assert data.get_channel(2) is channel
+    assert channel.temp == 60.0
+    assert data.changed_fields[("channel", 2)] == {"temp"}
@@ -0,0 +1,250 @@
+"""
+Parity tests of the schema-compiled decoders.
+The reference functions are the hand-written constructors the schemas
+replaced. Decoding and patching must give the same attribute values for
+complete, empty, partial and string-typed payloads.
+"""
+
+import itertools
+
+import pytest
+
+from wlanthermo.data import (
+    Channel,
+    DeviceInfo,
+    DisplayInfo,
+    FeatureSet,
+    PIDConfig,
+    Pitmaster,
+    SystemInfo,
+    SystemSettings,
+    parse_bool,
+)
+
+
+def reference_system_info(data):
+    return {
+        "time": int(data.get("time", 0)),
+        "unit": str(data.get("unit", "C")),
+        "soc": int(data["soc"]) if "soc" in data else None,
+        "charge": bool(data["charge"]) if "charge" in data else None,
+        "rssi": int(data.get("rssi", 0)),
+        "online": int(data["online"]) if "online" in data else None,
+    }
+
+
+def reference_channel(data):
+    return {
+        "number": int(data.get("number", 0)),
+        "name": str(data.get("name", "")),
+        "typ": int(data.get("typ", 0)),
+        "temp": float(data.get("temp", 0.0)),
+        "min": float(data.get("min", 0.0)),
+        "max": float(data.get("max", 0.0)),
+        "alarm": int(data.get("alarm", 0)),
+        "color": str(data.get("color", "#000000")),
+        "fixed": bool(data.get("fixed", False)),
+        "connected": bool(data.get("connected", False)),
+    }
+
+
+def reference_pitmaster(data):
+    return {
+        "id": int(data.get("id", 0)),
+        "channel": int(data.get("channel", 0)),
+        "temp": float(data.get("temp", 0.0)),
+        "pid": int(data.get("pid", 0)),
+        "value": int(data.get("value", 0)),
+        "set": float(data.get("set", 0.0)),
+        "typ": str(data.get("typ", "off")),
+        "set_color": str(data.get("set_color", "#000000")),
+        "value_color": str(data.get("value_color", "#000000")),
+    }
+
+
+def reference_pid_config(data):
+    return {
+        "name": str(data.get("name", "")),
+        "id": int(data.get("id", 0)),
+        "aktor": int(data.get("aktor", 0)),
+        "Kp": float(data.get("Kp", 0.0)),
+        "Ki": float(data.get("Ki", 0.0)),
+        "Kd": float(data.get("Kd", 0.0)),
+        "DCmmin": int(data.get("DCmmin", 0)),
+        "DCmmax": int(data.get("DCmmax", 0)),
+        "opl": parse_bool(data.get("opl", False)),
+        "SPmin": int(data.get("SPmin", 0)),
+        "SPmax": int(data.get("SPmax", 0)),
+        "link": int(data.get("link", 0)),
+        "tune": parse_bool(data.get("tune", False)),
+        "jp": int(data.get("jp", 0)),
+    }
+
+
+def reference_device_info(data):
+    return {
+        "device": str(data.get("device", "")),
+        "serial": str(data.get("serial", "")),
+        "cpu": str(data.get("cpu", "")),
+        "flash_size": int(data.get("flash_size", 0)),
+        "hw_version": str(data.get("hw_version", "")),
+        "sw_version": str(data.get("sw_version", "")),
+        "api_version": str(data.get("api_version", "")),
+        "language": str(data.get("language", "")),
+    }
+
+
+def reference_system_settings(data):
+    return {
+        "time": int(data.get("time", 0)),
+        "unit": str(data.get("unit", "C")),
+        "ap": str(data.get("ap", "")),
+        "host": str(data.get("host", "")),
+        "language": str(data.get("language", "")),
+        "version": str(data.get("version", "")),
+        "getupdate": str(data.get("getupdate", "false")).lower() == "true",
+        "hwversion": str(data.get("hwversion", "")),
+    }
+
+
+def reference_feature_set(data):
+    return {
+        "bluetooth": bool(data.get("bluetooth", False)),
+        "pitmaster": bool(data.get("pitmaster", False)),
+    }
+
+
+def reference_display_info(data):
+    return {
+        "updname": str(data.get("updname", "")),
+        "orientation": int(data.get("orientation", 0)),
+    }
+
+
+CASES = {
+    SystemInfo: (
+        reference_system_info,
+        [
+            {"time": 1700000000, "unit": "C", "soc": 80, "charge": False, "rssi": -60, "online": 0},
+            {"time": "1700000060", "unit": "F", "soc": "79", "charge": 1, "rssi": "-61", "online": "1"},
+            {"time": 1700000120, "rssi": -58},
+            {},
+        ],
+    ),
+    Channel: (
+        reference_channel,
+        [
+            {
+                "number": 1, "name": "Kanal 1", "typ": 0, "temp": 21.5, "min": 10.0, "max": 95.0,
+                "alarm": 0, "color": "#0C4C88", "fixed": False, "connected": True,
+            },
+            {
+                "number": "1", "name": "Brisket", "typ": "3", "temp": "999", "min": 80, "max": "95.5",
+                "alarm": "2", "color": "#ff0000", "fixed": 1, "connected": 0,
+            },
+            {"number": 1, "temp": 64, "max": 0},
+            {},
+        ],
+    ),
+    Pitmaster: (
+        reference_pitmaster,
+        [
+            {
+                "id": 0, "channel": 1, "pid": 0, "value": 0, "set": 110.0, "typ": "off",
+                "set_color": "#ff0000", "value_color": "#000000",
+            },
+            {
+                "id": "0", "channel": "2", "temp": "107.5", "pid": "1", "value": "35", "set": "120",
+                "typ": "auto", "set_color": "#ff0000", "value_color": "#00ff00",
+            },
+            {"id": 0, "value": 0.0, "set": 0},
+            {},
+        ],
+    ),
+    PIDConfig: (
+        reference_pid_config,
+        [
+            {
+                "name": "SSR SousVide", "id": 0, "aktor": 0, "Kp": 104, "Ki": 0.2, "Kd": 0,
+                "DCmmin": 0, "DCmmax": 100, "opl": 0, "SPmin": 0, "SPmax": 100, "link": 0,
+                "tune": 0, "jp": 100,
+            },
+            {
+                "name": "Servo", "id": "2", "aktor": "1", "Kp": "3.8", "Ki": "0.01", "Kd": "128",
+                "DCmmin": "25", "DCmmax": "75", "opl": "true", "SPmin": "10", "SPmax": "90",
+                "link": "1", "tune": "on", "jp": "70",
+            },
+            {"id": 1, "opl": True, "tune": "false", "Kp": 0},
+            {},
+        ],
+    ),
+    DeviceInfo: (
+        reference_device_info,
+        [
+            {
+                "device": "nano", "serial": "abc", "cpu": "esp32", "flash_size": 16777216,
+                "hw_version": "v3", "sw_version": "v1.2.0", "api_version": "2", "language": "de",
+            },
+            {"device": "mini", "flash_size": "4194304", "api_version": 2},
+            {},
+        ],
+    ),
+    SystemSettings: (
+        reference_system_settings,
+        [
+            {
+                "time": 1700000000, "unit": "C", "ap": "WLANTHERMO-AP", "host": "NANO-V3",
+                "language": "de", "version": "v1.2.0", "getupdate": "false", "hwversion": "V3",
+            },
+            {"time": "1700000000", "unit": "F", "getupdate": "True"},
+            {"getupdate": True},
+            {"getupdate": False},
+            {},
+        ],
+    ),
+    FeatureSet: (
+        reference_feature_set,
+        [{"bluetooth": True, "pitmaster": True}, {"bluetooth": 1}, {"pitmaster": 0}, {}],
+    ),
+    DisplayInfo: (
+        reference_display_info,
+        [{"updname": "", "orientation": 0}, {"updname": "v1.2.1", "orientation": "1"}, {}],
+    ),
+}
+
+
+def attributes(model) -> dict:
+    return {name: getattr(model, name) for name in type(model).__slots__}
+
+
+def typed(values: dict) -> dict:
+    # bool is a subclass of int, so compare the types as well as the values.
+    return {name: (type(value), value) for name, value in values.items()}
+
+
+@pytest.mark.parametrize(
+    ("model", "payload"),
+    [(model, payload) for model, (_, payloads) in CASES.items() for payload in payloads],
+)
+def test_decoder_matches_constructor(model, payload):
+    reference = CASES[model][0]
+    assert typed(attributes(model(payload))) == typed(reference(payload))
+
+
+@pytest.mark.parametrize(
+    ("model", "old", "new"),
+    [
+        (model, old, new)
+        for model, (_, payloads) in CASES.items()
+        for old, new in itertools.permutations(payloads, 2)
+    ],
+)
+def test_patch_matches_constructor(model, old, new):
+    reference = CASES[model][0]
+    item = model(old)
+    before = reference(old)
+    after = reference(new)
+    changed = item.update_from_json(new)
+    assert typed(attributes(item)) == typed(after)
+    assert changed == {name for name in after if after[name] != before[name]}
+    assert item.update_from_json(new) == set()
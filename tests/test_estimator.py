@@ -0,0 +1,196 @@
+"""
+Tests of the time left engines and the stall detection.
+"""
+
+import math
+
+import pytest
+
+from wlanthermo.estimator import (
+    ENGINES,
+    NOT_CONNECTED,
+    REGRESSION_REBASE,
+    EwmaEstimator,
+    KalmanEstimator,
+    RegressionEstimator,
+    WindowEstimator,
+    create_estimator,
+)
+from wlanthermo.history import TEMP, HistoryBuffer
+
+START = 1700000000
+KEY = (TEMP, 1)
+
+
+def feed(estimator, samples, capacity=720):
+    """
+    Add (time, temperature) samples through a history buffer like the coordinator.
+    """
+    history = HistoryBuffer(capacity)
+    for timestamp, temp in samples:
+        history.append(timestamp, {KEY: temp})
+        estimator.add(history.times(), history.column(KEY))
+    return history
+
+
+def ramp(minutes, rate_per_minute=3.0, start_temp=20.0, interval=10):
+    return [
+        (START + t, start_temp + rate_per_minute * t / 60)
+        for t in range(0, int(minutes * 60), interval)
+    ]
+
+
+def noisy(samples, amplitude=0.2):
+    # Deterministic noise with zero mean over every four samples.
+    pattern = (amplitude, -amplitude, -amplitude, amplitude)
+    return [(t, temp + pattern[i % 4]) for i, (t, temp) in enumerate(samples)]
+
+
+def least_squares_slope(samples):
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_y = sum(y for _, y in samples) / n
+    sxy = sum((t - mean_t) * (y - mean_y) for t, y in samples)
+    sxx = sum((t - mean_t) ** 2 for t, _ in samples)
+    return sxy / sxx
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_linear_rise(engine):
+    estimator = create_estimator(engine, 300)
+    feed(estimator, ramp(30))
+    assert estimator.rate * 60 == pytest.approx(3.0, rel=1e-3)
+    assert estimator.time_left(50.0, 80.0) == pytest.approx(10.0, rel=1e-3)
+    assert estimator.time_left(80.0, 80.0) == 0
+    assert estimator.stalled_since is None
+
+
+def test_create_estimator_falls_back_to_regression():
+    estimator = create_estimator("unknown", 120)
+    assert type(estimator) is RegressionEstimator
+    assert estimator.window == 120
+
+
+def test_window_uses_oldest_sample_in_window():
+    estimator = WindowEstimator(60)
+    # 1 °C/min for 10 minutes, then 4 °C/min for the last minute.
+    samples = ramp(10, 1.0)
+    last_time, last_temp = samples[-1]
+    samples += [(last_time + t, last_temp + 4.0 * t / 60) for t in range(10, 70, 10)]
+    feed(estimator, samples)
+    assert estimator.rate * 60 == pytest.approx(4.0)
+    assert estimator.rate_std is None
+
+
+def test_window_needs_two_samples():
+    estimator = WindowEstimator(300)
+    feed(estimator, ramp(0.1))
+    assert estimator.rate is None
+    assert estimator.time_left(20.0, 80.0) is None
+
+
+def test_regression_matches_least_squares_over_window():
+    estimator = RegressionEstimator(300)
+    samples = noisy(ramp(20))
+    feed(estimator, samples)
+    window = [(t, y) for t, y in samples if t >= samples[-1][0] - 300]
+    assert estimator.rate == pytest.approx(least_squares_slope(window), rel=1e-9)
+    assert estimator.rate_std > 0
+
+
+def test_regression_rebases_and_survives_dropped_samples():
+    samples = noisy(ramp(3 * REGRESSION_REBASE / 60, 0.5))
+    window = [(t, y) for t, y in samples if t >= samples[-1][0] - 300]
+    expected = least_squares_slope(window)
+    for capacity in (720, 40):
+        estimator = RegressionEstimator(300)
+        feed(estimator, samples, capacity)
+        assert estimator.rate == pytest.approx(expected, rel=1e-9)
+
+
+def test_ewma_waits_for_one_time_constant():
+    estimator = EwmaEstimator(300)
+    feed(estimator, ramp(4))
+    assert estimator.rate is None
+    feed(estimator, ramp(6))
+    assert estimator.rate * 60 == pytest.approx(3.0)
+    assert estimator.rate_std == pytest.approx(0.0, abs=1e-12)
+
+
+def test_ewma_averages_noise():
+    estimator = EwmaEstimator(300)
+    feed(estimator, noisy(ramp(60)))
+    assert estimator.rate * 60 == pytest.approx(3.0, rel=0.1)
+    assert estimator.rate_std > 0
+
+
+def test_kalman_converges_on_noisy_rise():
+    estimator = KalmanEstimator()
+    feed(estimator, noisy(ramp(60)))
+    assert estimator.rate * 60 == pytest.approx(3.0, rel=0.05)
+    assert 0 < estimator.rate_std < estimator.rate
+
+
+@pytest.mark.parametrize("missing", [NOT_CONNECTED, math.nan])
+def test_removed_probe_resets(missing):
+    estimator = RegressionEstimator(300)
+    samples = ramp(10)
+    feed(estimator, samples + [(samples[-1][0] + 10, missing)])
+    assert estimator.rate is None
+    assert estimator.time_left(50.0, 80.0) is None
+
+
+def test_repeated_sample_is_skipped():
+    estimator = RegressionEstimator(300)
+    history = feed(estimator, ramp(10))
+    rate = estimator.rate
+    # The same device update seen again by a second refresh.
+    estimator.add(history.times(), history.column(KEY))
+    assert estimator.rate == rate
+    assert estimator._count == len(history)
+
+
+def test_clock_going_back_resets():
+    estimator = WindowEstimator(300)
+    feed(estimator, ramp(10))
+    history = HistoryBuffer(10)
+    history.append(START, {KEY: 25.0})
+    estimator.add(history.times(), history.column(KEY))
+    assert estimator.rate is None
+    assert estimator._start_time == START
+
+
+def test_flat_temperature_has_no_time_left():
+    estimator = RegressionEstimator(300)
+    feed(estimator, [(START + t, 21.0) for t in range(0, 1800, 10)])
+    assert estimator.rate == 0
+    assert estimator.time_left(21.0, 80.0) is None
+    # A probe at ambient temperature never reaches the peak rate of a stall.
+    assert estimator.stalled_since is None
+
+
+@pytest.mark.parametrize("engine", sorted(ENGINES))
+def test_stall_is_detected_and_ends(engine):
+    estimator = create_estimator(engine, 300)
+    # 1 °C/min up to 70 °C, 0.05 °C/min for 30 minutes, then rising again.
+    rise = ramp(50, 1.0)
+    stall_start = rise[-1][0] + 10
+    stall = [(stall_start + t, 70.0 + 0.05 * t / 60) for t in range(0, 1800, 10)]
+    feed(estimator, rise + stall)
+    assert estimator.stalled_since is not None
+    # Within three windows, the EWMA lags behind the others.
+    assert stall_start <= estimator.stalled_since <= stall_start + 900
+    attributes = estimator.attributes()
+    assert attributes["stalled"] is True
+    # The window engine has no standard deviation and no confidence.
+    assert attributes["confidence"] == (None if engine == "window" else 0.0)
+    assert attributes["stall_minutes"] > 15
+    # The estimate during the stall uses the last rate above half the peak rate.
+    assert 20.0 <= estimator.time_left(70.0, 90.0) <= 41.0
+
+    resume_start = stall[-1][0] + 10
+    resume = [(resume_start + t, 71.5 + t / 60) for t in range(0, 900, 10)]
+    estimator = create_estimator(engine, 300)
+    feed(estimator, rise + stall + resume)
+    assert estimator.stalled_since is None
+    assert estimator.attributes()["stall_minutes"] is None
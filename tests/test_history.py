@@ -0,0 +1,69 @@
+"""
+Tests of the columnar history ring buffer.
+"""
+
+import math
+
+from wlanthermo.history import RSSI, TEMP, HistoryBuffer
+
+
+def test_empty_buffer():
+    history = HistoryBuffer(4)
+    assert len(history) == 0
+    assert history.last_time is None
+    assert list(history.times()) == []
+    assert history.column((TEMP, 1)) is None
+    assert history.count_since(60) == 0
+
+
+def test_views_are_oldest_first_and_wrap_around():
+    history = HistoryBuffer(4)
+    for step in range(7):
+        history.append(100 + step, {(TEMP, 1): float(step)})
+    assert len(history) == 4
+    assert history.last_time == 106
+    assert list(history.times()) == [103, 104, 105, 106]
+    assert list(history.column((TEMP, 1))) == [3.0, 4.0, 5.0, 6.0]
+    assert list(history.column((TEMP, 1), 2)) == [5.0, 6.0]
+    assert list(history.times(10)) == [103, 104, 105, 106]
+
+
+def test_views_share_the_buffer():
+    history = HistoryBuffer(3)
+    history.append(1, {(TEMP, 1): 1.0})
+    view = history.column((TEMP, 1))
+    assert isinstance(view, memoryview)
+    assert view.obj is history.column((TEMP, 1)).obj
+
+
+def test_missing_values_are_nan():
+    history = HistoryBuffer(4)
+    history.append(1, {(TEMP, 1): 20.0})
+    history.append(2, {(TEMP, 1): 21.0, (TEMP, 2): 30.0})
+    history.append(3, {(TEMP, 2): 31.0, RSSI: -60})
+    first = list(history.column((TEMP, 1)))
+    second = list(history.column((TEMP, 2)))
+    assert first[:2] == [20.0, 21.0] and math.isnan(first[2])
+    assert math.isnan(second[0]) and second[1:] == [30.0, 31.0]
+    assert list(history.column(RSSI))[-1] == -60
+    assert set(history.keys) == {(TEMP, 1), (TEMP, 2), RSSI}
+
+
+def test_count_since():
+    history = HistoryBuffer(10)
+    for timestamp in range(0, 100, 10):
+        history.append(timestamp, {})
+    assert history.count_since(30) == 4
+    assert history.count_since(0) == 1
+    assert history.count_since(1000) == 10
+
+
+def test_clear():
+    history = HistoryBuffer(4)
+    history.append(1, {(TEMP, 1): 20.0})
+    history.clear()
+    assert len(history) == 0
+    assert history.last_time is None
+    assert history.column((TEMP, 1)) is None
+    history.append(2, {(TEMP, 1): 21.0})
+    assert list(history.column((TEMP, 1))) == [21.0]
@@ -0,0 +1,47 @@
+"""
+Tests of the derived channel values.
+"""
+
+import math
+
+from wlanthermo.data import WlanthermoData
+from wlanthermo.history import TEMP, HistoryBuffer
+from wlanthermo.metrics import ChannelMetricsPipeline
+
+START = 1700000000
+
+
+def raw_data(time, temps):
+    return {
+        "system": {"time": time},
+        "channel": [
+            {"number": number, "temp": temp, "min": 0.0, "max": 95.0}
+            for number, temp in enumerate(temps, start=1)
+        ],
+        "pitmaster": {"pm": []},
+    }
+
+
+def test_update_reports_changed_channels_during_a_stall():
+    history = HistoryBuffer(360)
+    pipeline = ChannelMetricsPipeline("regression", 300, 60)
+    data = WlanthermoData(raw=raw_data(START, [20.0, 999.0]))
+    reported = []
+    for step in range(40):
+        time = START + 10 * step
+        # Rising by 3 °C/min, then flat at 30 °C.
+        temp = min(20.0 + 0.5 * step, 30.0)
+        channel_changes = data.update_from_json(raw_data(time, [temp, 999.0]))
+        history.append(time, {(TEMP, 1): temp, (TEMP, 2): math.nan})
+        reported.append((("channel", 1) in channel_changes, pipeline.update(history, data)))
+    # The unconnected channel has no values to report.
+    assert all(changed <= {1} for _, changed in reported)
+    # While the temperature is flat the channel data is unchanged, but the
+    # rate and the smoothed temperature keep moving and are reported.
+    stall = reported[25:]
+    assert not any(channel_changed for channel_changed, _ in stall)
+    assert all(changed == {1} for _, changed in stall)
+    metrics = pipeline.get(1)
+    assert metrics.smoothed_temp == 30.0
+    assert 0 < metrics.rate_per_minute < 3.0
+    assert pipeline.get(2).rate_per_minute is None
@@ -0,0 +1,146 @@
+"""
+Benchmark of building the /data models.
+Compares the construction of a WlanthermoData snapshot straight from the
+decoded JSON with the previous path that deep-copied every channel,
+pitmaster and system dictionary first, and with patching an existing
+snapshot in place. Also reports the peak memory allocated by one patch.
+
+Usage:
+    python tools/bench_data_construction.py
+    python tools/bench_data_construction.py --channels 16 --number 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import pathlib
+import random
+import sys
+import timeit
+import tracemalloc
+import types
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+PACKAGE = ROOT / "custom_components" / "wlanthermo"
+
+
+def load_data_module():
+    """
+    Import data.py without running the integration's __init__, which
+    requires Home Assistant.
+    """
+    if "wlanthermo" not in sys.modules:
+        package = types.ModuleType("wlanthermo")
+        package.__path__ = [str(PACKAGE)]
+        sys.modules["wlanthermo"] = package
+    from wlanthermo import data
+
+    return data
+
+
+def data_payload(channels: int, pitmasters: int = 1) -> dict:
+    """
+    Return a decoded /data response as sent by the firmware.
+    """
+    return {
+        "system": {"time": 1700000000, "unit": "C", "soc": 80, "charge": False, "rssi": -60, "online": 0},
+        "channel": [
+            {
+                "number": i + 1,
+                "name": f"Kanal {i + 1}",
+                "typ": 0,
+                "temp": round(random.uniform(20.0, 90.0), 1) if i % 3 else 999.0,
+                "min": 10.0,
+                "max": 95.0,
+                "alarm": 0,
+                "color": "#0C4C88",
+                "fixed": False,
+                "connected": False,
+            }
+            for i in range(channels)
+        ],
+        "pitmaster": {
+            "type": ["off", "manual", "auto"],
+            "pm": [
+                {
+                    "id": i,
+                    "channel": 1,
+                    "pid": 0,
+                    "value": 0,
+                    "set": 110.0,
+                    "typ": "off",
+                    "set_color": "#ff0000",
+                    "value_color": "#000000",
+                }
+                for i in range(pitmasters)
+            ],
+        },
+    }
+
+
+def build_deepcopy(data_module, raw: dict):
+    """
+    Build a snapshot the previous way, deep-copying each item before parsing it.
+    """
+    pitmaster = raw.get("pitmaster", {})
+    copied = {
+        "system": copy.deepcopy(raw.get("system", {})),
+        "channel": [copy.deepcopy(c) for c in raw.get("channel", [])],
+        "pitmaster": {
+            "type": pitmaster.get("type", []),
+            "pm": [copy.deepcopy(p) for p in pitmaster.get("pm", [])],
+        },
+    }
+    return data_module.WlanthermoData(raw=copied)
+
+
+def best_us(func, number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def peak_bytes(func) -> int:
+    """
+    Return the peak memory allocated by one call of func.
+    """
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark building the /data models.")
+    parser.add_argument("--channels", type=int, default=12, help="channels per /data response")
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=7, help="timing runs, the best is reported")
+    args = parser.parse_args()
+
+    data_module = load_data_module()
+    random.seed(0)
+    raw = data_payload(args.channels)
+    # Two responses with new temperatures, applied alternately to one snapshot.
+    updates = [data_payload(args.channels), data_payload(args.channels)]
+    snapshot = data_module.WlanthermoData(raw=raw)
+    toggle = [0]
+
+    def patch():
+        toggle[0] ^= 1
+        snapshot.update_from_json(updates[toggle[0]])
+
+    results = {
+        "build with deepcopy": best_us(lambda: build_deepcopy(data_module, raw), args.number, args.repeat),
+        "build from JSON": best_us(lambda: data_module.WlanthermoData(raw=raw), args.number, args.repeat),
+        "patch in place": best_us(patch, args.number, args.repeat),
+    }
+    print(f"/data with {args.channels} channels, best of {args.repeat} runs")
+    for name, us in results.items():
+        print(f"{name:<22} {us:>8.1f} us")
+    speedup = results["build with deepcopy"] / results["build from JSON"]
+    print(f"{'deepcopy / JSON':<22} {speedup:>8.1f} x")
+    print(f"{'patch peak memory':<22} {peak_bytes(patch):>8} bytes")
+
+
+if __name__ == "__main__":
+    main()
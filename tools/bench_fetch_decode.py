@@ -0,0 +1,164 @@
+"""
+Benchmark of the response handling of the API client's _fetch.
+Compares, per /data and /settings response, decoding the body the previous
+way (aiohttp's resp.json(): str decode and the json module) with the orjson
+decode of the raw bytes, and with the short-circuits that skip decoding: a
+304 response to the conditional request and a body identical to the
+previous one. The cost of the identity check when the body did change is
+reported as well.
+
+Captured responses can be passed as files, e.g. saved with
+    curl -o data.json http://wlanthermo/data
+    curl -o settings.json http://wlanthermo/settings
+
+Usage:
+    python tools/bench_fetch_decode.py
+    python tools/bench_fetch_decode.py --data data.json --settings settings.json
+    python tools/bench_fetch_decode.py --channels 16 --number 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import random
+
+# Home Assistant's json_loads is orjson.loads.
+from orjson import loads as json_loads
+
+from bench_data_construction import best_us, data_payload
+from bench_model_memory import settings_pids
+
+ETAG = '"5f3a"'
+
+
+def settings_payload(pids: int) -> dict:
+    """
+    Return a decoded /settings response as sent by the firmware.
+    """
+    return {
+        "device": {
+            "device": "nano", "serial": "abc123", "cpu": "esp32", "flash_size": 16777216,
+            "hw_version": "v3", "sw_version": "v1.2.0", "api_version": "2", "language": "de",
+        },
+        "system": {
+            "time": "1700000000", "unit": "C", "ap": "NANO-V3-AP", "host": "NANO-V3",
+            "language": "de", "version": "v1.2.0", "getupdate": "false", "autoupd": True,
+            "prerelease": False, "hwversion": "V3",
+        },
+        "hardware": ["V3"],
+        "api": {"version": "2"},
+        "sensors": [{"type": i, "name": f"Sensor {i}", "fixed": False} for i in range(15)],
+        "features": {"bluetooth": True, "pitmaster": True},
+        "pid": settings_pids(pids),
+        "aktor": ["SSR", "FAN", "SERVO", "DAMPER"],
+        "display": {"updname": "", "orientation": 0},
+        "iot": {
+            "PMQhost": "192.168.2.1", "PMQport": 1883, "PMQuser": "", "PMQpass": "",
+            "PMQqos": 0, "PMQon": False, "PMQint": 30, "CLon": False, "CLtoken": "",
+            "CLint": 30, "CLurl": "cloud.wlanthermo.de/index.html",
+        },
+        "notes": {"fcm": [], "ext": {"on": 0, "token": "", "id": "", "repeat": 1, "service": 0}},
+    }
+
+
+def encode(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def conditional_headers(previous: tuple) -> dict:
+    """
+    Build the request headers of _fetch from the previous response.
+    """
+    headers = {}
+    if previous[1]:
+        headers["If-None-Match"] = previous[1]
+    if previous[2]:
+        headers["If-Modified-Since"] = previous[2]
+    return headers
+
+
+def bench_endpoint(body: bytes, changed: bytes, number: int, repeat: int) -> dict[str, float]:
+    """
+    Return the microseconds per response of each path of _fetch.
+    Args:
+        body: Body of the previous response.
+        changed: Body of a response with other values.
+    """
+    previous = (body, ETAG, None, json_loads(body))
+    # A new bytes object as read from the socket, equal to the previous body.
+    same = bytes(bytearray(body))
+
+    def not_modified():
+        conditional_headers(previous)
+        return previous[3]
+
+    def identical():
+        conditional_headers(previous)
+        if previous[0] == same:
+            return previous[3]
+        return json_loads(same)
+
+    def changed_body():
+        conditional_headers(previous)
+        if previous[0] == changed:
+            return previous[3]
+        return json_loads(changed)
+
+    return {
+        "resp.json()": best_us(lambda: json.loads(changed.decode("utf-8")), number, repeat),
+        "orjson decode": best_us(lambda: json_loads(changed), number, repeat),
+        "changed body": best_us(changed_body, number, repeat),
+        "identical body": best_us(identical, number, repeat),
+        "304 not modified": best_us(not_modified, number, repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the response handling of _fetch.")
+    parser.add_argument("--data", type=pathlib.Path, help="captured /data response body")
+    parser.add_argument("--settings", type=pathlib.Path, help="captured /settings response body")
+    parser.add_argument("--channels", type=int, default=12, help="channels of the generated /data")
+    parser.add_argument("--pids", type=int, default=3, help="PID profiles of the generated /settings")
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=7, help="timing runs, the best is reported")
+    args = parser.parse_args()
+
+    random.seed(0)
+    if args.data:
+        data = args.data.read_bytes()
+        # A later response of a cook differs in the temperatures.
+        raw = json_loads(data)
+        for channel in raw.get("channel", []):
+            if channel.get("temp") != 999.0:
+                channel["temp"] = round(channel["temp"] + 0.1, 1)
+        data_changed = encode(raw)
+    else:
+        data = encode(data_payload(args.channels))
+        data_changed = encode(data_payload(args.channels))
+    if args.settings:
+        settings = args.settings.read_bytes()
+    else:
+        settings = encode(settings_payload(args.pids))
+    # The device time is the only value of /settings that changes on its own.
+    raw = json_loads(settings)
+    raw.setdefault("system", {})["time"] = "1700000060"
+    settings_changed = encode(raw)
+
+    for endpoint, body, changed in (
+        ("/data", data, data_changed),
+        ("/settings", settings, settings_changed),
+    ):
+        results = bench_endpoint(body, changed, args.number, args.repeat)
+        print(f"{endpoint} of {len(body)} bytes, best of {args.repeat} runs")
+        for name, us in results.items():
+            print(f"{name:<22} {us:>8.2f} us")
+        speedup = results["resp.json()"] / results["orjson decode"]
+        print(f"{'resp.json() / orjson':<22} {speedup:>8.1f} x")
+        speedup = results["changed body"] / results["identical body"]
+        print(f"{'decode / identical':<22} {speedup:>8.1f} x\n")
+
+
+if __name__ == "__main__":
+    main()
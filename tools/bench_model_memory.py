@@ -0,0 +1,112 @@
+"""
+Memory benchmark of the slotted API models.
+Compares Channel, Pitmaster, SystemInfo and PIDConfig with equivalents that
+run the same constructor but keep their attributes in an instance __dict__,
+per object with sys.getsizeof and per /data plus /settings snapshot with
+tracemalloc.
+
+Usage:
+    python tools/bench_model_memory.py
+    python tools/bench_model_memory.py --channels 16 --pids 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tracemalloc
+
+from bench_data_construction import data_payload, load_data_module
+
+
+def settings_pids(count: int) -> list[dict]:
+    """
+    Return the "pid" list of a decoded /settings response.
+    """
+    return [
+        {
+            "name": f"PID {i}", "id": i, "aktor": i % 4, "Kp": 3.8, "Ki": 0.01, "Kd": 128,
+            "DCmmin": 0, "DCmmax": 100, "opl": 0, "SPmin": 0, "SPmax": 100, "link": 0,
+            "tune": 0, "jp": 70,
+        }
+        for i in range(count)
+    ]
+
+
+def dict_backed(model: type) -> type:
+    """
+    Return a class with the constructor of model but without __slots__.
+    """
+    return type(f"Dict{model.__name__}", (), {"__init__": model.__init__})
+
+
+def object_size(item) -> int:
+    size = sys.getsizeof(item)
+    if hasattr(item, "__dict__"):
+        size += sys.getsizeof(item.__dict__)
+    return size
+
+
+def snapshot_models(models: dict, raw: dict, pids: list[dict]) -> list:
+    """
+    Build the model objects of one /data and /settings response.
+    """
+    return (
+        [models["SystemInfo"](raw["system"])]
+        + [models["Channel"](channel) for channel in raw["channel"]]
+        + [models["Pitmaster"](pm) for pm in raw["pitmaster"]["pm"]]
+        + [models["PIDConfig"](pid) for pid in pids]
+    )
+
+
+def traced_bytes(models: dict, raw: dict, pids: list[dict], snapshots: int) -> float:
+    """
+    Return the bytes allocated per snapshot while holding snapshots of them.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [snapshot_models(models, raw, pids) for _ in range(snapshots)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the snapshots is not part of a snapshot.
+    return (after - before - sys.getsizeof(held)) / snapshots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the memory of the API models.")
+    parser.add_argument("--channels", type=int, default=12, help="channels per /data response")
+    parser.add_argument("--pids", type=int, default=3, help="PID profiles per /settings response")
+    parser.add_argument("--snapshots", type=int, default=1000, help="snapshots held while tracing")
+    args = parser.parse_args()
+
+    data_module = load_data_module()
+    random.seed(0)
+    raw = data_payload(args.channels)
+    pids = settings_pids(args.pids)
+    samples = {
+        "SystemInfo": raw["system"],
+        "Channel": raw["channel"][0],
+        "Pitmaster": raw["pitmaster"]["pm"][0],
+        "PIDConfig": pids[0],
+    }
+    slotted = {name: getattr(data_module, name) for name in samples}
+    plain = {name: dict_backed(model) for name, model in slotted.items()}
+
+    print(f"{'bytes per object':<22} {'slots':>8} {'__dict__':>9}")
+    for name, sample in samples.items():
+        print(
+            f"{name:<22} {object_size(slotted[name](sample)):>8} "
+            f"{object_size(plain[name](sample)):>9}"
+        )
+
+    print(f"\nsnapshot with {args.channels} channels and {args.pids} PID profiles")
+    slots_bytes = traced_bytes(slotted, raw, pids, args.snapshots)
+    dict_bytes = traced_bytes(plain, raw, pids, args.snapshots)
+    print(f"{'slots':<22} {slots_bytes:>8.0f} bytes")
+    print(f"{'__dict__':<22} {dict_bytes:>8.0f} bytes")
+    print(f"{'saved':<22} {1 - slots_bytes / dict_bytes:>8.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Benchmark of the channel time left estimators.
+Replays cooks, either simulated with the mock device curves or recorded as
+CSV files with "time,temp" rows (device time in seconds), and reports the
+prediction error of every engine against the actual time the target was
+reached and the CPU time per update.
+
+Usage:
+    python tools/bench_time_left.py
+    python tools/bench_time_left.py --target 93 recording1.csv recording2.csv
+"""
+
+from __future__ import annotations
+
+from array import array
+import argparse
+import csv
+import importlib.util
+import pathlib
+import random
+import statistics
+import time
+
+from curves import CookCurve
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+def load_estimator_module():
+    """
+    Import estimator.py without importing the integration package,
+    which requires Home Assistant.
+    """
+    path = ROOT / "custom_components" / "wlanthermo" / "estimator.py"
+    spec = importlib.util.spec_from_file_location("wlanthermo_estimator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def simulated_cook(seed: int, interval: float, duration: float) -> list[tuple[float, float]]:
+    random.seed(seed)
+    curve = CookCurve(
+        tau=random.uniform(5400.0, 9000.0),
+        stall_duration=random.uniform(3600.0, 7200.0),
+        noise=0.15,
+    )
+    samples = []
+    elapsed = 0.0
+    while elapsed <= duration:
+        samples.append((1_700_000_000 + elapsed, curve.temperature(elapsed)))
+        elapsed += interval
+    return samples
+
+
+def recorded_cook(path: str) -> list[tuple[float, float]]:
+    with open(path, newline="") as file:
+        return [
+            (float(row["time"]), float(row["temp"]))
+            for row in csv.DictReader(file)
+            if row.get("temp") not in (None, "", "999", "999.0")
+        ]
+
+
+def replay(estimator, samples: list[tuple[float, float]], target: float) -> dict:
+    """
+    Feed a cook to an estimator and compare each prediction with the actual
+    remaining time. The samples are passed as growing arrays, like the views
+    of the device history the coordinator passes.
+    """
+    reached = next((t for t, temp in samples if temp >= target), None)
+    errors = []
+    last_hour = []
+    answered = 0
+    times = array("d")
+    temps = array("d")
+    started = time.perf_counter()
+    for timestamp, temp in samples:
+        times.append(timestamp)
+        temps.append(temp)
+        estimator.add(times, temps)
+        predicted = estimator.time_left(temp, target)
+        if reached is None or timestamp >= reached:
+            continue
+        if predicted is not None:
+            answered += 1
+            error = abs(predicted - (reached - timestamp) / 60)
+            errors.append(error)
+            if reached - timestamp <= 3600:
+                last_hour.append(error)
+    elapsed = time.perf_counter() - started
+    before = sum(1 for t, _ in samples if reached is not None and t < reached)
+    return {
+        "samples": len(samples),
+        "us_per_update": elapsed / len(samples) * 1e6,
+        "answered": answered / before if before else None,
+        "mae_min": statistics.fmean(errors) if errors else None,
+        "mae_last_hour_min": statistics.fmean(last_hour) if last_hour else None,
+    }
+
+
+def _fmt(value: float | None, spec: str) -> str:
+    return format(value if value is not None else float("nan"), spec)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the channel time left estimators.")
+    parser.add_argument("recordings", nargs="*", help="CSV files with time,temp rows")
+    parser.add_argument("--target", type=float, default=93.0, help="target temperature")
+    parser.add_argument("--window", type=float, default=300.0, help="estimator window in seconds")
+    parser.add_argument("--interval", type=float, default=10.0, help="sample interval of simulated cooks")
+    parser.add_argument("--cooks", type=int, default=5, help="number of simulated cooks")
+    parser.add_argument("--engine", action="append", help="engine to run, all by default")
+    args = parser.parse_args()
+
+    estimator_module = load_estimator_module()
+    engines = args.engine or list(estimator_module.ENGINES)
+    if args.recordings:
+        cooks = {path: recorded_cook(path) for path in args.recordings}
+    else:
+        cooks = {
+            f"simulated #{seed}": simulated_cook(seed, args.interval, 8 * 3600)
+            for seed in range(args.cooks)
+        }
+    print(
+        f"{'cook':<20} {'engine':<11} {'samples':>8} {'us/update':>10} "
+        f"{'answered':>9} {'MAE min':>9} {'last hour':>10}"
+    )
+    for name, samples in cooks.items():
+        for engine in engines:
+            estimator = estimator_module.create_estimator(engine, args.window)
+            result = replay(estimator, samples, args.target)
+            print(
+                f"{name:<20} {engine:<11} {result['samples']:>8} {result['us_per_update']:>10.2f} "
+                f"{_fmt(result['answered'], '>9.0%')} {_fmt(result['mae_min'], '>9.1f')} "
+                f"{_fmt(result['mae_last_hour_min'], '>10.1f')}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Simulated temperature curves of a cook.
+Used by the mock device server and the time left benchmark. Only the
+standard library is required.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+
+
+class CookCurve:
+    """
+    Simulated core temperature of a piece of meat.
+    Rises towards the pit temperature with a first order response and holds
+    a plateau (the stall) around stall_temp for stall_duration seconds.
+    """
+    __slots__ = ("start", "pit", "tau", "stall_temp", "stall_duration", "noise")
+
+    def __init__(
+        self,
+        start: float = 20.0,
+        pit: float = 120.0,
+        tau: float = 7200.0,
+        stall_temp: float | None = 68.0,
+        stall_duration: float = 5400.0,
+        noise: float = 0.1,
+    ) -> None:
+        self.start = start
+        self.pit = pit
+        self.tau = tau
+        self.stall_temp = stall_temp
+        self.stall_duration = stall_duration
+        self.noise = noise
+
+    def _rise(self, elapsed: float) -> float:
+        return self.pit - (self.pit - self.start) * math.exp(-elapsed / self.tau)
+
+    def temperature(self, elapsed: float) -> float:
+        """
+        Return the temperature after elapsed seconds of simulated time.
+        """
+        stall = self.stall_temp
+        if stall is None or not self.start < stall < self.pit:
+            value = self._rise(elapsed)
+        else:
+            # Time at which the undisturbed curve reaches the stall temperature.
+            reached = -self.tau * math.log((self.pit - stall) / (self.pit - self.start))
+            if elapsed < reached:
+                value = self._rise(elapsed)
+            elif elapsed < reached + self.stall_duration:
+                # Creeps up by about one degree over the stall.
+                value = stall + (elapsed - reached) / self.stall_duration
+            else:
+                value = self._rise(elapsed - self.stall_duration) + 1.0
+        if self.noise:
+            value += random.gauss(0.0, self.noise)
+        return round(value, 1)
+
+
+class PitCurve(CookCurve):
+    """
+    Simulated pit temperature: heats up quickly and oscillates around the set point.
+    """
+    __slots__ = ()
+
+    def __init__(self, start: float = 20.0, pit: float = 120.0, noise: float = 0.5) -> None:
+        super().__init__(start=start, pit=pit, tau=600.0, stall_temp=None, noise=noise)
+
+    def temperature(self, elapsed: float) -> float:
+        value = super().temperature(elapsed)
+        return round(value + 2.0 * math.sin(elapsed / 300.0), 1)
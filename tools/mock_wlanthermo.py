@@ -0,0 +1,426 @@
+"""
+Mock WLANThermo device server for offline testing and benchmarks.
+Serves /data, /settings, /getpush and /getbluetooth and accepts the write
+endpoints used by the integration. Temperatures follow simulated cook curves.
+Latency, jitter and error rate are configurable, and several devices can be
+started on consecutive ports.
+
+Usage:
+    python tools/mock_wlanthermo.py --channels 12 --latency 0.05 --jitter 0.02
+    python tools/mock_wlanthermo.py --devices 50 --channels 16 --port 8100
+
+Only aiohttp is required, Home Assistant is not imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import secrets
+import time
+
+from aiohttp import BasicAuth, web
+
+from curves import CookCurve, PitCurve
+
+_LOGGER = logging.getLogger("mock_wlanthermo")
+
+# Temperature of a channel without a probe, as sent by the firmware.
+NOT_CONNECTED = 999.0
+SENSOR_TYPES = (
+    "Maverick", "Fantast-Neu", "Fantast", "100K6A1B", "100K", "SMD 100K",
+    "5K3A1B", "Motis", "Selfmade", "ThermoWorks", "PT100", "PT1000",
+    "Inkbird", "Bluetooth", "Custom",
+)
+PIT_TYPES = ["off", "manual", "auto"]
+AKTORS = ["SSR", "FAN", "SERVO", "DAMPER"]
+COLORS = ("#0C4C88", "#22B14C", "#EF562D", "#FFC100", "#A349A4", "#804000", "#5587A2", "#BDB76B")
+
+
+class MockDevice:
+    """
+    State of one simulated device.
+    Args:
+        name: Host name reported by the device.
+        channels: Number of temperature channels.
+        connected: Number of channels with a probe, the others report 999.0.
+        speed: Simulated seconds per real second.
+        pit_temp: Pit temperature the curves heat towards.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        channels: int = 8,
+        connected: int = 2,
+        speed: float = 1.0,
+        pit_temp: float = 120.0,
+    ) -> None:
+        self.name = name
+        self.speed = speed
+        self.started = time.monotonic()
+        # Device clock at start; it runs at the simulated speed like the curves.
+        self.start_time = time.time()
+        self.channels = [
+            {
+                "number": i + 1,
+                "name": f"Kanal {i + 1}",
+                "typ": 0,
+                "temp": NOT_CONNECTED,
+                "min": 10.0,
+                "max": 95.0,
+                "alarm": 0,
+                "color": COLORS[i % len(COLORS)],
+                "fixed": False,
+                "connected": i < connected,
+            }
+            for i in range(channels)
+        ]
+        # The first connected channel measures the pit, the others are meat probes.
+        self.curves: dict[int, CookCurve] = {}
+        for i in range(min(connected, channels)):
+            if i == 0:
+                self.curves[i] = PitCurve(pit=pit_temp)
+            else:
+                self.curves[i] = CookCurve(
+                    pit=pit_temp,
+                    tau=random.uniform(5400.0, 9000.0),
+                    stall_duration=random.uniform(3600.0, 7200.0),
+                )
+        self.pitmasters = [
+            {
+                "id": 0,
+                "channel": 1,
+                "pid": 0,
+                "value": 0,
+                "set": pit_temp,
+                "typ": "off",
+                "set_color": "#ff0000",
+                "value_color": "#000000",
+            }
+        ]
+        self.pid = [
+            {
+                "name": f"{aktor} PID",
+                "id": i,
+                "aktor": i,
+                "Kp": 3.8,
+                "Ki": 0.01,
+                "Kd": 128,
+                "DCmmin": 0,
+                "DCmmax": 100,
+                "opl": 0,
+                "SPmin": 0,
+                "SPmax": 100,
+                "link": 0,
+                "tune": 0,
+                "jp": 100,
+            }
+            for i, aktor in enumerate(AKTORS[:3])
+        ]
+        self.iot = {
+            "PMQhost": "192.168.0.10",
+            "PMQport": 1883,
+            "PMQuser": "",
+            "PMQpass": "",
+            "PMQqos": 0,
+            "PMQon": False,
+            "PMQint": 30,
+            "CLon": False,
+            "CLtoken": secrets.token_hex(10),
+            "CLint": 30,
+            "CLurl": "cloud.wlanthermo.de/index.html",
+        }
+        self.push = {
+            "telegram": {"enabled": 0, "token": "", "chat_id": ""},
+            "pushover": {"enabled": 0, "token": "", "user_key": "", "priority": 0},
+            "app": {"enabled": 0, "max_devices": 3, "devices": []},
+        }
+        self.bluetooth = {
+            "enabled": 1,
+            "devices": [
+                {"name": "Mock BLE", "address": "00:11:22:33:44:55", "count": 2, "selected": 1},
+            ],
+        }
+
+    def elapsed(self) -> float:
+        return (time.monotonic() - self.started) * self.speed
+
+    def device_time(self) -> int:
+        """
+        Return the device time, which the integration uses as sample time.
+        """
+        return int(self.start_time + self.elapsed())
+
+    def data(self) -> dict:
+        """
+        Return the /data payload with the current temperatures.
+        """
+        elapsed = self.elapsed()
+        for index, channel in enumerate(self.channels):
+            curve = self.curves.get(index)
+            channel["temp"] = curve.temperature(elapsed) if curve else NOT_CONNECTED
+        for pitmaster in self.pitmasters:
+            pitmaster["value"] = 0 if pitmaster["typ"] == "off" else random.randint(20, 80)
+        return {
+            "system": {
+                "time": self.device_time(),
+                "unit": "C",
+                "soc": 80,
+                "charge": False,
+                "rssi": random.randint(-75, -50),
+                "online": 0,
+            },
+            "channel": self.channels,
+            "pitmaster": {"type": PIT_TYPES, "pm": self.pitmasters},
+        }
+
+    def settings(self) -> dict:
+        """
+        Return the /settings payload.
+        """
+        return {
+            "device": {
+                "device": "nano",
+                "serial": self.name,
+                "cpu": "esp32",
+                "flash_size": 16777216,
+                "hw_version": "v3",
+                "sw_version": "v1.2.0",
+                "api_version": "2",
+                "language": "de",
+            },
+            "system": {
+                "time": str(self.device_time()),
+                "unit": "C",
+                "ap": f"{self.name}-AP",
+                "host": self.name,
+                "language": "de",
+                "version": "v1.2.0",
+                "getupdate": "false",
+                "autoupd": True,
+                "prerelease": False,
+                "hwversion": "V3",
+            },
+            "hardware": ["V3"],
+            "api": {"version": "2"},
+            "sensors": [
+                {"type": i, "name": name, "fixed": False} for i, name in enumerate(SENSOR_TYPES)
+            ],
+            "features": {"bluetooth": True, "pitmaster": True},
+            "pid": self.pid,
+            "aktor": AKTORS,
+            "display": {"updname": "", "orientation": 0},
+            "iot": self.iot,
+            "notes": {
+                "fcm": [],
+                "ext": {
+                    "on": 0,
+                    "token": "",
+                    "id": "",
+                    "repeat": 1,
+                    "service": 0,
+                    "services": ["telegram", "pushover"],
+                },
+            },
+        }
+
+    def set_channels(self, payload: dict | list) -> bool:
+        for item in payload if isinstance(payload, list) else [payload]:
+            number = item.get("number")
+            if not isinstance(number, int) or not 1 <= number <= len(self.channels):
+                return False
+            channel = self.channels[number - 1]
+            for key in ("name", "typ", "min", "max", "alarm", "color"):
+                if key in item:
+                    channel[key] = item[key]
+        return True
+
+    def set_pitmaster(self, payload: dict | list) -> bool:
+        for item in payload if isinstance(payload, list) else [payload]:
+            pm_id = item.get("id")
+            if not isinstance(pm_id, int) or not 0 <= pm_id < len(self.pitmasters):
+                return False
+            pitmaster = self.pitmasters[pm_id]
+            for key in ("channel", "pid", "value", "set", "typ"):
+                if key in item:
+                    pitmaster[key] = item[key]
+        return True
+
+    def set_pid(self, payload: dict | list) -> bool:
+        for item in payload if isinstance(payload, list) else [payload]:
+            pid_id = item.get("id")
+            if not isinstance(pid_id, int) or not 0 <= pid_id < len(self.pid):
+                return False
+            self.pid[pid_id].update(item)
+        return True
+
+    def set_push(self, payload: dict) -> bool:
+        for service in ("telegram", "pushover", "app"):
+            if isinstance(payload.get(service), dict):
+                self.push[service].update(payload[service])
+        return True
+
+    def set_bluetooth(self, payload: dict) -> bool:
+        if "enabled" in payload:
+            self.bluetooth["enabled"] = int(bool(payload["enabled"]))
+        if isinstance(payload.get("devices"), list):
+            self.bluetooth["devices"] = payload["devices"]
+        return True
+
+    def set_iot(self, payload: dict) -> bool:
+        self.iot.update({key: value for key, value in payload.items() if key in self.iot})
+        return True
+
+    def new_token(self) -> str:
+        self.iot["CLtoken"] = secrets.token_hex(10)
+        return self.iot["CLtoken"]
+
+
+def create_app(
+    device: MockDevice,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    error_rate: float = 0.0,
+    auth: BasicAuth | None = None,
+) -> web.Application:
+    """
+    Create the web application of one simulated device.
+    Args:
+        device: Device state to serve.
+        latency: Base response delay in seconds.
+        jitter: Maximum random delay added to the base delay in seconds.
+        error_rate: Probability of answering a request with HTTP 500.
+        auth: Required basic auth credentials, or None.
+    Returns:
+        aiohttp application.
+    """
+    stats = {"requests": 0, "errors": 0}
+
+    @web.middleware
+    async def simulate(request: web.Request, handler):
+        stats["requests"] += 1
+        if auth is not None:
+            header = request.headers.get("Authorization", "")
+            try:
+                if BasicAuth.decode(header) != auth:
+                    raise ValueError
+            except ValueError:
+                return web.Response(status=401, headers={"WWW-Authenticate": "Basic"})
+        delay = latency + random.uniform(0.0, jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if error_rate and random.random() < error_rate:
+            stats["errors"] += 1
+            return web.Response(status=500, text="simulated error")
+        return await handler(request)
+
+    def json_response(payload) -> web.Response:
+        return web.Response(text=json.dumps(payload, separators=(",", ":")), content_type="application/json")
+
+    def bool_response(ok: bool) -> web.Response:
+        return web.Response(text="true" if ok else "false", status=200 if ok else 400)
+
+    def write_handler(apply):
+        async def handler(request: web.Request) -> web.Response:
+            try:
+                payload = await request.json()
+            except ValueError:
+                return bool_response(False)
+            return bool_response(apply(payload))
+        return handler
+
+    async def new_token(request: web.Request) -> web.Response:
+        return web.Response(text=device.new_token())
+
+    app = web.Application(middlewares=[simulate])
+    app["device"] = device
+    app["stats"] = stats
+    app.router.add_get("/data", lambda request: json_response(device.data()))
+    app.router.add_get("/settings", lambda request: json_response(device.settings()))
+    app.router.add_get("/getpush", lambda request: json_response(device.push))
+    app.router.add_get("/getbluetooth", lambda request: json_response(device.bluetooth))
+    for path, apply in (
+        ("/setchannels", device.set_channels),
+        ("/setpitmaster", device.set_pitmaster),
+        ("/setpid", device.set_pid),
+        ("/setpush", device.set_push),
+        ("/setbluetooth", device.set_bluetooth),
+        ("/setIoT", device.set_iot),
+    ):
+        app.router.add_post(path, write_handler(apply))
+        app.router.add_put(path, write_handler(apply))
+    app.router.add_post("/newtoken", new_token)
+    return app
+
+
+async def run(args: argparse.Namespace) -> None:
+    """
+    Start the simulated devices and serve until cancelled.
+    """
+    auth = BasicAuth(args.username, args.password) if args.username else None
+    runners = []
+    for index in range(args.devices):
+        device = MockDevice(
+            name=f"MOCK-{index + 1}",
+            channels=args.channels,
+            connected=args.connected,
+            speed=args.speed,
+            pit_temp=args.pit_temp,
+        )
+        app = create_app(device, args.latency, args.jitter, args.error_rate, auth)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, args.host, args.port + index).start()
+        runners.append(runner)
+    _LOGGER.info(
+        "Serving %s mock device(s) with %s channels on %s:%s-%s",
+        args.devices,
+        args.channels,
+        args.host,
+        args.port,
+        args.port + args.devices - 1,
+    )
+    try:
+        while True:
+            await asyncio.sleep(args.stats_interval or 3600)
+            if args.stats_interval:
+                requests = sum(r.app["stats"]["requests"] for r in runners)
+                errors = sum(r.app["stats"]["errors"] for r in runners)
+                _LOGGER.info("%s requests, %s simulated errors", requests, errors)
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="port of the first device")
+    parser.add_argument("--devices", type=int, default=1, help="number of devices on consecutive ports")
+    parser.add_argument("--channels", type=int, default=8, help="temperature channels per device")
+    parser.add_argument("--connected", type=int, default=2, help="channels with a probe")
+    parser.add_argument("--latency", type=float, default=0.0, help="base response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="maximum random extra delay in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="probability of an HTTP 500 response")
+    parser.add_argument("--speed", type=float, default=1.0, help="simulated seconds per real second")
+    parser.add_argument("--pit-temp", type=float, default=120.0, help="pit temperature of the cook curves")
+    parser.add_argument("--seed", type=int, help="random seed for reproducible runs")
+    parser.add_argument("--username", help="require basic auth with this user name")
+    parser.add_argument("--password", default="", help="basic auth password")
+    parser.add_argument("--stats-interval", type=float, default=0.0, help="log request counts every N seconds")
+    args = parser.parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()